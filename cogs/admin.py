@@ -4,78 +4,149 @@ from discord import app_commands
 import psutil
 import asyncio
 import logging
-import os
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+import re
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, Tuple
 import traceback
 
-from config import COLORS, EMOJIS, get_server_config, update_server_config, user_has_permission, is_module_enabled
+from config import COLORS, EMOJIS, get_server_config_async, update_server_config, user_has_permission, is_module_enabled, flush_all_configs, invalidate_user_permissions
 from utils.helpers import create_embed, format_duration
-from utils.database import get_user_data, update_user_data, get_guild_data, update_guild_data
+from utils.database import get_user_data, update_user_data, get_guild_data, update_guild_data, get_rpg_read_cache_stats
 
 logger = logging.getLogger(__name__)
 
+# Matches a channel mention like <#123456789> and captures the ID
+_CHANNEL_MENTION_RE = re.compile(r'<#(\d+)>')
+
+# Interpreter version shown in the stats embed
+_PY_VERSION = sys.version.split()[0]
+
+# How long sampled system stats are reused by the stats embed (in seconds)
+SYS_STATS_TTL = 5
+
+# Last system stats sample: (sampled_at, (cpu_percent, memory_percent, disk_percent))
+_sys_stats_cache: Tuple[float, Optional[Tuple[float, float, float]]] = (0.0, None)
+
+def _collect_sys_stats() -> Tuple[float, float, float]:
+    """Sample CPU, memory and disk usage (blocking, run in a thread)."""
+    cpu_percent = psutil.cpu_percent()
+    memory = psutil.virtual_memory()
+    disk = psutil.disk_usage('/')
+    return cpu_percent, memory.percent, disk.percent
+
+async def get_sys_stats() -> Tuple[float, float, float]:
+    """Get system stats without blocking the event loop, reusing recent samples."""
+    global _sys_stats_cache
+
+    sampled_at, stats = _sys_stats_cache
+    if stats is not None and time.monotonic() - sampled_at < SYS_STATS_TTL:
+        return stats
+
+    stats = await asyncio.to_thread(_collect_sys_stats)
+    _sys_stats_cache = (time.monotonic(), stats)
+    return stats
+
+# How long user/message cache counts are reused by the stats embed (in seconds)
+COUNT_CACHE_TTL = 30
+
+# Last formatted uptime: (whole_seconds, formatted_string)
+_uptime_cache: Tuple[int, str] = (-1, "")
+
+def _format_uptime(seconds: int) -> str:
+    """Format uptime, reusing the previous string within the same second."""
+    global _uptime_cache
+
+    if seconds != _uptime_cache[0]:
+        _uptime_cache = (seconds, format_duration(seconds))
+    return _uptime_cache[1]
+
+# Prebuilt config panel embeds, copied per response: key -> embed
+_RESULT_EMBEDS: Dict[str, discord.Embed] = {
+    'module_settings': discord.Embed(title="🔧 Module Configuration", description="Select which modules to enable or disable:", color=COLORS['info']),
+    'ai_settings': discord.Embed(title="🤖 AI Configuration", description="Configure AI chatbot settings:", color=COLORS['info']),
+    'mod_settings': discord.Embed(title="🛡️ Moderation Configuration", description="Configure moderation and auto-moderation settings:", color=COLORS['error']),
+    'prefix_changed': discord.Embed(title="✅ Prefix Changed", color=COLORS['success']),
+    'ai_channels_set': discord.Embed(title="✅ AI Channels Set", color=COLORS['success']),
+    'ai_channels_cleared': discord.Embed(title="✅ AI Channels Cleared", description="AI will now respond in all channels (when mentioned)", color=COLORS['success']),
+    'mod_log_set': discord.Embed(title="✅ Mod Log Set", color=COLORS['success']),
+    'mod_log_cleared': discord.Embed(title="✅ Mod Log Cleared", description="Moderation log channel has been cleared", color=COLORS['success']),
+    'invalid_channel': discord.Embed(title="❌ Invalid Channel", description="Please mention a valid channel (e.g., #mod-logs)", color=COLORS['error']),
+}
+
+def _result_embed(key: str, description: Optional[str] = None) -> discord.Embed:
+    """Copy a prebuilt config panel embed, optionally filling in its description."""
+    embed = _RESULT_EMBEDS[key].copy()
+    if description is not None:
+        embed.description = description
+    embed.timestamp = datetime.now(timezone.utc)
+    return embed
+
+def _build_config_embed(config: Dict[str, Any]) -> discord.Embed:
+    """Create the server configuration panel embed."""
+    return create_embed(
+        f"{EMOJIS['admin']} Server Configuration",
+        f"**Current Settings:**\n"
+        f"• Prefix: `{config.get('prefix', '$')}`\n"
+        f"• Currency: {config.get('currency_name', 'coins')}\n"
+        f"• AI Channels: {len(config.get('ai_channels', []))} configured\n"
+        f"• Auto-Moderation: {'✅' if config.get('auto_moderation', {}).get('enabled', True) else '❌'}\n\n"
+        f"Use the buttons below to configure your server:",
+        COLORS['info']
+    )
+
 class ConfigView(discord.ui.View):
-    """Interactive configuration view for server settings."""
+    """Interactive configuration view for server settings.
     
-    def __init__(self, guild_id: int):
-        super().__init__(timeout=300)
-        self.guild_id = guild_id
-        self.config = get_server_config(guild_id)
+    Persistent and shared by every guild: the guild is resolved from the
+    interaction, and the sub-views are created once alongside it.
+    """
+    
+    def __init__(self):
+        super().__init__(timeout=None)
+        self.module_view = ModuleConfigView()
+        self.ai_view = AIConfigView()
+        self.mod_view = ModerationConfigView()
+        
+    @property
+    def persistent_views(self):
+        """This view and the sub-views it opens, for bot.add_view."""
+        return (self, self.module_view, self.ai_view, self.mod_view)
+        
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Only let admins use the configuration buttons."""
+        if not user_has_permission(interaction.user, 'admin'):
+            await interaction.response.send_message("❌ You need admin permissions!", ephemeral=True)
+            return False
+        return True
         
-    @discord.ui.button(label="📝 Change Prefix", style=discord.ButtonStyle.primary)
+    @discord.ui.button(label="📝 Change Prefix", style=discord.ButtonStyle.primary, custom_id="admin:change_prefix")
     async def change_prefix(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Change server prefix."""
-        if not user_has_permission(interaction.user, 'admin'):
-            await interaction.response.send_message("❌ You need admin permissions!", ephemeral=True)
-            return
-            
-        modal = PrefixModal(self.guild_id, self.config)
+        config = await get_server_config_async(interaction.guild_id)
+        modal = PrefixModal(interaction.guild_id, config)
         await interaction.response.send_modal(modal)
         
-    @discord.ui.button(label="🔧 Module Settings", style=discord.ButtonStyle.secondary)
+    @discord.ui.button(label="🔧 Module Settings", style=discord.ButtonStyle.secondary, custom_id="admin:module_settings")
     async def module_settings(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Configure modules."""
-        if not user_has_permission(interaction.user, 'admin'):
-            await interaction.response.send_message("❌ You need admin permissions!", ephemeral=True)
-            return
-            
-        view = ModuleConfigView(self.guild_id)
-        embed = create_embed(
-            "🔧 Module Configuration",
-            "Select which modules to enable or disable:",
-            COLORS['info']
-        )
+        view = self.module_view
+        embed = _result_embed('module_settings')
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
         
-    @discord.ui.button(label="🤖 AI Settings", style=discord.ButtonStyle.success)
+    @discord.ui.button(label="🤖 AI Settings", style=discord.ButtonStyle.success, custom_id="admin:ai_settings")
     async def ai_settings(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Configure AI settings."""
-        if not user_has_permission(interaction.user, 'admin'):
-            await interaction.response.send_message("❌ You need admin permissions!", ephemeral=True)
-            return
-            
-        view = AIConfigView(self.guild_id)
-        embed = create_embed(
-            "🤖 AI Configuration",
-            "Configure AI chatbot settings:",
-            COLORS['info']
-        )
+        view = self.ai_view
+        embed = _result_embed('ai_settings')
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
         
-    @discord.ui.button(label="🛡️ Moderation Settings", style=discord.ButtonStyle.danger)
+    @discord.ui.button(label="🛡️ Moderation Settings", style=discord.ButtonStyle.danger, custom_id="admin:mod_settings")
     async def mod_settings(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Configure moderation settings."""
-        if not user_has_permission(interaction.user, 'admin'):
-            await interaction.response.send_message("❌ You need admin permissions!", ephemeral=True)
-            return
-            
-        view = ModerationConfigView(self.guild_id)
-        embed = create_embed(
-            "🛡️ Moderation Configuration",
-            "Configure moderation and auto-moderation settings:",
-            COLORS['error']
-        )
+        view = self.mod_view
+        embed = _result_embed('mod_settings')
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
 
 class PrefixModal(discord.ui.Modal):
@@ -84,7 +155,6 @@ class PrefixModal(discord.ui.Modal):
     def __init__(self, guild_id: int, config: Dict[str, Any]):
         super().__init__(title="Change Server Prefix")
         self.guild_id = guild_id
-        self.config = config
         
         self.prefix_input = discord.ui.TextInput(
             label="New Prefix",
@@ -102,72 +172,60 @@ class PrefixModal(discord.ui.Modal):
             await interaction.response.send_message("❌ Prefix cannot be empty!", ephemeral=True)
             return
             
-        self.config['prefix'] = new_prefix
-        update_server_config(self.guild_id, self.config)
+        config = await get_server_config_async(self.guild_id)
+        config['prefix'] = new_prefix
         
-        embed = create_embed(
-            "✅ Prefix Changed",
-            f"Server prefix changed to: `{new_prefix}`",
-            COLORS['success']
-        )
+        embed = _result_embed('prefix_changed', f"Server prefix changed to: `{new_prefix}`")
         await interaction.response.send_message(embed=embed, ephemeral=True)
+        update_server_config(self.guild_id, config)
 
 class ModuleConfigView(discord.ui.View):
     """View for configuring modules."""
     
-    def __init__(self, guild_id: int):
-        super().__init__(timeout=300)
-        self.guild_id = guild_id
-        self.config = get_server_config(guild_id)
+    def __init__(self):
+        super().__init__(timeout=None)
         
-    @discord.ui.button(label="🎮 RPG Games", style=discord.ButtonStyle.primary)
+    async def _toggle_module(self, interaction: discord.Interaction, key: str, label: str):
+        """Flip a module's enabled flag, persist it and report the new state."""
+        config = await get_server_config_async(interaction.guild_id)
+        enabled_modules = config['enabled_modules']
+        new = not enabled_modules[key]
+        enabled_modules[key] = new
+        
+        await interaction.response.send_message(f"✅ {label} {'enabled' if new else 'disabled'}!", ephemeral=True)
+        update_server_config(interaction.guild_id, config)
+        
+    @discord.ui.button(label="🎮 RPG Games", style=discord.ButtonStyle.primary, custom_id="admin:toggle_rpg")
     async def toggle_rpg(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Toggle RPG module."""
-        self.config['enabled_modules']['rpg'] = not self.config['enabled_modules']['rpg']
-        update_server_config(self.guild_id, self.config)
+        await self._toggle_module(interaction, 'rpg', "RPG module")
         
-        status = "enabled" if self.config['enabled_modules']['rpg'] else "disabled"
-        await interaction.response.send_message(f"✅ RPG module {status}!", ephemeral=True)
-        
-    @discord.ui.button(label="💰 Economy", style=discord.ButtonStyle.success)
+    @discord.ui.button(label="💰 Economy", style=discord.ButtonStyle.success, custom_id="admin:toggle_economy")
     async def toggle_economy(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Toggle economy module."""
-        self.config['enabled_modules']['economy'] = not self.config['enabled_modules']['economy']
-        update_server_config(self.guild_id, self.config)
-        
-        status = "enabled" if self.config['enabled_modules']['economy'] else "disabled"
-        await interaction.response.send_message(f"✅ Economy module {status}!", ephemeral=True)
+        await self._toggle_module(interaction, 'economy', "Economy module")
         
-    @discord.ui.button(label="🤖 AI Chatbot", style=discord.ButtonStyle.secondary)
+    @discord.ui.button(label="🤖 AI Chatbot", style=discord.ButtonStyle.secondary, custom_id="admin:toggle_ai")
     async def toggle_ai(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Toggle AI chatbot module."""
-        self.config['enabled_modules']['ai_chatbot'] = not self.config['enabled_modules']['ai_chatbot']
-        update_server_config(self.guild_id, self.config)
+        await self._toggle_module(interaction, 'ai_chatbot', "AI Chatbot module")
         
-        status = "enabled" if self.config['enabled_modules']['ai_chatbot'] else "disabled"
-        await interaction.response.send_message(f"✅ AI Chatbot module {status}!", ephemeral=True)
-        
-    @discord.ui.button(label="🔨 Moderation", style=discord.ButtonStyle.danger)
+    @discord.ui.button(label="🔨 Moderation", style=discord.ButtonStyle.danger, custom_id="admin:toggle_moderation")
     async def toggle_moderation(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Toggle moderation module."""
-        self.config['enabled_modules']['moderation'] = not self.config['enabled_modules']['moderation']
-        update_server_config(self.guild_id, self.config)
-        
-        status = "enabled" if self.config['enabled_modules']['moderation'] else "disabled"
-        await interaction.response.send_message(f"✅ Moderation module {status}!", ephemeral=True)
+        await self._toggle_module(interaction, 'moderation', "Moderation module")
 
 class AIConfigView(discord.ui.View):
     """View for configuring AI settings."""
     
-    def __init__(self, guild_id: int):
-        super().__init__(timeout=300)
-        self.guild_id = guild_id
-        self.config = get_server_config(guild_id)
+    def __init__(self):
+        super().__init__(timeout=None)
         
-    @discord.ui.button(label="📝 Set AI Channels", style=discord.ButtonStyle.primary)
+    @discord.ui.button(label="📝 Set AI Channels", style=discord.ButtonStyle.primary, custom_id="admin:set_ai_channels")
     async def set_ai_channels(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Set AI channels."""
-        modal = AIChannelModal(self.guild_id, self.config)
+        config = await get_server_config_async(interaction.guild_id)
+        modal = AIChannelModal(interaction.guild_id, config)
         await interaction.response.send_modal(modal)
 
 class AIChannelModal(discord.ui.Modal):
@@ -176,7 +234,6 @@ class AIChannelModal(discord.ui.Modal):
     def __init__(self, guild_id: int, config: Dict[str, Any]):
         super().__init__(title="Set AI Channels")
         self.guild_id = guild_id
-        self.config = config
         
         current_channels = ", ".join([f"<#{ch}>" for ch in config.get('ai_channels', [])])
         
@@ -194,49 +251,41 @@ class AIChannelModal(discord.ui.Modal):
         channels_text = self.channels_input.value.strip()
         
         # Extract channel IDs from mentions
-        import re
-        channel_ids = re.findall(r'<#(\d+)>', channels_text)
+        channel_ids = list(map(int, _CHANNEL_MENTION_RE.findall(channels_text)))
         
-        self.config['ai_channels'] = [int(ch) for ch in channel_ids]
-        update_server_config(self.guild_id, self.config)
+        config = await get_server_config_async(self.guild_id)
+        config['ai_channels'] = channel_ids
         
         if channel_ids:
             channel_mentions = [f"<#{ch}>" for ch in channel_ids]
-            embed = create_embed(
-                "✅ AI Channels Set",
-                f"AI will now respond in: {', '.join(channel_mentions)}",
-                COLORS['success']
-            )
+            embed = _result_embed('ai_channels_set', f"AI will now respond in: {', '.join(channel_mentions)}")
         else:
-            embed = create_embed(
-                "✅ AI Channels Cleared",
-                "AI will now respond in all channels (when mentioned)",
-                COLORS['success']
-            )
+            embed = _result_embed('ai_channels_cleared')
         
         await interaction.response.send_message(embed=embed, ephemeral=True)
+        update_server_config(self.guild_id, config)
 
 class ModerationConfigView(discord.ui.View):
     """View for configuring moderation settings."""
     
-    def __init__(self, guild_id: int):
-        super().__init__(timeout=300)
-        self.guild_id = guild_id
-        self.config = get_server_config(guild_id)
+    def __init__(self):
+        super().__init__(timeout=None)
         
-    @discord.ui.button(label="🛡️ Toggle Auto-Mod", style=discord.ButtonStyle.primary)
+    @discord.ui.button(label="🛡️ Toggle Auto-Mod", style=discord.ButtonStyle.primary, custom_id="admin:toggle_automod")
     async def toggle_automod(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Toggle auto-moderation."""
-        self.config['auto_moderation']['enabled'] = not self.config['auto_moderation']['enabled']
-        update_server_config(self.guild_id, self.config)
+        config = await get_server_config_async(interaction.guild_id)
+        config['auto_moderation']['enabled'] = not config['auto_moderation']['enabled']
         
-        status = "enabled" if self.config['auto_moderation']['enabled'] else "disabled"
+        status = "enabled" if config['auto_moderation']['enabled'] else "disabled"
         await interaction.response.send_message(f"✅ Auto-moderation {status}!", ephemeral=True)
+        update_server_config(interaction.guild_id, config)
         
-    @discord.ui.button(label="📝 Set Mod Log", style=discord.ButtonStyle.secondary)
+    @discord.ui.button(label="📝 Set Mod Log", style=discord.ButtonStyle.secondary, custom_id="admin:set_mod_log")
     async def set_mod_log(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Set moderation log channel."""
-        modal = ModLogModal(self.guild_id, self.config)
+        config = await get_server_config_async(interaction.guild_id)
+        modal = ModLogModal(interaction.guild_id, config)
         await interaction.response.send_modal(modal)
 
 class ModLogModal(discord.ui.Modal):
@@ -245,7 +294,6 @@ class ModLogModal(discord.ui.Modal):
     def __init__(self, guild_id: int, config: Dict[str, Any]):
         super().__init__(title="Set Moderation Log Channel")
         self.guild_id = guild_id
-        self.config = config
         
         current_channel = f"<#{config.get('mod_log_channel')}>" if config.get('mod_log_channel') else ""
         
@@ -260,45 +308,67 @@ class ModLogModal(discord.ui.Modal):
     async def on_submit(self, interaction: discord.Interaction):
         """Handle mod log channel setting."""
         channel_text = self.channel_input.value.strip()
+        config = await get_server_config_async(self.guild_id)
+        changed = True
         
         if not channel_text:
-            self.config['mod_log_channel'] = None
-            update_server_config(self.guild_id, self.config)
+            config['mod_log_channel'] = None
             
-            embed = create_embed(
-                "✅ Mod Log Cleared",
-                "Moderation log channel has been cleared",
-                COLORS['success']
-            )
+            embed = _result_embed('mod_log_cleared')
         else:
             # Extract channel ID from mention
-            import re
-            channel_match = re.search(r'<#(\d+)>', channel_text)
+            channel_match = _CHANNEL_MENTION_RE.search(channel_text)
             
             if channel_match:
                 channel_id = int(channel_match.group(1))
-                self.config['mod_log_channel'] = channel_id
-                update_server_config(self.guild_id, self.config)
+                config['mod_log_channel'] = channel_id
                 
-                embed = create_embed(
-                    "✅ Mod Log Set",
-                    f"Moderation logs will be sent to <#{channel_id}>",
-                    COLORS['success']
-                )
+                embed = _result_embed('mod_log_set', f"Moderation logs will be sent to <#{channel_id}>")
             else:
-                embed = create_embed(
-                    "❌ Invalid Channel",
-                    "Please mention a valid channel (e.g., #mod-logs)",
-                    COLORS['error']
-                )
+                embed = _result_embed('invalid_channel')
+                changed = False
         
+        # Acknowledge first, the (debounced) config write can follow
         await interaction.response.send_message(embed=embed, ephemeral=True)
+        if changed:
+            update_server_config(self.guild_id, config)
 
 class AdminCog(commands.Cog):
     """Admin commands and server management."""
     
     def __init__(self, bot):
         self.bot = bot
+        self._counts_cache: Optional[Tuple[float, int, int]] = None
+        self.config_view = ConfigView()
+        self._stats_template = self._build_stats_template()
+        
+    @staticmethod
+    def _build_stats_template() -> discord.Embed:
+        """Build the static scaffolding of the stats embed, copied per call."""
+        embed = discord.Embed(
+            title=f"{EMOJIS['admin']} Bot Statistics",
+            color=COLORS['info']
+        )
+        for name in ("🤖 Bot Info", "🖥️ System Info", "📊 Discord Stats"):
+            embed.add_field(name=name, value="\u200b", inline=True)
+        return embed
+        
+    def get_cache_counts(self) -> Tuple[int, int]:
+        """Get user and cached message counts, recomputed at most every COUNT_CACHE_TTL."""
+        now = time.monotonic()
+        if self._counts_cache is None or now - self._counts_cache[0] >= COUNT_CACHE_TTL:
+            self._counts_cache = (now, len(self.bot.users), len(self.bot.cached_messages))
+        return self._counts_cache[1], self._counts_cache[2]
+        
+    async def cog_unload(self):
+        """Persist any debounced config changes before the cog goes away."""
+        await flush_all_configs()
+        
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        """Forget cached permission levels when a member's roles change."""
+        if before.roles != after.roles:
+            invalidate_user_permissions(after.guild.id, after.id)
         
     @commands.command(name='config', help='Interactive server configuration')
     @commands.has_permissions(administrator=True)
@@ -307,19 +377,10 @@ class AdminCog(commands.Cog):
         if not is_module_enabled("admin", ctx.guild.id):
             return
             
-        view = ConfigView(ctx.guild.id)
-        config = get_server_config(ctx.guild.id)
-        
-        embed = create_embed(
-            f"{EMOJIS['admin']} Server Configuration",
-            f"**Current Settings:**\n"
-            f"• Prefix: `{config.get('prefix', '$')}`\n"
-            f"• Currency: {config.get('currency_name', 'coins')}\n"
-            f"• AI Channels: {len(config.get('ai_channels', []))} configured\n"
-            f"• Auto-Moderation: {'✅' if config.get('auto_moderation', {}).get('enabled', True) else '❌'}\n\n"
-            f"Use the buttons below to configure your server:",
-            COLORS['info']
-        )
+        config = await get_server_config_async(ctx.guild.id)
+        view = self.config_view
+        
+        embed = _build_config_embed(config)
         
         await ctx.send(embed=embed, view=view)
         
@@ -327,27 +388,19 @@ class AdminCog(commands.Cog):
     @app_commands.describe()
     async def config_slash(self, interaction: discord.Interaction):
         """Interactive server configuration (slash command)."""
-        if not user_has_permission(interaction.user, 'admin'):
-            await interaction.response.send_message("❌ You need admin permissions!", ephemeral=True)
-            return
-            
+        # Cheapest rejection first: the module flag is a lookup in the cached config
         if not is_module_enabled("admin", interaction.guild.id):
             await interaction.response.send_message("❌ Admin module is disabled!", ephemeral=True)
             return
             
-        view = ConfigView(interaction.guild.id)
-        config = get_server_config(interaction.guild.id)
-        
-        embed = create_embed(
-            f"{EMOJIS['admin']} Server Configuration",
-            f"**Current Settings:**\n"
-            f"• Prefix: `{config.get('prefix', '$')}`\n"
-            f"• Currency: {config.get('currency_name', 'coins')}\n"
-            f"• AI Channels: {len(config.get('ai_channels', []))} configured\n"
-            f"• Auto-Moderation: {'✅' if config.get('auto_moderation', {}).get('enabled', True) else '❌'}\n\n"
-            f"Use the buttons below to configure your server:",
-            COLORS['info']
-        )
+        if not user_has_permission(interaction.user, 'admin'):
+            await interaction.response.send_message("❌ You need admin permissions!", ephemeral=True)
+            return
+            
+        config = await get_server_config_async(interaction.guild.id)
+        view = self.config_view
+        
+        embed = _build_config_embed(config)
         
         await interaction.response.send_message(embed=embed, view=view)
         
@@ -374,51 +427,60 @@ class AdminCog(commands.Cog):
         """Create bot statistics embed."""
         try:
             # Get system stats
-            cpu_percent = psutil.cpu_percent()
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            cpu_percent, memory_percent, disk_percent = await get_sys_stats()
             
             # Calculate uptime
             uptime = datetime.now() - self.bot.start_time
-            uptime_str = format_duration(uptime.total_seconds())
+            uptime_str = _format_uptime(int(uptime.total_seconds()))
+            user_count, cached_message_count = self.get_cache_counts()
+            profile_cache = get_rpg_read_cache_stats()
+            profile_reads = profile_cache['hits'] + profile_cache['misses']
+            profile_hit_rate = profile_cache['hits'] * 100 // profile_reads if profile_reads else 0
             
-            embed = discord.Embed(
-                title=f"{EMOJIS['admin']} Bot Statistics",
-                color=COLORS['info']
-            )
+            embed = self._stats_template.copy()
             
             # Bot Stats
-            embed.add_field(
+            embed.set_field_at(
+                0,
                 name="🤖 Bot Info",
-                value=f"**Servers:** {len(self.bot.guilds)}\n"
-                      f"**Users:** {len(self.bot.users)}\n"
-                      f"**Uptime:** {uptime_str}\n"
-                      f"**Commands:** {len(self.bot.commands)}",
+                value="\n".join((
+                    f"**Servers:** {len(self.bot.guilds)}",
+                    f"**Users:** {user_count}",
+                    f"**Uptime:** {uptime_str}",
+                    f"**Commands:** {len(self.bot.commands)}"
+                )),
                 inline=True
             )
             
             # System Stats
-            embed.add_field(
+            embed.set_field_at(
+                1,
                 name="🖥️ System Info",
-                value=f"**CPU:** {cpu_percent}%\n"
-                      f"**Memory:** {memory.percent}%\n"
-                      f"**Disk:** {disk.percent}%\n"
-                      f"**Python:** {os.sys.version.split()[0]}",
+                value="\n".join((
+                    f"**CPU:** {cpu_percent}%",
+                    f"**Memory:** {memory_percent}%",
+                    f"**Disk:** {disk_percent}%",
+                    f"**Python:** {_PY_VERSION}",
+                    f"**Profile Cache:** {profile_hit_rate}% hits ({profile_cache['size']} cached)"
+                )),
                 inline=True
             )
             
             # Discord Stats
-            embed.add_field(
+            embed.set_field_at(
+                2,
                 name="📊 Discord Stats",
-                value=f"**Latency:** {round(self.bot.latency * 1000)}ms\n"
-                      f"**Shards:** {self.bot.shard_count or 1}\n"
-                      f"**Cached Messages:** {len(self.bot.cached_messages)}\n"
-                      f"**Voice Clients:** {len(self.bot.voice_clients)}",
+                value="\n".join((
+                    f"**Latency:** {round(self.bot.latency * 1000)}ms",
+                    f"**Shards:** {self.bot.shard_count or 1}",
+                    f"**Cached Messages:** {cached_message_count}",
+                    f"**Voice Clients:** {len(self.bot.voice_clients)}"
+                )),
                 inline=True
             )
             
             embed.set_footer(text=f"Bot ID: {self.bot.user.id}")
-            embed.timestamp = datetime.now()
+            embed.timestamp = datetime.now(timezone.utc)
             
             return embed
         except Exception as e:
@@ -434,7 +496,8 @@ class AdminCog(commands.Cog):
             return
             
         try:
-            await self.bot.reload_extension(cog)
+            async with ctx.typing():
+                await self.bot.reload_extension(cog)
             await ctx.send(f"✅ Reloaded cog: `{cog}`")
         except Exception as e:
             await ctx.send(f"❌ Failed to reload cog `{cog}`: {e}")
@@ -447,18 +510,22 @@ class AdminCog(commands.Cog):
             await interaction.response.send_message("❌ Owner only command!", ephemeral=True)
             return
             
+        # Reloading can outlast the 3 second interaction window, so acknowledge first
+        await interaction.response.defer(ephemeral=True)
+        
         try:
             await self.bot.reload_extension(cog)
-            await interaction.response.send_message(f"✅ Reloaded cog: `{cog}`", ephemeral=True)
+            await interaction.followup.send(f"✅ Reloaded cog: `{cog}`", ephemeral=True)
         except Exception as e:
-            await interaction.response.send_message(f"❌ Failed to reload cog `{cog}`: {e}", ephemeral=True)
+            await interaction.followup.send(f"❌ Failed to reload cog `{cog}`: {e}", ephemeral=True)
             
     @commands.command(name='sync', help='Sync slash commands (Owner only)')
     @commands.is_owner()
     async def sync_command(self, ctx):
         """Sync slash commands."""
         try:
-            synced = await self.bot.tree.sync()
+            async with ctx.typing():
+                synced = await self.bot.tree.sync()
             await ctx.send(f"✅ Synced {len(synced)} slash commands.")
         except Exception as e:
             await ctx.send(f"❌ Failed to sync commands: {e}")
@@ -470,12 +537,20 @@ class AdminCog(commands.Cog):
             await interaction.response.send_message("❌ Owner only command!", ephemeral=True)
             return
             
+        # Syncing is a slow REST call, so acknowledge first
+        await interaction.response.defer(ephemeral=True)
+        
         try:
             synced = await self.bot.tree.sync()
-            await interaction.response.send_message(f"✅ Synced {len(synced)} slash commands.", ephemeral=True)
+            await interaction.followup.send(f"✅ Synced {len(synced)} slash commands.", ephemeral=True)
         except Exception as e:
-            await interaction.response.send_message(f"❌ Failed to sync commands: {e}", ephemeral=True)
+            await interaction.followup.send(f"❌ Failed to sync commands: {e}", ephemeral=True)
 
 async def setup(bot):
     """Setup function for the cog."""
-    await bot.add_cog(AdminCog(bot))
+    cog = AdminCog(bot)
+    await bot.add_cog(cog)
+    
+    # Register the config panel views so their buttons keep working after a restart
+    for view in cog.config_view.persistent_views:
+        bot.add_view(view)
@@ -1,23 +1,56 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import random
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from random import random as _random
+from itertools import islice
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Tuple
 import logging
 
-from config import COLORS, EMOJIS, get_server_config, is_module_enabled, user_has_permission
-from utils.helpers import create_embed, format_number, get_random_work_job, format_time_remaining, get_time_until_next_use
-from utils.database import get_user_rpg_data, update_user_rpg_data, ensure_user_exists
+from config import COLORS, EMOJIS, is_module_enabled
+from utils.helpers import create_embed, format_number, get_random_work_job, format_time_remaining, get_time_until_next_use, parse_last_daily
+from utils.database import update_user_rpg_data, apply_rpg_delta, load_or_none, prefetch_user_rpg_data
 from utils.constants import RPG_CONSTANTS, SHOP_ITEMS, DAILY_REWARDS
 from utils.rng_system import generate_loot_with_luck
-from replit import db
 
 logger = logging.getLogger(__name__)
 
+# Reply when a slash command is used while the economy module is disabled
+_DISABLED_MSG = "❌ Economy module is disabled!"
+
+# Title of the daily reward embed
+_DAILY_TITLE = "🎁 Daily Reward Claimed!"
+
+# Daily reward constants, unpacked once
+_DAILY_BASE = DAILY_REWARDS['base']
+_DAILY_LEVEL_MULTIPLIER = DAILY_REWARDS['level_multiplier']
+_DAILY_MAX_STREAK = DAILY_REWARDS['max_streak']
+_DAILY_STREAK_BONUS = DAILY_REWARDS['streak_bonus']
+
+def _calc_daily(level: int, streak: int) -> Tuple[int, int]:
+    """Calculate the daily reward as (coins, xp) for a level and streak."""
+    coins = _DAILY_BASE + level * _DAILY_LEVEL_MULTIPLIER + min(streak, _DAILY_MAX_STREAK) * _DAILY_STREAK_BONUS
+    return coins, coins >> 1  # XP is half of coins
+
+# Time between daily reward claims (in seconds)
+_DAILY_COOLDOWN = RPG_CONSTANTS['daily_cooldown']
+
+# Item stats shown in the shop, in display order: (item key, label)
+_SHOP_STAT_SPECS = (('attack', 'ATK'), ('defense', 'DEF'), ('heal', 'Heal'))
+
+# Shop category choices, shared by every ShopView
+_SHOP_CATEGORY_OPTIONS = [
+    discord.SelectOption(label="Weapons", value="weapons", emoji="⚔️"),
+    discord.SelectOption(label="Armor", value="armor", emoji="🛡️"),
+    discord.SelectOption(label="Consumables", value="consumables", emoji="🧪")
+]
+
 class ShopView(discord.ui.View):
     """Interactive shop view."""
 
+    # Shop embeds built so far, shared by every view: category -> embed
+    _EMBED_CACHE: Dict[str, discord.Embed] = {}
+
     def __init__(self, user_id: str):
         super().__init__(timeout=300)
         self.user_id = user_id
@@ -25,11 +58,7 @@ class ShopView(discord.ui.View):
 
     @discord.ui.select(
         placeholder="Select item category...",
-        options=[
-            discord.SelectOption(label="Weapons", value="weapons", emoji="⚔️"),
-            discord.SelectOption(label="Armor", value="armor", emoji="🛡️"),
-            discord.SelectOption(label="Consumables", value="consumables", emoji="🧪")
-        ]
+        options=_SHOP_CATEGORY_OPTIONS
     )
     async def category_select(self, interaction: discord.Interaction, select: discord.ui.Select):
         """Change shop category."""
@@ -39,6 +68,10 @@ class ShopView(discord.ui.View):
 
     def create_shop_embed(self) -> discord.Embed:
         """Create shop embed for current category."""
+        cached = self._EMBED_CACHE.get(self.current_category)
+        if cached is not None:
+            return cached.copy()
+
         embed = discord.Embed(
             title=f"🏪 Shop - {self.current_category.title()}",
             description="Buy items to enhance your adventure!",
@@ -46,20 +79,14 @@ class ShopView(discord.ui.View):
         )
 
         items = SHOP_ITEMS.get(self.current_category, {})
-        for name, data in list(items.items())[:10]:  # Show first 10 items
+        for name, data in islice(items.items(), 10):  # Show first 10 items
             price = data.get('price', 0)
             rarity = data.get('rarity', 'common')
 
             # Build stats text
-            stats = []
-            if 'attack' in data:
-                stats.append(f"ATK: {data['attack']}")
-            if 'defense' in data:
-                stats.append(f"DEF: {data['defense']}")
-            if 'heal' in data:
-                stats.append(f"Heal: {data['heal']}")
-
-            stats_text = " | ".join(stats) if stats else "No stats"
+            stats_text = " | ".join(
+                f"{label}: {data[key]}" for key, label in _SHOP_STAT_SPECS if key in data
+            ) or "No stats"
 
             embed.add_field(
                 name=f"{name} ({rarity})",
@@ -67,7 +94,9 @@ class ShopView(discord.ui.View):
                 inline=True
             )
 
-        return embed
+        # SHOP_ITEMS is static, so the embed is the same for every user
+        self._EMBED_CACHE[self.current_category] = embed
+        return embed.copy()
 
 class EconomyCog(commands.Cog):
     """Economy system for the bot."""
@@ -77,28 +106,20 @@ class EconomyCog(commands.Cog):
 
     # Work command moved to RPG cog to avoid duplication
 
+    @app_commands.guild_only()
     @app_commands.command(name="work", description="Work to earn coins")
     async def work_slash(self, interaction: discord.Interaction):
         """Work to earn coins (slash command)."""
         if not is_module_enabled("economy", interaction.guild.id):
-            await interaction.response.send_message("❌ Economy module is disabled!", ephemeral=True)
+            await interaction.response.send_message(_DISABLED_MSG, ephemeral=True)
             return
 
         user_id = str(interaction.user.id)
 
-        if not ensure_user_exists(user_id):
-            await interaction.response.send_message("❌ You need to start your adventure first!", ephemeral=True)
-            return
-
-        player_data = get_user_rpg_data(user_id)
-        if not player_data:
-            await interaction.response.send_message("❌ Could not retrieve your data. Please try again.", ephemeral=True)
-            return
-
         # Get random job
         job = get_random_work_job()
-        base_coins = random.randint(job["min_coins"], job["max_coins"])
-        base_xp = random.randint(job["min_xp"], job["max_xp"])
+        base_coins = job["min_coins"] + int(_random() * job["_coins_span"])
+        base_xp = job["min_xp"] + int(_random() * job["_xp_span"])
 
         # Apply luck bonuses
         enhanced_loot = generate_loot_with_luck(user_id, {
@@ -109,106 +130,114 @@ class EconomyCog(commands.Cog):
         coins_earned = enhanced_loot['coins']
         xp_earned = enhanced_loot['xp']
 
-        # Update player data
-        player_data['coins'] = player_data.get('coins', 0) + coins_earned
-        player_data['xp'] = player_data.get('xp', 0) + xp_earned
-        player_data['work_count'] = player_data.get('work_count', 0) + 1
-
-        update_user_rpg_data(user_id, player_data)
+        # Update player data in one round trip
+        if not apply_rpg_delta(user_id, {'coins': coins_earned, 'xp': xp_earned, 'work_count': 1}):
+            await interaction.response.send_message("❌ You need to start your adventure first!", ephemeral=True)
+            return
 
-        embed = create_embed(
-            f"💼 Work Complete - {job['name']}",
-            f"You earned **{format_number(coins_earned)}** coins and **{xp_earned}** XP!",
-            COLORS['success']
-        )
+        embed = discord.Embed.from_dict({
+            "title": f"💼 Work Complete - {job['name']}",
+            "description": f"You earned **{format_number(coins_earned)}** coins and **{xp_earned}** XP!",
+            "color": COLORS['success'],
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        })
 
         await interaction.response.send_message(embed=embed)
 
-    @commands.command(name='daily', help='Claim your daily reward')
-    @commands.cooldown(1, RPG_CONSTANTS['daily_cooldown'], commands.BucketType.user)
-    async def daily_command(self, ctx):
-        """Claim daily reward."""
-        if not is_module_enabled("economy", ctx.guild.id):
-            return
+    async def _do_daily(self, send, user: discord.abc.User):
+        """Claim the daily reward for a user, replying through ``send``."""
+        user_id = str(user.id)
 
-        user_id = str(ctx.author.id)
-
-        if not ensure_user_exists(user_id):
-            await ctx.send("❌ You need to start your adventure first!")
+        await prefetch_user_rpg_data(user_id)
+        player_data = load_or_none(user_id)
+        if player_data is None:
+            await send("❌ You need to start your adventure first!", ephemeral=True)
             return
 
-        player_data = get_user_rpg_data(user_id)
-        if not player_data:
-            await ctx.send("❌ Could not retrieve your data. Please try again.")
+        # The cooldown lives on the player record, so it survives restarts
+        now = datetime.now()
+        last_daily = parse_last_daily(player_data.get('last_daily'))
+        cooldown_remaining = get_time_until_next_use(last_daily, _DAILY_COOLDOWN)
+        if cooldown_remaining > 0:
+            embed = create_embed(
+                "⏰ Daily Cooldown",
+                f"You can claim your daily reward in {format_time_remaining(cooldown_remaining)}",
+                COLORS['warning']
+            )
+            await send(embed=embed, ephemeral=True)
             return
 
-        # Calculate daily reward
-        base_reward = DAILY_REWARDS['base']
-        level_bonus = player_data.get('level', 1) * DAILY_REWARDS['level_multiplier']
-        streak_bonus = min(player_data.get('daily_streak', 0), DAILY_REWARDS['max_streak']) * DAILY_REWARDS['streak_bonus']
-
-        total_coins = base_reward + level_bonus + streak_bonus
-        total_xp = int(total_coins * 0.5)  # XP is half of coins
-
-        # Update player data
-        player_data['coins'] = player_data.get('coins', 0) + total_coins
-        player_data['xp'] = player_data.get('xp', 0) + total_xp
-        player_data['daily_streak'] = player_data.get('daily_streak', 0) + 1
+        total_coins, total_xp = _calc_daily(player_data.get('level', 1), player_data.get('daily_streak', 0))
 
+        # Update player data in one write
+        player_data['coins'] += total_coins
+        player_data['xp'] += total_xp
+        player_data['daily_streak'] += 1
+        player_data['last_daily'] = now.isoformat()
         update_user_rpg_data(user_id, player_data)
 
-        embed = create_embed(
-            "🎁 Daily Reward Claimed!",
-            f"**Coins:** {format_number(total_coins)}\n"
-            f"**XP:** {total_xp}\n"
-            f"**Streak:** {player_data['daily_streak']} days",
-            COLORS['success']
-        )
+        embed = discord.Embed.from_dict({
+            "title": _DAILY_TITLE,
+            "description": "\n".join((
+                f"**Coins:** {format_number(total_coins)}",
+                f"**XP:** {total_xp}",
+                f"**Streak:** {player_data['daily_streak']} days"
+            )),
+            "color": COLORS['success'],
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        })
 
-        await ctx.send(embed=embed)
+        await send(embed=embed)
 
-    @app_commands.command(name="daily", description="Claim your daily reward")
-    async def daily_slash(self, interaction: discord.Interaction):
-        """Claim daily reward (slash command)."""
-        if not is_module_enabled("economy", interaction.guild.id):
-            await interaction.response.send_message("❌ Economy module is disabled!", ephemeral=True)
-            return
+    async def _do_shop(self, send, user: discord.abc.User):
+        """Open the item shop for a user, replying through ``send``."""
+        user_id = str(user.id)
+        view = ShopView(user_id)
+        embed = view.create_shop_embed()
 
-        user_id = str(interaction.user.id)
+        await send(embed=embed, view=view)
 
-        if not ensure_user_exists(user_id):
-            await interaction.response.send_message("❌ You need to start your adventure first!", ephemeral=True)
-            return
+    async def _do_balance(self, send, target: discord.Member):
+        """Show a member's wallet, replying through ``send``."""
+        user_id = str(target.id)
 
-        player_data = get_user_rpg_data(user_id)
-        if not player_data:
-            await interaction.response.send_message("❌ Could not retrieve your data. Please try again.", ephemeral=True)
+        await prefetch_user_rpg_data(user_id)
+        player_data = load_or_none(user_id)
+        if player_data is None:
+            await send(f"❌ {target.display_name} hasn't started their adventure yet!", ephemeral=True)
             return
 
-        # Calculate daily reward
-        base_reward = DAILY_REWARDS['base']
-        level_bonus = player_data.get('level', 1) * DAILY_REWARDS['level_multiplier']
-        streak_bonus = min(player_data.get('daily_streak', 0), DAILY_REWARDS['max_streak']) * DAILY_REWARDS['streak_bonus']
+        coins = player_data.get('coins', 0)
+        level = player_data.get('level', 1)
+
+        embed = discord.Embed.from_dict({
+            "title": f"💰 {target.display_name}'s Wallet",
+            "description": f"**Coins:** {format_number(coins)}\n"
+                           f"**Level:** {level}",
+            "color": COLORS['warning'],
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "thumbnail": {"url": target.display_avatar.url}
+        })
 
-        total_coins = base_reward + level_bonus + streak_bonus
-        total_xp = int(total_coins * 0.5)  # XP is half of coins
+        await send(embed=embed)
 
-        # Update player data
-        player_data['coins'] = player_data.get('coins', 0) + total_coins
-        player_data['xp'] = player_data.get('xp', 0) + total_xp
-        player_data['daily_streak'] = player_data.get('daily_streak', 0) + 1
+    @commands.command(name='daily', help='Claim your daily reward')
+    async def daily_command(self, ctx):
+        """Claim daily reward."""
+        if not is_module_enabled("economy", ctx.guild.id):
+            return
 
-        update_user_rpg_data(user_id, player_data)
+        await self._do_daily(ctx.send, ctx.author)
 
-        embed = create_embed(
-            "🎁 Daily Reward Claimed!",
-            f"**Coins:** {format_number(total_coins)}\n"
-            f"**XP:** {total_xp}\n"
-            f"**Streak:** {player_data['daily_streak']} days",
-            COLORS['success']
-        )
+    @app_commands.guild_only()
+    @app_commands.command(name="daily", description="Claim your daily reward")
+    async def daily_slash(self, interaction: discord.Interaction):
+        """Claim daily reward (slash command)."""
+        if not is_module_enabled("economy", interaction.guild.id):
+            await interaction.response.send_message(_DISABLED_MSG, ephemeral=True)
+            return
 
-        await interaction.response.send_message(embed=embed)
+        await self._do_daily(interaction.response.send_message, interaction.user)
 
     @commands.command(name='shop', help='Browse the item shop')
     async def shop_command(self, ctx):
@@ -216,24 +245,17 @@ class EconomyCog(commands.Cog):
         if not is_module_enabled("economy", ctx.guild.id):
             return
 
-        user_id = str(ctx.author.id)
-        view = ShopView(user_id)
-        embed = view.create_shop_embed()
-
-        await ctx.send(embed=embed, view=view)
+        await self._do_shop(ctx.send, ctx.author)
 
+    @app_commands.guild_only()
     @app_commands.command(name="shop", description="Browse the item shop")
     async def shop_slash(self, interaction: discord.Interaction):
         """Browse the item shop (slash command)."""
         if not is_module_enabled("economy", interaction.guild.id):
-            await interaction.response.send_message("❌ Economy module is disabled!", ephemeral=True)
+            await interaction.response.send_message(_DISABLED_MSG, ephemeral=True)
             return
 
-        user_id = str(interaction.user.id)
-        view = ShopView(user_id)
-        embed = view.create_shop_embed()
-
-        await interaction.response.send_message(embed=embed, view=view)
+        await self._do_shop(interaction.response.send_message, interaction.user)
 
     @commands.command(name='balance', help='Check your coin balance')
     async def balance_command(self, ctx, member: Optional[discord.Member] = None):
@@ -241,63 +263,18 @@ class EconomyCog(commands.Cog):
         if not is_module_enabled("economy", ctx.guild.id):
             return
 
-        target = member or ctx.author
-        user_id = str(target.id)
-
-        if not ensure_user_exists(user_id):
-            await ctx.send(f"❌ {target.display_name} hasn't started their adventure yet!")
-            return
-
-        player_data = get_user_rpg_data(user_id)
-        if not player_data:
-            await ctx.send("❌ Could not retrieve data.")
-            return
-
-        coins = player_data.get('coins', 0)
-        level = player_data.get('level', 1)
-
-        embed = create_embed(
-            f"💰 {target.display_name}'s Wallet",
-            f"**Coins:** {format_number(coins)}\n"
-            f"**Level:** {level}",
-            COLORS['warning']
-        )
-        embed.set_thumbnail(url=target.display_avatar.url)
-
-        await ctx.send(embed=embed)
+        await self._do_balance(ctx.send, member or ctx.author)
 
+    @app_commands.guild_only()
     @app_commands.command(name="balance", description="Check your coin balance")
     @app_commands.describe(member="User to check balance for (optional)")
     async def balance_slash(self, interaction: discord.Interaction, member: Optional[discord.Member] = None):
         """Check coin balance (slash command)."""
         if not is_module_enabled("economy", interaction.guild.id):
-            await interaction.response.send_message("❌ Economy module is disabled!", ephemeral=True)
-            return
-
-        target = member or interaction.user
-        user_id = str(target.id)
-
-        if not ensure_user_exists(user_id):
-            await interaction.response.send_message(f"❌ {target.display_name} hasn't started their adventure yet!", ephemeral=True)
+            await interaction.response.send_message(_DISABLED_MSG, ephemeral=True)
             return
 
-        player_data = get_user_rpg_data(user_id)
-        if not player_data:
-            await interaction.response.send_message("❌ Could not retrieve data.", ephemeral=True)
-            return
-
-        coins = player_data.get('coins', 0)
-        level = player_data.get('level', 1)
-
-        embed = create_embed(
-            f"💰 {target.display_name}'s Wallet",
-            f"**Coins:** {format_number(coins)}\n"
-            f"**Level:** {level}",
-            COLORS['warning']
-        )
-        embed.set_thumbnail(url=target.display_avatar.url)
-
-        await interaction.response.send_message(embed=embed)
+        await self._do_balance(interaction.response.send_message, member or interaction.user)
 
 async def setup(bot):
     """Setup function for the cog."""
@@ -1,7 +1,7 @@
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import logging
 
 from config import COLORS, get_server_config, is_module_enabled
@@ -9,6 +9,130 @@ from utils.helpers import create_embed
 
 logger = logging.getLogger(__name__)
 
+# Help page content per category: category -> (description, field name, field value)
+_HELP_EMBED_DATA = {
+    "main": (
+        "Basic bot commands and information",
+        "📋 General Commands",
+        "• `/help` - Show this help menu\n"
+        "• `/start` - Start your RPG adventure\n"
+        "• `/profile` - View your character profile\n"
+        "• `/config` - Server configuration (Admin only)"
+    ),
+    "rpg": (
+        "RPG gaming commands for adventure and combat",
+        "⚔️ RPG Commands",
+        "• `/start` - Begin your RPG journey\n"
+        "• `/profile` - View character stats\n"
+        "• `/adventure` - Go on adventures\n"
+        "• `/heal` - Heal your character\n"
+        "• `/leaderboard` - View server rankings\n"
+        "• `/battle` - Fight monsters\n"
+        "• `/dungeon` - Enter dungeons\n"
+        "• `/inventory` - View your items\n"
+        "• `/equipment` - Manage equipment\n"
+        "• `/shop` - Buy equipment and items\n"
+        "• `/work` - Work to earn coins\n"
+        "• `/daily` - Claim daily rewards\n"
+        "• `/balance` - Check coin balance\n"
+        "• `/quest` - View and complete quests\n"
+        "• `/craft` - Craft items and equipment"
+    ),
+    "moderation": (
+        "Moderation tools for server management",
+        "🛡️ Moderation Commands",
+        "• `/kick` - Kick a member\n"
+        "• `/ban` - Ban a member\n"
+        "• `/warn` - Warn a member\n"
+        "• `/warnings` - View user warnings\n"
+        "• `/purge` - Delete multiple messages\n"
+        "• `/timeout` - Timeout a member\n"
+        "• `/lock` - Lock a channel\n"
+        "• `/unlock` - Unlock a channel\n"
+        "• `/slowmode` - Set channel slowmode\n"
+        "• `/clear_warns` - Clear user warnings"
+    ),
+    "ai": (
+        "AI chatbot features for conversation",
+        "🤖 AI Commands",
+        "• `/chat` - Chat with AI\n"
+        "• `/clear_chat` - Clear chat history\n"
+        "• `/ai_status` - Check AI system status\n"
+        "• **Auto-Response** - Just mention me!\n"
+        "• **Context Memory** - I remember our chats\n"
+        "• **Plagg Personality** - Sarcastic and fun responses\n"
+        "• **Natural Language** - Chat like with a friend"
+    ),
+    "admin": (
+        "Administrative commands for server owners",
+        "⚙️ Admin Commands",
+        "• `/config` - Interactive server configuration\n"
+        "• `/stats` - View bot statistics\n"
+        "• `/reload` - Reload bot modules\n"
+        "• `/sync` - Sync slash commands\n"
+        "• `/backup` - Backup server data\n"
+        "• `/restore` - Restore server data\n"
+        "• `/reset_user` - Reset user progress\n"
+        "• `/announce` - Send announcements"
+    ),
+}
+
+def _build_help_blobs() -> Dict[str, Dict[str, Any]]:
+    """Build the serialized help embed for every category once."""
+    return {
+        category: {
+            "title": f"📚 Help - {category.title()}",
+            "description": description,
+            "color": COLORS['primary'],
+            "fields": [{"name": field_name, "value": field_value, "inline": False}],
+            "footer": {"text": "Use the dropdown menu to browse different categories"}
+        }
+        for category, (description, field_name, field_value) in _HELP_EMBED_DATA.items()
+    }
+
+# Serialized help embeds, wrapped with Embed.from_dict per interaction (read-only): category -> dict
+_HELP_BLOBS = _build_help_blobs()
+
+# Static /info fields around the live statistics field
+_INFO_FEATURE_FIELDS = (
+    {
+        "name": "🤖 Main Feature - AI Chat",
+        "value": "• **Smart Conversations** - Just mention me!\n"
+                 "• **Plagg's Personality** - Sarcastic and fun\n"
+                 "• **Context Memory** - Remembers our chats\n"
+                 "• **Google Gemini** - Advanced AI responses\n"
+                 "• **Natural Language** - Chat like with a friend",
+        "inline": True
+    },
+    {
+        "name": "🎮 Bonus Game Features",
+        "value": "• **RPG System** - Adventures & dungeons\n"
+                 "• **Battle System** - Fight monsters\n"
+                 "• **Progression** - Level up & get stronger\n"
+                 "• **Inventory** - Collect items & gear",
+        "inline": True
+    },
+)
+_INFO_LINKS_FIELD = {
+    "name": "🔗 Links",
+    "value": "• [Support Server](https://discord.gg/your-server)\n"
+             "• [Invite Bot](https://discord.com/api/oauth2/authorize?client_id=YOUR_BOT_ID&permissions=8&scope=bot%20applications.commands)\n"
+             "• [GitHub](https://github.com/your-repo)",
+    "inline": False
+}
+
+# Categories a help menu can be opened on
+_VALID_CATEGORIES = frozenset(_HELP_EMBED_DATA)
+
+# Help category choices, shared by every HelpView
+_HELP_CATEGORY_OPTIONS = [
+    discord.SelectOption(label="Main Commands", value="main", emoji="🏠"),
+    discord.SelectOption(label="RPG Games", value="rpg", emoji="⚔️"),
+    discord.SelectOption(label="Moderation", value="moderation", emoji="🛡️"),
+    discord.SelectOption(label="AI Chatbot", value="ai", emoji="🤖"),
+    discord.SelectOption(label="Admin", value="admin", emoji="⚙️")
+]
+
 class HelpView(discord.ui.View):
     """Interactive help view with category selection."""
 
@@ -20,13 +144,7 @@ class HelpView(discord.ui.View):
 
     @discord.ui.select(
         placeholder="Select a command category...",
-        options=[
-            discord.SelectOption(label="Main Commands", value="main", emoji="🏠"),
-            discord.SelectOption(label="RPG Games", value="rpg", emoji="⚔️"),
-            discord.SelectOption(label="Moderation", value="moderation", emoji="🛡️"),
-            discord.SelectOption(label="AI Chatbot", value="ai", emoji="🤖"),
-            discord.SelectOption(label="Admin", value="admin", emoji="⚙️")
-        ]
+        options=_HELP_CATEGORY_OPTIONS
     )
     async def category_select(self, interaction: discord.Interaction, select: discord.ui.Select):
         """Change help category."""
@@ -40,168 +158,81 @@ class HelpView(discord.ui.View):
 
     def create_help_embed(self) -> discord.Embed:
         """Create help embed for current category."""
-        embed = discord.Embed(
-            title=f"📚 Help - {self.current_category.title()}",
-            color=COLORS['primary']
-        )
-
-        if self.current_category == "main":
-            embed.description = "Basic bot commands and information"
-            embed.add_field(
-                name="📋 General Commands",
-                value="• `/help` - Show this help menu\n"
-                      "• `/start` - Start your RPG adventure\n"
-                      "• `/profile` - View your character profile\n"
-                      "• `/config` - Server configuration (Admin only)",
-                inline=False
-            )
-
-        elif self.current_category == "rpg":
-            embed.description = "RPG gaming commands for adventure and combat"
-            embed.add_field(
-                name="⚔️ RPG Commands",
-                value="• `/start` - Begin your RPG journey\n"
-                      "• `/profile` - View character stats\n"
-                      "• `/adventure` - Go on adventures\n"
-                      "• `/heal` - Heal your character\n"
-                      "• `/leaderboard` - View server rankings\n"
-                      "• `/battle` - Fight monsters\n"
-                      "• `/dungeon` - Enter dungeons\n"
-                      "• `/inventory` - View your items\n"
-                      "• `/equipment` - Manage equipment\n"
-                      "• `/shop` - Buy equipment and items\n"
-                      "• `/work` - Work to earn coins\n"
-                      "• `/daily` - Claim daily rewards\n"
-                      "• `/balance` - Check coin balance\n"
-                      "• `/quest` - View and complete quests\n"
-                      "• `/craft` - Craft items and equipment",
-                inline=False
-            )
-
-        elif self.current_category == "moderation":
-            embed.description = "Moderation tools for server management"
-            embed.add_field(
-                name="🛡️ Moderation Commands",
-                value="• `/kick` - Kick a member\n"
-                      "• `/ban` - Ban a member\n"
-                      "• `/warn` - Warn a member\n"
-                      "• `/warnings` - View user warnings\n"
-                      "• `/purge` - Delete multiple messages\n"
-                      "• `/timeout` - Timeout a member\n"
-                      "• `/lock` - Lock a channel\n"
-                      "• `/unlock` - Unlock a channel\n"
-                      "• `/slowmode` - Set channel slowmode\n"
-                      "• `/clear_warns` - Clear user warnings",
-                inline=False
-            )
-
-        elif self.current_category == "ai":
-            embed.description = "AI chatbot features for conversation"
-            embed.add_field(
-                name="🤖 AI Commands",
-                value="• `/chat` - Chat with AI\n"
-                      "• `/clear_chat` - Clear chat history\n"
-                      "• `/ai_status` - Check AI system status\n"
-                      "• **Auto-Response** - Just mention me!\n"
-                      "• **Context Memory** - I remember our chats\n"
-                      "• **Plagg Personality** - Sarcastic and fun responses\n"
-                      "• **Natural Language** - Chat like with a friend",
-                inline=False
-            )
-
-        elif self.current_category == "admin":
-            embed.description = "Administrative commands for server owners"
-            embed.add_field(
-                name="⚙️ Admin Commands",
-                value="• `/config` - Interactive server configuration\n"
-                      "• `/stats` - View bot statistics\n"
-                      "• `/reload` - Reload bot modules\n"
-                      "• `/sync` - Sync slash commands\n"
-                      "• `/backup` - Backup server data\n"
-                      "• `/restore` - Restore server data\n"
-                      "• `/reset_user` - Reset user progress\n"
-                      "• `/announce` - Send announcements",
-                inline=False
-            )
-
-        embed.set_footer(text="Use the dropdown menu to browse different categories")
-        return embed
+        return discord.Embed.from_dict(_HELP_BLOBS[self.current_category])
 
 class HelpCog(commands.Cog):
     """Help system for the bot."""
 
     def __init__(self, bot):
         self.bot = bot
+        # Latest snapshot of (guilds, users, commands, slash commands) for /info
+        self._stats: Tuple[int, int, int, int] = (0, 0, 0, 0)
+
+    async def cog_load(self):
+        """Start refreshing the /info statistics snapshot."""
+        self.refresh_stats.start()
+
+    async def cog_unload(self):
+        """Stop refreshing the /info statistics snapshot."""
+        self.refresh_stats.cancel()
+
+    @tasks.loop(seconds=30)
+    async def refresh_stats(self):
+        """Snapshot the bot's counts so /info doesn't walk the caches per call."""
+        self._stats = (
+            len(self.bot.guilds),
+            len(self.bot.users),
+            len(self.bot.commands),
+            len(self.bot.tree.get_commands())
+        )
+
+    @refresh_stats.before_loop
+    async def before_refresh_stats(self):
+        """Wait for login so the first snapshot isn't taken from empty caches."""
+        await self.bot.wait_until_ready()
+
+    async def _send_help(self, send, user: discord.abc.User, category: Optional[str] = None):
+        """Send the help menu, opened on ``category`` when it is valid."""
+        view = HelpView(self.bot, user)
+
+        if category and category.lower() in _VALID_CATEGORIES:
+            view.current_category = category.lower()
+
+        await send(embed=view.create_help_embed(), view=view)
 
     @commands.command(name='help', help='Show help information')
     async def help_command(self, ctx, category: Optional[str] = None):
         """Show help information."""
-        view = HelpView(self.bot, ctx.author)
-        embed = view.create_help_embed()
-        await ctx.send(embed=embed, view=view)
+        await self._send_help(ctx.send, ctx.author, category)
 
     @app_commands.command(name="help", description="Show help information")
     @app_commands.describe(category="Specific category to view (optional)")
     async def help_slash(self, interaction: discord.Interaction, category: Optional[str] = None):
         """Show help information (slash command)."""
-        view = HelpView(self.bot, interaction.user)
-
-        if category:
-            valid_categories = ["main", "rpg", "moderation", "ai", "admin"]
-            if category.lower() in valid_categories:
-                view.current_category = category.lower()
-
-        embed = view.create_help_embed()
-        await interaction.response.send_message(embed=embed, view=view)
+        await self._send_help(interaction.response.send_message, interaction.user, category)
 
     @app_commands.command(name="info", description="Show bot information")
     async def info_slash(self, interaction: discord.Interaction):
         """Show bot information."""
-        embed = discord.Embed(
-            title="🧀 Plagg - AI Chatbot with Game Features",
-            description="A comprehensive Discord bot with AI chatbot as the main feature and game features!",
-            color=COLORS['primary']
-        )
-
-        embed.add_field(
-            name="🤖 Main Feature - AI Chat",
-            value="• **Smart Conversations** - Just mention me!\n"
-                  "• **Plagg's Personality** - Sarcastic and fun\n"
-                  "• **Context Memory** - Remembers our chats\n"
-                  "• **Google Gemini** - Advanced AI responses\n"
-                  "• **Natural Language** - Chat like with a friend",
-            inline=True
-        )
-
-        embed.add_field(
-            name="🎮 Bonus Game Features",
-            value="• **RPG System** - Adventures & dungeons\n"
-                  "• **Battle System** - Fight monsters\n"
-                  "• **Progression** - Level up & get stronger\n"
-                  "• **Inventory** - Collect items & gear",
-            inline=True
-        )
-
-        embed.add_field(
-            name="📈 Statistics",
-            value=f"• Guilds: {len(self.bot.guilds)}\n"
-                  f"• Users: {len(self.bot.users)}\n"
-                  f"• Commands: {len(self.bot.commands)}\n"
-                  f"• Slash Commands: {len(self.bot.tree.get_commands())}\n"
-                  f"• Latency: {round(self.bot.latency * 1000, 2)}ms",
-            inline=True
-        )
-
-        embed.add_field(
-            name="🔗 Links",
-            value="• [Support Server](https://discord.gg/your-server)\n"
-                  "• [Invite Bot](https://discord.com/api/oauth2/authorize?client_id=YOUR_BOT_ID&permissions=8&scope=bot%20applications.commands)\n"
-                  "• [GitHub](https://github.com/your-repo)",
-            inline=False
-        )
-
-        embed.set_footer(text="Made by NoNameP_P | Use /help to see all available commands")
-        embed.set_thumbnail(url=self.bot.user.display_avatar.url)
+        guild_count, user_count, command_count, slash_count = self._stats
+        stats_field = {
+            "name": "📈 Statistics",
+            "value": f"• Guilds: {guild_count}\n"
+                     f"• Users: {user_count}\n"
+                     f"• Commands: {command_count}\n"
+                     f"• Slash Commands: {slash_count}\n"
+                     f"• Latency: {round(self.bot.latency * 1000, 2)}ms",
+            "inline": True
+        }
+
+        embed = discord.Embed.from_dict({
+            "title": "🧀 Plagg - AI Chatbot with Game Features",
+            "description": "A comprehensive Discord bot with AI chatbot as the main feature and game features!",
+            "color": COLORS['primary'],
+            "fields": [*_INFO_FEATURE_FIELDS, stats_field, _INFO_LINKS_FIELD],
+            "footer": {"text": "Made by NoNameP_P | Use /help to see all available commands"},
+            "thumbnail": {"url": self.bot.user.display_avatar.url}
+        })
 
         await interaction.response.send_message(embed=embed)
 
@@ -3,85 +3,201 @@ from discord.ext import commands
 from discord import app_commands
 import random
 import asyncio
+from bisect import bisect_right
+from functools import partial
+from itertools import accumulate
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable
 import logging
 
 from config import COLORS, EMOJIS, get_server_config, is_module_enabled
-from utils.helpers import create_embed, format_number, create_progress_bar
-from utils.database import get_user_rpg_data, update_user_rpg_data, ensure_user_exists, create_user_profile, get_leaderboard
-from utils.constants import RPG_CONSTANTS, WEAPONS, ARMOR, RARITY_COLORS, RARITY_WEIGHTS, PVP_ARENAS, OMNIPOTENT_ITEM
-from utils.rng_system import roll_with_luck, check_rare_event, get_luck_status, generate_loot_with_luck, weighted_random_choice
+from utils.helpers import create_embed, format_number, create_progress_bar, format_time_remaining, get_time_until_next_use, parse_last_daily
+from utils.database import get_user_rpg_data, update_user_rpg_data, ensure_user_exists, create_user_profile, get_leaderboard, start_rpg_write_flusher, stop_rpg_write_flusher, update_user_rpg_data_batch, add_inventory_items, remove_inventory_item, PlayerStats, rpg_session, transfer_coins, bump_stat, prefetch_user_rpg_data, warm_leaderboard_snapshot
+from utils.constants import RPG_CONSTANTS, WEAPONS, ARMOR, RARITY_COLORS, RARITY_WEIGHTS, PVP_ARENAS, PVP_ARENA_NAMES, OMNIPOTENT_ITEM, ITEM_INDEX
+from utils.alias_sampler import AliasTable
+from utils.rng_system import roll_with_luck, check_rare_event, get_luck_status, get_luck_multiplier, generate_loot_with_luck, weighted_random_choice
 from replit import db
 
 logger = logging.getLogger(__name__)
 
-def level_up_player(player_data):
-    """Check and handle level ups."""
-    current_level = player_data.get('level', 1)
-    current_xp = player_data.get('xp', 0)
-
-    # Calculate XP needed for next level
-    base_xp = 100
-    xp_needed = int(base_xp * (1.5 ** (current_level - 1)))
+# XP needed to advance from each level, indexed by level - 1
+XP_THRESHOLDS = tuple(
+    int(RPG_CONSTANTS['base_xp'] * RPG_CONSTANTS['xp_multiplier'] ** i)
+    for i in range(RPG_CONSTANTS['max_level'])
+)
+MAX_LEVEL = RPG_CONSTANTS['max_level']
 
-    if current_xp >= xp_needed:
-        # Level up!
-        new_level = current_level + 1
-        remaining_xp = current_xp - xp_needed
+# Total XP spent to reach each level from level 1, indexed by level - 1
+CUMULATIVE_XP = tuple(accumulate(XP_THRESHOLDS[:-1], initial=0))
 
-        # Update stats
-        player_data['level'] = new_level
-        player_data['xp'] = remaining_xp
-        player_data['max_xp'] = int(base_xp * (1.5 ** (new_level - 1)))
+# Level-up announcement, filled with the new level and total stat gains
+_LEVEL_UP_TEMPLATE = "🎉 Level {level}! HP+{hp}, ATK+{attack}, DEF+{defense}"
 
-        # Increase stats
-        player_data['max_hp'] = player_data.get('max_hp', 100) + 10
-        player_data['hp'] = player_data.get('max_hp', 100)  # Full heal on level up
-        player_data['attack'] = player_data.get('attack', 10) + 2
-        player_data['defense'] = player_data.get('defense', 5) + 1
-
-        return f"🎉 Level {new_level}! HP+10, ATK+2, DEF+1"
+def level_up_player(player_data):
+    """Check and handle level ups, applying every level the XP covers."""
+    level = player_data.get('level', 1)
+    current_xp = player_data.get('xp', 0)
+    start_level = level
+
+    if level < MAX_LEVEL and current_xp >= XP_THRESHOLDS[level - 1]:
+        # Jump straight to the highest level the lifetime XP reaches
+        total_xp = CUMULATIVE_XP[level - 1] + current_xp
+        level = bisect_right(CUMULATIVE_XP, total_xp)
+        current_xp = total_xp - CUMULATIVE_XP[level - 1]
+
+    player_data['max_xp'] = XP_THRESHOLDS[min(level, MAX_LEVEL) - 1]
+
+    gained = level - start_level
+    if not gained:
+        return None
+
+    # Update stats
+    player_data['level'] = level
+    player_data['xp'] = current_xp
+
+    # Increase stats
+    player_data['max_hp'] = player_data.get('max_hp', 100) + 10 * gained
+    player_data['hp'] = player_data['max_hp']  # Full heal on level up
+    player_data['attack'] = player_data.get('attack', 10) + 2 * gained
+    player_data['defense'] = player_data.get('defense', 5) + gained
+
+    return _LEVEL_UP_TEMPLATE.format(level=level, hp=10 * gained, attack=2 * gained, defense=gained)
+
+# Possible adventure outcomes; an optional 'weight' key makes one more likely (default 1)
+_ADVENTURE_OUTCOMES = (
+    {
+        'description': 'You discovered a hidden treasure chest!',
+        'coins': (50, 150),
+        'xp': (20, 50),
+        'items': ['Health Potion', 'Iron Sword', 'Leather Armor']
+    },
+    {
+        'description': 'You defeated a group of bandits!',
+        'coins': (30, 100),
+        'xp': (15, 40),
+        'items': ['Health Potion', 'Lucky Charm']
+    },
+    {
+        'description': 'You helped a merchant and received a reward!',
+        'coins': (40, 120),
+        'xp': (10, 30),
+        'items': ['Health Potion', 'Iron Sword']
+    },
+    {
+        'description': 'You found rare materials while exploring!',
+        'coins': (20, 80),
+        'xp': (25, 60),
+        'items': ['Health Potion', 'Lucky Charm', 'Iron Sword']
+    }
+)
 
-    player_data['max_xp'] = xp_needed
-    return None
+_ADVENTURE_OUTCOME_TABLE = AliasTable(
+    _ADVENTURE_OUTCOMES,
+    [outcome.get('weight', 1) for outcome in _ADVENTURE_OUTCOMES]
+)
 
 def get_random_adventure_outcome():
     """Get a random adventure outcome."""
-    outcomes = [
-        {
-            'description': 'You discovered a hidden treasure chest!',
-            'coins': (50, 150),
-            'xp': (20, 50),
-            'items': ['Health Potion', 'Iron Sword', 'Leather Armor']
-        },
-        {
-            'description': 'You defeated a group of bandits!',
-            'coins': (30, 100),
-            'xp': (15, 40),
-            'items': ['Health Potion', 'Lucky Charm']
-        },
-        {
-            'description': 'You helped a merchant and received a reward!',
-            'coins': (40, 120),
-            'xp': (10, 30),
-            'items': ['Health Potion', 'Iron Sword']
-        },
-        {
-            'description': 'You found rare materials while exploring!',
-            'coins': (20, 80),
-            'xp': (25, 60),
-            'items': ['Health Potion', 'Lucky Charm', 'Iron Sword']
-        }
-    ]
-    return random.choice(outcomes)
-
-def calculate_battle_damage(attack, defense):
+    return _ADVENTURE_OUTCOME_TABLE.sample()
+
+# Jobs for the work command, with (min, max) reward ranges
+_WORK_JOBS = (
+    {"name": "Mining", "coins": (50, 100), "xp": (5, 15)},
+    {"name": "Farming", "coins": (30, 80), "xp": (3, 10)},
+    {"name": "Trading", "coins": (70, 120), "xp": (8, 20)},
+    {"name": "Blacksmithing", "coins": (60, 110), "xp": (6, 18)}
+)
+
+# Precompute each job's inclusive reward span once, so a draw is min + int(random() * span)
+for _job in _WORK_JOBS:
+    _job['_coins_span'] = _job['coins'][1] - _job['coins'][0] + 1
+    _job['_xp_span'] = _job['xp'][1] - _job['xp'][0] + 1
+del _job
+
+# Monster victory rewards as (min, inclusive span)
+_VICTORY_COINS = (50, 101)
+_VICTORY_XP = (20, 31)
+
+# Bound once; reward rolls are min + int(_random() * span)
+_random = random.random
+
+# Monster templates for the battle command; copy one before a BattleView changes its hp
+_MONSTERS = (
+    {"name": "Goblin", "hp": 30, "attack": 8, "max_hp": 30},
+    {"name": "Orc", "hp": 50, "attack": 12, "max_hp": 50},
+    {"name": "Skeleton", "hp": 40, "attack": 10, "max_hp": 40},
+    {"name": "Troll", "hp": 80, "attack": 15, "max_hp": 80}
+)
+
+def calculate_battle_damage(attack, defense, _rand=random.random):
     """Calculate battle damage."""
-    base_damage = max(1, attack - defense)
-    # Add some randomness
-    damage = random.randint(int(base_damage * 0.8), int(base_damage * 1.2))
-    return max(1, damage)
+    base_damage = attack - defense if attack > defense else 1
+    # Add some randomness: uniform over [80%, 120%] of base, in integer math
+    low = base_damage * 4 // 5
+    damage = low + int(_rand() * (base_damage * 6 // 5 - low + 1))
+    return damage if damage > 1 else 1
+
+def simulate_battle(attack1, defense1, hp1, attack2, defense2, hp2, max_turns=10):
+    """Simulate a turn-based duel where side 0 strikes first each round.
+    
+    Returns the final HP of both sides and the hits as (turn, attacker, damage).
+    """
+    damage_fn = calculate_battle_damage
+    hits = []
+    append = hits.append
+    
+    for turn in range(1, max_turns + 1):
+        damage = damage_fn(attack1, defense2)
+        hp2 -= damage
+        append((turn, 0, damage))
+        if hp2 <= 0:
+            break
+            
+        damage = damage_fn(attack2, defense1)
+        hp1 -= damage
+        append((turn, 1, damage))
+        if hp1 <= 0:
+            break
+            
+    return hp1, hp2, hits
+
+# Profile stats page fields: (name, value template filled by create_stats_embed)
+_PROFILE_STAT_FIELDS = (
+    ("📊 Level & Experience", "**Level:** {level}\n**XP:** {xp:,}/{max_xp:,}\n{xp_bar}"),
+    ("❤️ Health", "**HP:** {hp}/{max_hp}\n{hp_bar}"),
+    ("💰 Wealth", "**Coins:** {coins}"),
+    ("⚔️ Combat Stats", "**Attack:** {attack}\n**Defense:** {defense}"),
+    ("📈 Statistics", "**Battles Won:** {battles_won}\n**Adventures:** {adventures}\n**Work Count:** {work_count}")
+)
+
+# Welcome message for new players; the profile command differs between slash and prefix
+_START_TEMPLATE = (
+    "Welcome to your RPG adventure, {mention}!\n\n"
+    "**Starting Stats:**\n"
+    "• Level: 1\n"
+    "• HP: 100/100\n"
+    "• Attack: 10\n"
+    "• Defense: 5\n"
+    "• Coins: 100\n\n"
+    "Use `{profile_command}` to view your character\n"
+    "Use `$adventure` to start exploring\n"
+    "Use `$work` to earn coins\n"
+    "Use `$shop` to buy equipment"
+)
+
+# Adventure result rewards field
+_ADVENTURE_REWARDS_TEMPLATE = "**Coins:** {coins}\n**XP:** {xp}"
+# Profile inventory and luck page fields
+_PROFILE_EQUIPPED_TEMPLATE = "**Weapon:** {weapon}\n**Armor:** {armor}\n**Accessory:** {accessory}"
+_PROFILE_LUCK_TEMPLATE = "**Level:** {emoji} {level}\n**Points:** {points}\n**Bonus:** +{bonus_percent}%"
+
+class RPGView(discord.ui.View):
+    """Base view for RPG interactions that end by locking their components."""
+
+    def disable_all(self):
+        """Disable every component, e.g. once a battle or trade is over."""
+        for item in self.children:
+            item.disabled = True
 
 class ProfileView(discord.ui.View):
     """Interactive profile view."""
@@ -124,166 +240,210 @@ class ProfileView(discord.ui.View):
 
     def create_stats_embed(self) -> discord.Embed:
         """Create stats embed."""
-        level = self.player_data.get('level', 1)
-        xp = self.player_data.get('xp', 0)
-        max_xp = self.player_data.get('max_xp', 100)
-        hp = self.player_data.get('hp', 100)
-        max_hp = self.player_data.get('max_hp', 100)
-        attack = self.player_data.get('attack', 10)
-        defense = self.player_data.get('defense', 5)
-        coins = self.player_data.get('coins', 0)
+        data = self.player_data
+        p = PlayerStats.from_data(data)
+        stats = data.get('stats', {})
 
         # Calculate XP percentage
-        xp_percent = (xp / max_xp) * 100 if max_xp > 0 else 0
-        hp_percent = (hp / max_hp) * 100 if max_hp > 0 else 0
-
-        embed = discord.Embed(
-            title=f"📊 {self.user.display_name}'s Profile",
-            color=COLORS['primary']
-        )
-        embed.set_thumbnail(url=self.user.display_avatar.url)
-
-        embed.add_field(
-            name="📊 Level & Experience",
-            value=f"**Level:** {level}\n"
-                  f"**XP:** {xp:,}/{max_xp:,}\n"
-                  f"{create_progress_bar(xp_percent)}",
-            inline=True
-        )
-
-        embed.add_field(
-            name="❤️ Health",
-            value=f"**HP:** {hp}/{max_hp}\n"
-                  f"{create_progress_bar(hp_percent)}",
-            inline=True
-        )
-
-        embed.add_field(
-            name="💰 Wealth",
-            value=f"**Coins:** {format_number(coins)}",
-            inline=True
-        )
-
-        embed.add_field(
-            name="⚔️ Combat Stats",
-            value=f"**Attack:** {attack}\n"
-                  f"**Defense:** {defense}",
-            inline=True
-        )
-
-        # Stats
-        stats = self.player_data.get('stats', {})
-        embed.add_field(
-            name="📈 Statistics",
-            value=f"**Battles Won:** {stats.get('battles_won', 0)}\n"
-                  f"**Adventures:** {self.player_data.get('adventure_count', 0)}\n"
-                  f"**Work Count:** {self.player_data.get('work_count', 0)}",
-            inline=True
-        )
+        xp_percent = (p.xp / p.max_xp) * 100 if p.max_xp > 0 else 0
+        hp_percent = (p.hp / p.max_hp) * 100 if p.max_hp > 0 else 0
+
+        values = {
+            'level': p.level,
+            'xp': p.xp,
+            'max_xp': p.max_xp,
+            'xp_bar': create_progress_bar(xp_percent),
+            'hp': p.hp,
+            'max_hp': p.max_hp,
+            'hp_bar': create_progress_bar(hp_percent),
+            'coins': format_number(p.coins),
+            'attack': p.attack,
+            'defense': p.defense,
+            'battles_won': stats.get('battles_won', 0),
+            'adventures': data.get('adventure_count', 0),
+            'work_count': data.get('work_count', 0)
+        }
 
-        return embed
+        return discord.Embed.from_dict({
+            'title': f"📊 {self.user.display_name}'s Profile",
+            'color': COLORS['primary'],
+            'thumbnail': {'url': str(self.user.display_avatar.url)},
+            'fields': [
+                {'name': name, 'value': template.format_map(values), 'inline': True}
+                for name, template in _PROFILE_STAT_FIELDS
+            ]
+        })
 
     def create_inventory_embed(self) -> discord.Embed:
         """Create inventory embed."""
-        inventory = self.player_data.get('inventory', [])
+        inventory = self.player_data.get('inventory', {})
         equipped = self.player_data.get('equipped', {})
 
-        embed = discord.Embed(
-            title=f"🎒 {self.user.display_name}'s Inventory",
-            color=COLORS['secondary']
-        )
-
-        # Equipped items
-        weapon = equipped.get('weapon', 'None')
-        armor = equipped.get('armor', 'None')
-        accessory = equipped.get('accessory', 'None')
-
-        embed.add_field(
-            name="🔧 Equipped",
-            value=f"**Weapon:** {weapon}\n"
-                  f"**Armor:** {armor}\n"
-                  f"**Accessory:** {accessory}",
-            inline=False
-        )
-
         # Inventory items
         if inventory:
             items_text = ""
-            for item in inventory[:10]:  # Show first 10 items
-                items_text += f"• {item}\n"
+            for item, count in sorted(inventory.items())[:10]:  # Show first 10 items
+                items_text += f"• {item} x{count}\n" if count > 1 else f"• {item}\n"
             if len(inventory) > 10:
                 items_text += f"... and {len(inventory) - 10} more items"
         else:
             items_text = "Your inventory is empty!"
 
-        embed.add_field(
-            name="📦 Items",
-            value=items_text,
-            inline=False
-        )
-
-        return embed
+        return discord.Embed.from_dict({
+            'title': f"🎒 {self.user.display_name}'s Inventory",
+            'color': COLORS['secondary'],
+            'fields': [
+                {
+                    'name': "🔧 Equipped",
+                    'value': _PROFILE_EQUIPPED_TEMPLATE.format(
+                        weapon=equipped.get('weapon', 'None'),
+                        armor=equipped.get('armor', 'None'),
+                        accessory=equipped.get('accessory', 'None')
+                    ),
+                    'inline': False
+                },
+                {'name': "📦 Items", 'value': items_text, 'inline': False}
+            ]
+        })
 
     def create_luck_embed(self) -> discord.Embed:
         """Create luck embed."""
         luck_status = get_luck_status(str(self.user.id))
 
-        embed = discord.Embed(
-            title=f"🍀 {self.user.display_name}'s Luck",
-            color=COLORS['success']
-        )
-
-        embed.add_field(
-            name="🎲 Luck Status",
-            value=f"**Level:** {luck_status['emoji']} {luck_status['level']}\n"
-                  f"**Points:** {luck_status['points']}\n"
-                  f"**Bonus:** +{luck_status['bonus_percent']}%",
-            inline=False
-        )
+        return discord.Embed.from_dict({
+            'title': f"🍀 {self.user.display_name}'s Luck",
+            'color': COLORS['success'],
+            'fields': [{
+                'name': "🎲 Luck Status",
+                'value': _PROFILE_LUCK_TEMPLATE.format_map(luck_status),
+                'inline': False
+            }]
+        })
 
-        return embed
+# Rarity of every droppable item: item name -> rarity
+ITEM_RARITY = {
+    **{name: data["rarity"] for name, data in WEAPONS.items()},
+    **{name: data["rarity"] for name, data in ARMOR.items()},
+    "Reality Stone": "omnipotent",
+    "World Ender": "omnipotent"
+}
+
+# Equipment slot for every equippable item: item name -> slot
+ITEM_SLOT_MAP = {
+    **dict.fromkeys(WEAPONS, "weapon"),
+    **dict.fromkeys(ARMOR, "armor"),
+    **{name: data["type"] for name, data in OMNIPOTENT_ITEM.items()},
+    "Lucky Charm": "accessory"
+}
+
+# Rarity sampler over RARITY_WEIGHTS
+_RARITY_TABLE = AliasTable(tuple(RARITY_WEIGHTS.keys()), tuple(RARITY_WEIGHTS.values()))
+
+def _names_by_rarity(items):
+    """Group item names by rarity: rarity -> tuple of names."""
+    grouped = {}
+    for name, data in items.items():
+        grouped.setdefault(data["rarity"], []).append(name)
+    return {rarity: tuple(names) for rarity, names in grouped.items()}
+
+_WEAPONS_BY_RARITY = _names_by_rarity(WEAPONS)
+_ARMOR_BY_RARITY = _names_by_rarity(ARMOR)
 
 def generate_random_item():
     """Generate a random item with rarity."""
     # Choose item type
-    item_type = random.choice(["weapon", "armor"])
+    if random.random() < 0.5:
+        source, by_rarity = WEAPONS, _WEAPONS_BY_RARITY
+    else:
+        source, by_rarity = ARMOR, _ARMOR_BY_RARITY
     
     # Choose rarity based on weights
-    rarity_list = []
-    for rarity, weight in RARITY_WEIGHTS.items():
-        rarity_list.extend([rarity] * int(weight * 100))
+    chosen_rarity = _RARITY_TABLE.sample()
     
-    chosen_rarity = random.choice(rarity_list)
-    
-    # Get items of chosen rarity
-    if item_type == "weapon":
-        items = {k: v for k, v in WEAPONS.items() if v["rarity"] == chosen_rarity}
-    else:
-        items = {k: v for k, v in ARMOR.items() if v["rarity"] == chosen_rarity}
-    
-    if not items:
-        # Fallback to common items
-        if item_type == "weapon":
-            items = {k: v for k, v in WEAPONS.items() if v["rarity"] == "common"}
-        else:
-            items = {k: v for k, v in ARMOR.items() if v["rarity"] == "common"}
+    # Get items of chosen rarity, falling back to common items
+    names = by_rarity.get(chosen_rarity) or by_rarity["common"]
     
-    item_name = random.choice(list(items.keys()))
-    return item_name, items[item_name]
+    item_name = random.choice(names)
+    return item_name, source[item_name]
+
+def _build_loot_weights():
+    """Flatten generate_random_item's odds into per-name cumulative weights."""
+    total = sum(RARITY_WEIGHTS.values())
+    weights = {}
+    for by_rarity in (_WEAPONS_BY_RARITY, _ARMOR_BY_RARITY):
+        for rarity, weight in RARITY_WEIGHTS.items():
+            names = by_rarity.get(rarity) or by_rarity["common"]
+            share = 0.5 * weight / total / len(names)
+            for name in names:
+                weights[name] = weights.get(name, 0.0) + share
+
+    names = tuple(weights)
+    cum_weights = []
+    running = 0.0
+    for name in names:
+        running += weights[name]
+        cum_weights.append(running)
+    return names, tuple(cum_weights)
+
+# Every weapon and armor name with the same odds as generate_random_item
+_LOOT_NAMES, _LOOT_CUM_WEIGHTS = _build_loot_weights()
+
+# Emoji shown next to each rarity
+RARITY_EMOJIS = {
+    "common": "⚪",
+    "uncommon": "🟢", 
+    "rare": "🔵",
+    "epic": "🟣",
+    "legendary": "🟠",
+    "mythic": "🔴",
+    "divine": "🟡",
+    "omnipotent": "💖"
+}
 
 def get_rarity_emoji(rarity):
     """Get emoji for rarity."""
-    emojis = {
-        "common": "⚪",
-        "uncommon": "🟢", 
-        "rare": "🔵",
-        "epic": "🟣",
-        "legendary": "🟠",
-        "mythic": "🔴",
-        "divine": "🟡",
-        "omnipotent": "💖"
-    }
-    return emojis.get(rarity, "⚪")
+    return RARITY_EMOJIS.get(rarity, "⚪")
+
+# Rarity overview for $rarity with no item
+_RARITY_OVERVIEW = "".join(
+    f"{get_rarity_emoji(rarity)} **{rarity.title()}** - {RARITY_WEIGHTS.get(rarity, 0)}% chance\n"
+    for rarity in RARITY_COLORS
+)
+
+# Static command embeds; from_dict shares nested lists with these, so never add fields to the result
+_RARITY_EMBED_TEMPLATE = {
+    'title': "🌟 Rarity System",
+    'description': "Items have different rarities that affect their power:",
+    'color': COLORS['primary'],
+    'fields': [
+        {'name': "🎲 Rarity Levels", 'value': _RARITY_OVERVIEW, 'inline': False},
+        {
+            'name': "✨ Special Items",
+            'value': "🔥 **World Ender** - Omnipotent weapon that can one-shot anything\n"
+                     "💎 **Reality Stone** - Grants power to have any item (except World Ender)",
+            'inline': False
+        }
+    ]
+}
+_LOOTBOX_EMBED_TEMPLATE = {
+    'title': "🎁 Lootbox System",
+    'description': "Open lootboxes to get random rewards!\n\n"
+                   "**Possible Rewards:**\n"
+                   "• Coins (100-1000)\n"
+                   "• Random weapons and armor\n"
+                   "• Super rare items (0.1% chance)\n\n"
+                   "Buy lootboxes from the shop for 1000 coins!",
+    'color': COLORS['warning']
+}
+_TRADE_EMBED_TEMPLATE = {'title': "🤝 Trade System", 'color': COLORS['primary']}
+_TRADE_DESCRIPTION_TEMPLATE = (
+    "Trade between {trader1} and {trader2}\n\n"
+    "**Instructions:**\n"
+    "1. Add items and coins you want to trade\n"
+    "2. Both players click Ready when satisfied\n"
+    "3. Trade will be executed automatically\n\n"
+    "**Current Trade:**\nEmpty"
+)
 
 class AdventureView(discord.ui.View):
     """Interactive adventure view."""
@@ -367,8 +527,8 @@ class AdventureView(discord.ui.View):
 
             # Add items to inventory
             if items_found:
-                inventory = player_data.get('inventory', [])
-                inventory.extend(items_found)
+                inventory = player_data.get('inventory', {})
+                add_inventory_items(inventory, *items_found)
                 player_data['inventory'] = inventory
 
             # Check for level up
@@ -377,32 +537,22 @@ class AdventureView(discord.ui.View):
             update_user_rpg_data(self.user_id, player_data)
 
             # Create result embed
-            embed = discord.Embed(
-                title=f"🗺️ Adventure Complete - {location}",
-                description=outcome['description'],
-                color=COLORS['success']
-            )
-
-            embed.add_field(
-                name="💰 Rewards",
-                value=f"**Coins:** {format_number(coins_earned)}\n"
-                      f"**XP:** {xp_earned}",
-                inline=True
-            )
-
+            fields = [{
+                'name': "💰 Rewards",
+                'value': _ADVENTURE_REWARDS_TEMPLATE.format(coins=format_number(coins_earned), xp=xp_earned),
+                'inline': True
+            }]
             if items_found:
-                embed.add_field(
-                    name="📦 Items Found",
-                    value="\n".join([f"• {item}" for item in items_found]),
-                    inline=True
-                )
-
+                fields.append({'name': "📦 Items Found", 'value': "• " + "\n• ".join(items_found), 'inline': True})
             if level_up_msg:
-                embed.add_field(
-                    name="📊 Level Up!",
-                    value=level_up_msg,
-                    inline=False
-                )
+                fields.append({'name': "📊 Level Up!", 'value': level_up_msg, 'inline': False})
+
+            embed = discord.Embed.from_dict({
+                'title': f"🗺️ Adventure Complete - {location}",
+                'description': outcome['description'],
+                'color': COLORS['success'],
+                'fields': fields
+            })
 
             await interaction.followup.send(embed=embed)
 
@@ -479,8 +629,8 @@ class ShopView(discord.ui.View):
             player_data['coins'] = coins - price
 
             # Add item to inventory
-            inventory = player_data.get('inventory', [])
-            inventory.append(item)
+            inventory = player_data.get('inventory', {})
+            add_inventory_items(inventory, item)
             player_data['inventory'] = inventory
 
             # Update database
@@ -513,13 +663,12 @@ class LootboxView(discord.ui.View):
             await interaction.response.send_message("❌ Could not retrieve your data!", ephemeral=True)
             return
 
-        inventory = player_data.get('inventory', [])
-        if "Lootbox" not in inventory:
-            await interaction.response.send_message("❌ You don't have any lootboxes!", ephemeral=True)
-            return
+        inventory = player_data.get('inventory', {})
 
         # Remove lootbox from inventory
-        inventory.remove("Lootbox")
+        if not remove_inventory_item(inventory, "Lootbox"):
+            await interaction.response.send_message("❌ You don't have any lootboxes!", ephemeral=True)
+            return
         player_data['inventory'] = inventory
 
         # Generate loot
@@ -529,21 +678,26 @@ class LootboxView(discord.ui.View):
         # Always get coins
         coins_reward = random.randint(100, 1000)
         
-        # Chance for items
-        for _ in range(3):  # 3 chances for items
-            if roll_with_luck(self.user_id, 0.4):  # 40% chance per roll
-                item_name, item_data = generate_random_item()
-                rewards.append(item_name)
-                inventory.append(item_name)
+        # Luck is read once for every roll below
+        luck_multiplier = get_luck_multiplier(self.user_id, player_data)
+        item_chance = max(0.0, min(1.0, 0.4 * luck_multiplier))  # 40% chance per roll
+        omnipotent_chance = max(0.0, min(1.0, 0.001 * luck_multiplier))  # 0.1% chance
+
+        # Chance for items: 3 rolls, then draw every hit in one call
+        hits = sum(random.random() < item_chance for _ in range(3))
+        if hits:
+            drawn = random.choices(_LOOT_NAMES, cum_weights=_LOOT_CUM_WEIGHTS, k=hits)
+            rewards.extend(drawn)
+            add_inventory_items(inventory, *drawn)
 
         # Super rare chance for omnipotent items
-        if roll_with_luck(self.user_id, 0.001):  # 0.1% chance
+        if random.random() < omnipotent_chance:
             if random.choice([True, False]):
                 rewards.append("World Ender")
-                inventory.append("World Ender")
+                add_inventory_items(inventory, "World Ender")
             else:
                 rewards.append("Reality Stone")
-                inventory.append("Reality Stone")
+                add_inventory_items(inventory, "Reality Stone")
 
         player_data['coins'] = player_data.get('coins', 0) + coins_reward
         player_data['inventory'] = inventory
@@ -559,15 +713,7 @@ class LootboxView(discord.ui.View):
         if rewards:
             items_text = ""
             for item in rewards:
-                if item in WEAPONS:
-                    rarity = WEAPONS[item]["rarity"]
-                elif item in ARMOR:
-                    rarity = ARMOR[item]["rarity"]
-                elif item == "Reality Stone":
-                    rarity = "omnipotent"
-                else:
-                    rarity = "common"
-                
+                rarity = ITEM_RARITY.get(item, "common")
                 emoji = get_rarity_emoji(rarity)
                 items_text += f"{emoji} **{item}** ({rarity})\n"
             
@@ -576,7 +722,7 @@ class LootboxView(discord.ui.View):
         button.disabled = True
         await interaction.response.edit_message(embed=embed, view=self)
 
-class PvPView(discord.ui.View):
+class PvPView(RPGView):
     """PvP battle view."""
 
     def __init__(self, challenger_id: str, target_id: str, arena: str):
@@ -586,6 +732,11 @@ class PvPView(discord.ui.View):
         self.arena = arena
         self.accepted = False
 
+        # Arena stakes are fixed for the life of the challenge
+        arena_data = PVP_ARENAS[arena]
+        self.entry_fee = arena_data["entry_fee"]
+        self.winner_reward = self.entry_fee * arena_data["winner_multiplier"]
+
     @discord.ui.button(label="⚔️ Accept Challenge", style=discord.ButtonStyle.success)
     async def accept_challenge(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Accept the PvP challenge."""
@@ -593,7 +744,14 @@ class PvPView(discord.ui.View):
             await interaction.response.send_message("❌ This challenge is not for you!", ephemeral=True)
             return
 
+        # A second click can arrive before the first one disables the buttons
+        if self.accepted:
+            await interaction.response.send_message("❌ This challenge was already accepted!", ephemeral=True)
+            return
+
         self.accepted = True
+        # The challenge may have waited minutes, so warm both profiles now rather than at issue time
+        await prefetch_user_rpg_data(self.challenger_id, self.target_id)
         await self.start_pvp_battle(interaction)
 
     @discord.ui.button(label="❌ Decline", style=discord.ButtonStyle.danger)
@@ -609,8 +767,7 @@ class PvPView(discord.ui.View):
             color=COLORS['error']
         )
         
-        for item in self.children:
-            item.disabled = True
+        self.disable_all()
             
         await interaction.response.edit_message(embed=embed, view=self)
 
@@ -624,47 +781,28 @@ class PvPView(discord.ui.View):
             return
 
         # Calculate battle stats
-        challenger_attack = challenger_data.get('attack', 10)
-        challenger_hp = challenger_data.get('hp', 100)
-        challenger_defense = challenger_data.get('defense', 5)
-
-        target_attack = target_data.get('attack', 10)
-        target_hp = target_data.get('hp', 100)
-        target_defense = target_data.get('defense', 5)
+        challenger = PlayerStats.from_data(challenger_data)
+        target = PlayerStats.from_data(target_data)
 
         # Check for super rare weapons
-        challenger_inventory = challenger_data.get('inventory', [])
-        target_inventory = target_data.get('inventory', [])
-
-        if "World Ender" in challenger_inventory:
-            challenger_attack = 999999
-        if "World Ender" in target_inventory:
-            target_attack = 999999
+        if "World Ender" in challenger_data.get('inventory', {}):
+            challenger.attack = 999999
+        if "World Ender" in target_data.get('inventory', {}):
+            target.attack = 999999
 
         # Battle simulation
-        battle_log = []
-        turn = 1
-        
-        while challenger_hp > 0 and target_hp > 0 and turn <= 10:
-            # Challenger attacks
-            damage = calculate_battle_damage(challenger_attack, target_defense)
-            target_hp -= damage
-            battle_log.append(f"Round {turn}: Challenger deals {damage} damage!")
-            
-            if target_hp <= 0:
-                break
-                
-            # Target attacks
-            damage = calculate_battle_damage(target_attack, challenger_defense)
-            challenger_hp -= damage
-            battle_log.append(f"Round {turn}: Target deals {damage} damage!")
-            
-            turn += 1
+        challenger_hp, target_hp, hits = simulate_battle(
+            challenger.attack, challenger.defense, challenger.hp,
+            target.attack, target.defense, target.hp
+        )
+        battle_log = [
+            f"Round {turn}: {'Challenger' if attacker == 0 else 'Target'} deals {damage} damage!"
+            for turn, attacker, damage in hits
+        ]
 
         # Determine winner
-        arena_data = PVP_ARENAS[self.arena]
-        entry_fee = arena_data["entry_fee"]
-        winner_reward = entry_fee * arena_data["winner_multiplier"]
+        entry_fee = self.entry_fee
+        winner_reward = self.winner_reward
 
         if challenger_hp > target_hp:
             winner = self.challenger_id
@@ -679,18 +817,14 @@ class PvPView(discord.ui.View):
 
         # Update winner's data
         winner_data['coins'] = winner_data.get('coins', 0) + winner_reward
-        winner_stats = winner_data.get('stats', {})
-        winner_stats['pvp_wins'] = winner_stats.get('pvp_wins', 0) + 1
-        winner_data['stats'] = winner_stats
+        bump_stat(winner_data, 'pvp_wins')
 
         # Update loser's data
         loser_data['coins'] = max(0, loser_data.get('coins', 0) - entry_fee)
-        loser_stats = loser_data.get('stats', {})
-        loser_stats['pvp_losses'] = loser_stats.get('pvp_losses', 0) + 1
-        loser_data['stats'] = loser_stats
+        bump_stat(loser_data, 'pvp_losses')
 
-        update_user_rpg_data(winner, winner_data)
-        update_user_rpg_data(loser, loser_data)
+        # Credit and debit together so one can't land without the other
+        update_user_rpg_data_batch({winner: winner_data, loser: loser_data})
 
         # Create result embed
         embed = discord.Embed(
@@ -702,12 +836,11 @@ class PvPView(discord.ui.View):
         battle_text = "\n".join(battle_log[:6])  # Show first 6 rounds
         embed.add_field(name="🥊 Battle Log", value=battle_text, inline=False)
 
-        for item in self.children:
-            item.disabled = True
+        self.disable_all()
 
         await interaction.response.edit_message(embed=embed, view=self)
 
-class TradeView(discord.ui.View):
+class TradeView(RPGView):
     """Trading system view."""
 
     def __init__(self, trader1_id: str, trader2_id: str):
@@ -755,6 +888,8 @@ class TradeView(discord.ui.View):
             return
 
         if self.trader1_ready and self.trader2_ready:
+            # The trade may have been open for minutes, so warm both profiles now
+            await prefetch_user_rpg_data(self.trader1_id, self.trader2_id)
             await self.execute_trade(interaction)
         else:
             await interaction.response.send_message("✅ You are ready! Waiting for the other trader...", ephemeral=True)
@@ -768,8 +903,7 @@ class TradeView(discord.ui.View):
             color=COLORS['error']
         )
         
-        for item in self.children:
-            item.disabled = True
+        self.disable_all()
             
         await interaction.response.edit_message(embed=embed, view=self)
 
@@ -791,12 +925,11 @@ class TradeView(discord.ui.View):
             color=COLORS['success']
         )
 
-        for item in self.children:
-            item.disabled = True
+        self.disable_all()
 
         await interaction.response.edit_message(embed=embed, view=self)
 
-class BattleView(discord.ui.View):
+class BattleView(RPGView):
     """Interactive battle view."""
 
     def __init__(self, user_id: str, enemy_data: Dict[str, Any]):
@@ -822,109 +955,133 @@ class BattleView(discord.ui.View):
     async def process_battle_action(self, interaction: discord.Interaction, action: str):
         """Process battle action."""
         try:
-            player_data = get_user_rpg_data(self.user_id)
-            if not player_data:
+            # One read and one write for the whole turn
+            with rpg_session(self.user_id) as player_data:
+                build_embed = self.resolve_turn(player_data, action) if player_data else None
+
+            if build_embed is None:
                 await interaction.response.send_message("❌ Could not retrieve your data!", ephemeral=True)
                 return
 
-            player_hp = player_data.get('hp', 100)
-            player_attack = player_data.get('attack', 10)
-            player_defense = player_data.get('defense', 5)
+            await interaction.response.edit_message(embed=build_embed(), view=self)
 
-            enemy_hp = self.enemy_data.get('hp', 50)
-            enemy_attack = self.enemy_data.get('attack', 8)
+        except Exception as e:
+            logger.error(f"Battle error: {e}")
+            await interaction.response.send_message("❌ Battle error! Please try again.", ephemeral=True)
 
-            battle_result = ""
+    def resolve_turn(self, player_data: Dict[str, Any], action: str) -> Callable[[], discord.Embed]:
+        """Play one turn against the enemy, updating player_data.
+        
+        Returns a builder for the result embed, so it is only made once the data is saved.
+        """
+        player_hp = player_data.get('hp', 100)
+        player_attack = player_data.get('attack', 10)
+        player_defense = player_data.get('defense', 5)
+
+        enemy_hp = self.enemy_data.get('hp', 50)
+        enemy_attack = self.enemy_data.get('attack', 8)
+
+        battle_result = ""
+
+        if action == "attack":
+            # Player attacks
+            damage = calculate_battle_damage(player_attack, 0)
+            enemy_hp -= damage
+            battle_result += f"You dealt {damage} damage to {self.enemy_data['name']}!\n"
+
+            # Enemy attacks back if still alive
+            if enemy_hp > 0:
+                enemy_damage = calculate_battle_damage(enemy_attack, player_defense)
+                player_hp -= enemy_damage
+                battle_result += f"{self.enemy_data['name']} dealt {enemy_damage} damage to you!\n"
 
-            if action == "attack":
-                # Player attacks
-                damage = calculate_battle_damage(player_attack, 0)
-                enemy_hp -= damage
-                battle_result += f"You dealt {damage} damage to {self.enemy_data['name']}!\n"
+        elif action == "defend":
+            # Reduced damage when defending
+            enemy_damage = calculate_battle_damage(enemy_attack, player_defense * 2)
+            player_hp -= enemy_damage
+            battle_result += f"You defended! {self.enemy_data['name']} dealt {enemy_damage} damage!\n"
 
-                # Enemy attacks back if still alive
-                if enemy_hp > 0:
-                    enemy_damage = calculate_battle_damage(enemy_attack, player_defense)
-                    player_hp -= enemy_damage
-                    battle_result += f"{self.enemy_data['name']} dealt {enemy_damage} damage to you!\n"
+        # Check battle outcome
+        if enemy_hp <= 0:
+            # Victory
+            coins_reward = _VICTORY_COINS[0] + int(_random() * _VICTORY_COINS[1])
+            xp_reward = _VICTORY_XP[0] + int(_random() * _VICTORY_XP[1])
 
-            elif action == "defend":
-                # Reduced damage when defending
-                enemy_damage = calculate_battle_damage(enemy_attack, player_defense * 2)
-                player_hp -= enemy_damage
-                battle_result += f"You defended! {self.enemy_data['name']} dealt {enemy_damage} damage!\n"
-
-            # Check battle outcome
-            if enemy_hp <= 0:
-                # Victory
-                coins_reward = random.randint(50, 150)
-                xp_reward = random.randint(20, 50)
-                
-                player_data['coins'] = player_data.get('coins', 0) + coins_reward
-                player_data['xp'] = player_data.get('xp', 0) + xp_reward
-                
-                stats = player_data.get('stats', {})
-                stats['battles_won'] = stats.get('battles_won', 0) + 1
-                player_data['stats'] = stats
-
-                embed = discord.Embed(
-                    title="🎉 Victory!",
-                    description=f"{battle_result}\n**You defeated {self.enemy_data['name']}!**\n\n"
-                               f"**Rewards:**\n"
-                               f"Coins: {format_number(coins_reward)}\n"
-                               f"XP: {xp_reward}",
-                    color=COLORS['success']
-                )
-
-                # Disable all buttons
-                for item in self.children:
-                    item.disabled = True
-
-            elif player_hp <= 0:
-                # Defeat
-                player_data['hp'] = 0
-                stats = player_data.get('stats', {})
-                stats['battles_lost'] = stats.get('battles_lost', 0) + 1
-                player_data['stats'] = stats
-
-                embed = discord.Embed(
-                    title="💀 Defeat!",
-                    description=f"{battle_result}\n**You were defeated by {self.enemy_data['name']}!**\n\n"
-                               f"You need to heal before your next battle.",
-                    color=COLORS['error']
-                )
-
-                # Disable all buttons
-                for item in self.children:
-                    item.disabled = True
+            player_data['coins'] = player_data.get('coins', 0) + coins_reward
+            player_data['xp'] = player_data.get('xp', 0) + xp_reward
 
-            else:
-                # Battle continues
-                self.enemy_data['hp'] = enemy_hp
-                player_data['hp'] = player_hp
-
-                embed = discord.Embed(
-                    title=f"⚔️ Battle vs {self.enemy_data['name']}",
-                    description=f"{battle_result}\n\n"
-                               f"**Your HP:** {player_hp}/{player_data.get('max_hp', 100)}\n"
-                               f"**{self.enemy_data['name']} HP:** {enemy_hp}/{self.enemy_data.get('max_hp', enemy_hp)}",
-                    color=COLORS['warning']
-                )
+            bump_stat(player_data, 'battles_won')
 
-            # Update player data
-            update_user_rpg_data(self.user_id, player_data)
+            build_embed = partial(self.victory_embed, battle_result, coins_reward, xp_reward)
 
-            await interaction.response.edit_message(embed=embed, view=self)
+            # Disable all buttons
+            self.disable_all()
 
-        except Exception as e:
-            logger.error(f"Battle error: {e}")
-            await interaction.response.send_message("❌ Battle error! Please try again.", ephemeral=True)
+        elif player_hp <= 0:
+            # Defeat
+            player_data['hp'] = 0
+            bump_stat(player_data, 'battles_lost')
+
+            build_embed = partial(self.defeat_embed, battle_result)
+
+            # Disable all buttons
+            self.disable_all()
+
+        else:
+            # Battle continues
+            self.enemy_data['hp'] = enemy_hp
+            player_data['hp'] = player_hp
+
+            build_embed = partial(self.turn_embed, battle_result, player_hp, player_data.get('max_hp', 100), enemy_hp)
+
+        return build_embed
+
+    def victory_embed(self, battle_result: str, coins_reward: int, xp_reward: int) -> discord.Embed:
+        """Build the embed for a won battle."""
+        return discord.Embed(
+            title="🎉 Victory!",
+            description=f"{battle_result}\n**You defeated {self.enemy_data['name']}!**\n\n"
+                       f"**Rewards:**\n"
+                       f"Coins: {format_number(coins_reward)}\n"
+                       f"XP: {xp_reward}",
+            color=COLORS['success']
+        )
+
+    def defeat_embed(self, battle_result: str) -> discord.Embed:
+        """Build the embed for a lost battle."""
+        return discord.Embed(
+            title="💀 Defeat!",
+            description=f"{battle_result}\n**You were defeated by {self.enemy_data['name']}!**\n\n"
+                       f"You need to heal before your next battle.",
+            color=COLORS['error']
+        )
+
+    def turn_embed(self, battle_result: str, player_hp: int, player_max_hp: int, enemy_hp: int) -> discord.Embed:
+        """Build the embed for a battle that goes on."""
+        return discord.Embed(
+            title=f"⚔️ Battle vs {self.enemy_data['name']}",
+            description=f"{battle_result}\n\n"
+                       f"**Your HP:** {player_hp}/{player_max_hp}\n"
+                       f"**{self.enemy_data['name']} HP:** {enemy_hp}/{self.enemy_data.get('max_hp', enemy_hp)}",
+            color=COLORS['warning']
+        )
 
 class RPGGamesCog(commands.Cog):
     """RPG Games system for the bot."""
 
     def __init__(self, bot):
         self.bot = bot
+        self._leaderboard_warmup: Optional[asyncio.Task] = None
+
+    async def cog_load(self):
+        """Coalesce RPG data writes while the cog is loaded."""
+        start_rpg_write_flusher()
+        # Scan in the background so the first /leaderboard doesn't pay for it
+        self._leaderboard_warmup = asyncio.create_task(warm_leaderboard_snapshot())
+
+    async def cog_unload(self):
+        """Write out coalesced RPG data before the cog goes away."""
+        stop_rpg_write_flusher()
 
     # Slash command versions
     @app_commands.command(name="profile", description="View your character profile")
@@ -938,6 +1095,7 @@ class RPGGamesCog(commands.Cog):
         target = member or interaction.user
         user_id = str(target.id)
 
+        await prefetch_user_rpg_data(user_id)
         if not ensure_user_exists(user_id):
             await interaction.response.send_message(f"❌ {target.display_name} hasn't started their adventure yet!", ephemeral=True)
             return
@@ -970,17 +1128,7 @@ class RPGGamesCog(commands.Cog):
         if create_user_profile(user_id):
             embed = create_embed(
                 "🎉 Adventure Started!",
-                f"Welcome to your RPG adventure, {interaction.user.mention}!\n\n"
-                f"**Starting Stats:**\n"
-                f"• Level: 1\n"
-                f"• HP: 100/100\n"
-                f"• Attack: 10\n"
-                f"• Defense: 5\n"
-                f"• Coins: 100\n\n"
-                f"Use `/profile` to view your character\n"
-                f"Use `$adventure` to start exploring\n"
-                f"Use `$work` to earn coins\n"
-                f"Use `$shop` to buy equipment",
+                _START_TEMPLATE.format(mention=interaction.user.mention, profile_command="/profile"),
                 COLORS['success']
             )
             await interaction.response.send_message(embed=embed)
@@ -1004,17 +1152,7 @@ class RPGGamesCog(commands.Cog):
         if create_user_profile(user_id):
             embed = create_embed(
                 "🎉 Adventure Started!",
-                f"Welcome to your RPG adventure, {ctx.author.mention}!\n\n"
-                f"**Starting Stats:**\n"
-                f"• Level: 1\n"
-                f"• HP: 100/100\n"
-                f"• Attack: 10\n"
-                f"• Defense: 5\n"
-                f"• Coins: 100\n\n"
-                f"Use `$profile` to view your character\n"
-                f"Use `$adventure` to start exploring\n"
-                f"Use `$work` to earn coins\n"
-                f"Use `$shop` to buy equipment",
+                _START_TEMPLATE.format(mention=ctx.author.mention, profile_command="$profile"),
                 COLORS['success']
             )
             await ctx.send(embed=embed)
@@ -1030,6 +1168,7 @@ class RPGGamesCog(commands.Cog):
         target = member or ctx.author
         user_id = str(target.id)
 
+        await prefetch_user_rpg_data(user_id)
         if not ensure_user_exists(user_id):
             await ctx.send(f"❌ {target.display_name} hasn't started their adventure yet!")
             return
@@ -1046,6 +1185,7 @@ class RPGGamesCog(commands.Cog):
 
     @commands.command(name='adventure', help='Go on an adventure')
     @commands.cooldown(1, RPG_CONSTANTS['adventure_cooldown'], commands.BucketType.user)
+    @commands.max_concurrency(1, commands.BucketType.user, wait=False)
     async def adventure_command(self, ctx):
         """Go on an adventure."""
         if not is_module_enabled("rpg", ctx.guild.id):
@@ -1053,6 +1193,7 @@ class RPGGamesCog(commands.Cog):
 
         user_id = str(ctx.author.id)
 
+        await prefetch_user_rpg_data(user_id)
         if not ensure_user_exists(user_id):
             await ctx.send("❌ You need to start your adventure first! Use `$start` command.")
             return
@@ -1069,6 +1210,7 @@ class RPGGamesCog(commands.Cog):
 
     @commands.command(name='work', help='Work to earn coins')
     @commands.cooldown(1, RPG_CONSTANTS['work_cooldown'], commands.BucketType.user)
+    @commands.max_concurrency(1, commands.BucketType.user, wait=False)
     async def work_command(self, ctx):
         """Work to earn coins."""
         if not is_module_enabled("rpg", ctx.guild.id):
@@ -1076,26 +1218,14 @@ class RPGGamesCog(commands.Cog):
 
         user_id = str(ctx.author.id)
 
+        await prefetch_user_rpg_data(user_id)
         if not ensure_user_exists(user_id):
             await ctx.send("❌ You need to start your adventure first! Use `$start` command.")
             return
 
-        player_data = get_user_rpg_data(user_id)
-        if not player_data:
-            await ctx.send("❌ Could not retrieve your data.")
-            return
-
-        # Work jobs
-        jobs = [
-            {"name": "Mining", "coins": (50, 100), "xp": (5, 15)},
-            {"name": "Farming", "coins": (30, 80), "xp": (3, 10)},
-            {"name": "Trading", "coins": (70, 120), "xp": (8, 20)},
-            {"name": "Blacksmithing", "coins": (60, 110), "xp": (6, 18)}
-        ]
-
-        job = random.choice(jobs)
-        coins_earned = random.randint(*job['coins'])
-        xp_earned = random.randint(*job['xp'])
+        job = random.choice(_WORK_JOBS)
+        coins_earned = job['coins'][0] + int(_random() * job['_coins_span'])
+        xp_earned = job['xp'][0] + int(_random() * job['_xp_span'])
 
         # Apply luck bonus
         enhanced_rewards = generate_loot_with_luck(user_id, {
@@ -1103,14 +1233,18 @@ class RPGGamesCog(commands.Cog):
             'xp': xp_earned
         })
 
-        player_data['coins'] = player_data.get('coins', 0) + enhanced_rewards['coins']
-        player_data['xp'] = player_data.get('xp', 0) + enhanced_rewards['xp']
-        player_data['work_count'] = player_data.get('work_count', 0) + 1
+        with rpg_session(user_id) as player_data:
+            if player_data:
+                player_data['coins'] = player_data.get('coins', 0) + enhanced_rewards['coins']
+                player_data['xp'] = player_data.get('xp', 0) + enhanced_rewards['xp']
+                player_data['work_count'] = player_data.get('work_count', 0) + 1
 
-        # Check for level up
-        level_up_msg = level_up_player(player_data)
+                # Check for level up
+                level_up_msg = level_up_player(player_data)
 
-        update_user_rpg_data(user_id, player_data)
+        if not player_data:
+            await ctx.send("❌ Could not retrieve your data.")
+            return
 
         embed = create_embed(
             f"💼 Work Complete - {job['name']}",
@@ -1136,6 +1270,7 @@ class RPGGamesCog(commands.Cog):
 
         user_id = str(ctx.author.id)
 
+        await prefetch_user_rpg_data(user_id)
         if not ensure_user_exists(user_id):
             await ctx.send("❌ You need to start your adventure first! Use `$start` command.")
             return
@@ -1155,6 +1290,7 @@ class RPGGamesCog(commands.Cog):
 
     @commands.command(name='battle', help='Battle a monster')
     @commands.cooldown(1, RPG_CONSTANTS['battle_cooldown'], commands.BucketType.user)
+    @commands.max_concurrency(1, commands.BucketType.user, wait=False)
     async def battle_command(self, ctx):
         """Start a battle with a monster."""
         if not is_module_enabled("rpg", ctx.guild.id):
@@ -1162,6 +1298,7 @@ class RPGGamesCog(commands.Cog):
 
         user_id = str(ctx.author.id)
 
+        await prefetch_user_rpg_data(user_id)
         if not ensure_user_exists(user_id):
             await ctx.send("❌ You need to start your adventure first! Use `$start` command.")
             return
@@ -1171,25 +1308,19 @@ class RPGGamesCog(commands.Cog):
             await ctx.send("❌ Could not retrieve your data.")
             return
 
-        if player_data.get('hp', 0) <= 0:
+        hp = player_data.get('hp', 0)
+        if hp <= 0:
             await ctx.send("❌ You need to heal before you can battle!")
             return
 
         # Generate random monster
-        monsters = [
-            {"name": "Goblin", "hp": 30, "attack": 8, "max_hp": 30},
-            {"name": "Orc", "hp": 50, "attack": 12, "max_hp": 50},
-            {"name": "Skeleton", "hp": 40, "attack": 10, "max_hp": 40},
-            {"name": "Troll", "hp": 80, "attack": 15, "max_hp": 80}
-        ]
-
-        enemy = random.choice(monsters)
+        enemy = dict(random.choice(_MONSTERS))
 
         view = BattleView(user_id, enemy)
         embed = discord.Embed(
             title=f"⚔️ Battle vs {enemy['name']}",
             description=f"A wild {enemy['name']} appears!\n\n"
-                       f"**Your HP:** {player_data.get('hp', 100)}/{player_data.get('max_hp', 100)}\n"
+                       f"**Your HP:** {hp}/{player_data.get('max_hp', 100)}\n"
                        f"**{enemy['name']} HP:** {enemy['hp']}/{enemy['max_hp']}\n\n"
                        f"Choose your action:",
             color=COLORS['warning']
@@ -1198,6 +1329,7 @@ class RPGGamesCog(commands.Cog):
         await ctx.send(embed=embed, view=view)
 
     @commands.command(name='equip', help='Equip an item')
+    @commands.max_concurrency(1, commands.BucketType.user, wait=False)
     async def equip_command(self, ctx, *, item_name: str):
         """Equip an item."""
         if not is_module_enabled("rpg", ctx.guild.id):
@@ -1205,6 +1337,7 @@ class RPGGamesCog(commands.Cog):
 
         user_id = str(ctx.author.id)
 
+        await prefetch_user_rpg_data(user_id)
         if not ensure_user_exists(user_id):
             await ctx.send("❌ You need to start your adventure first! Use `$start` command.")
             return
@@ -1214,21 +1347,19 @@ class RPGGamesCog(commands.Cog):
             await ctx.send("❌ Could not retrieve your data.")
             return
 
-        inventory = player_data.get('inventory', [])
+        inventory = player_data.get('inventory', {})
         
         if item_name not in inventory:
             await ctx.send(f"❌ You don't have **{item_name}** in your inventory!")
             return
 
-        # Simple equipment logic
+        slot = ITEM_SLOT_MAP.get(item_name)
+        if slot is None:
+            await ctx.send(f"❌ **{item_name}** is not equippable!")
+            return
+
         equipped = player_data.get('equipped', {})
-        
-        if 'Sword' in item_name:
-            equipped['weapon'] = item_name
-        elif 'Armor' in item_name:
-            equipped['armor'] = item_name
-        elif 'Charm' in item_name:
-            equipped['accessory'] = item_name
+        equipped[slot] = item_name
 
         player_data['equipped'] = equipped
         update_user_rpg_data(user_id, player_data)
@@ -1249,6 +1380,7 @@ class RPGGamesCog(commands.Cog):
 
         user_id = str(ctx.author.id)
 
+        await prefetch_user_rpg_data(user_id)
         if not ensure_user_exists(user_id):
             await ctx.send("❌ You need to start your adventure first! Use `$start` command.")
             return
@@ -1258,7 +1390,7 @@ class RPGGamesCog(commands.Cog):
             await ctx.send("❌ Could not retrieve your data.")
             return
 
-        inventory = player_data.get('inventory', [])
+        inventory = player_data.get('inventory', {})
         
         if not inventory:
             await ctx.send("❌ Your inventory is empty!")
@@ -1271,8 +1403,8 @@ class RPGGamesCog(commands.Cog):
 
         # Show items
         items_text = ""
-        for i, item in enumerate(inventory[:20], 1):  # Show first 20 items
-            items_text += f"{i}. {item}\n"
+        for i, (item, count) in enumerate(sorted(inventory.items())[:20], 1):  # Show first 20 items
+            items_text += f"{i}. {item} x{count}\n" if count > 1 else f"{i}. {item}\n"
 
         if len(inventory) > 20:
             items_text += f"... and {len(inventory) - 20} more items"
@@ -1286,6 +1418,7 @@ class RPGGamesCog(commands.Cog):
         await ctx.send(embed=embed)
 
     @commands.command(name='heal', help='Heal your character')
+    @commands.max_concurrency(1, commands.BucketType.user, wait=False)
     async def heal_command(self, ctx):
         """Heal character."""
         if not is_module_enabled("rpg", ctx.guild.id):
@@ -1293,34 +1426,34 @@ class RPGGamesCog(commands.Cog):
 
         user_id = str(ctx.author.id)
 
+        await prefetch_user_rpg_data(user_id)
         if not ensure_user_exists(user_id):
             await ctx.send("❌ You need to start your adventure first!")
             return
 
-        player_data = get_user_rpg_data(user_id)
-        if not player_data:
-            await ctx.send("❌ Could not retrieve your data.")
-            return
+        heal_cost = RPG_CONSTANTS['heal_cost']
+        error = None
 
-        hp = player_data.get('hp', 100)
-        max_hp = player_data.get('max_hp', 100)
-        coins = player_data.get('coins', 0)
+        with rpg_session(user_id) as player_data:
+            if not player_data:
+                error = "❌ Could not retrieve your data."
+            else:
+                max_hp = player_data.get('max_hp', 100)
+                coins = player_data.get('coins', 0)
 
-        if hp >= max_hp:
-            await ctx.send("❌ You're already at full health!")
-            return
+                if player_data.get('hp', 100) >= max_hp:
+                    error = "❌ You're already at full health!"
+                elif coins < heal_cost:
+                    error = f"❌ You need {heal_cost} coins to heal! You have {coins} coins."
+                else:
+                    # Heal player
+                    player_data['hp'] = max_hp
+                    player_data['coins'] = coins - heal_cost
 
-        heal_cost = RPG_CONSTANTS['heal_cost']
-        if coins < heal_cost:
-            await ctx.send(f"❌ You need {heal_cost} coins to heal! You have {coins} coins.")
+        if error:
+            await ctx.send(error)
             return
 
-        # Heal player
-        player_data['hp'] = max_hp
-        player_data['coins'] = coins - heal_cost
-
-        update_user_rpg_data(user_id, player_data)
-
         embed = create_embed(
             "❤️ Healed!",
             f"You've been fully healed for {heal_cost} coins!\n"
@@ -1331,7 +1464,7 @@ class RPGGamesCog(commands.Cog):
         await ctx.send(embed=embed)
 
     @commands.command(name='daily', help='Claim your daily reward')
-    @commands.cooldown(1, 86400, commands.BucketType.user)  # 24 hour cooldown
+    @commands.max_concurrency(1, commands.BucketType.user, wait=False)
     async def daily_command(self, ctx):
         """Claim daily reward."""
         if not is_module_enabled("rpg", ctx.guild.id):
@@ -1339,35 +1472,50 @@ class RPGGamesCog(commands.Cog):
 
         user_id = str(ctx.author.id)
 
+        await prefetch_user_rpg_data(user_id)
         if not ensure_user_exists(user_id):
             await ctx.send("❌ You need to start your adventure first! Use `$start` command.")
             return
 
-        player_data = get_user_rpg_data(user_id)
-        if not player_data:
-            await ctx.send("❌ Could not retrieve your data.")
-            return
+        cooldown_remaining = 0
+        with rpg_session(user_id) as player_data:
+            if player_data:
+                # The cooldown lives on the player record, so it survives restarts
+                last_daily = parse_last_daily(player_data.get('last_daily'))
+                cooldown_remaining = get_time_until_next_use(last_daily, RPG_CONSTANTS['daily_cooldown'])
 
-        # Calculate daily reward
-        level = player_data.get('level', 1)
-        base_reward = 100
-        level_bonus = level * 10
-        streak = player_data.get('daily_streak', 0) + 1
-        streak_bonus = min(streak * 25, 175)  # Max 7 day streak
+            if player_data and cooldown_remaining <= 0:
+                # Calculate daily reward
+                level = player_data.get('level', 1)
+                base_reward = 100
+                level_bonus = level * 10
+                streak = player_data.get('daily_streak', 0) + 1
+                streak_bonus = min(streak * 25, 175)  # Max 7 day streak
 
-        coins_reward = base_reward + level_bonus + streak_bonus
-        xp_reward = 50 + (level * 5)
+                coins_reward = base_reward + level_bonus + streak_bonus
+                xp_reward = 50 + (level * 5)
 
-        # Update player data
-        player_data['coins'] = player_data.get('coins', 0) + coins_reward
-        player_data['xp'] = player_data.get('xp', 0) + xp_reward
-        player_data['daily_streak'] = streak
-        player_data['last_daily'] = datetime.now().isoformat()
+                # Update player data
+                player_data['coins'] = player_data.get('coins', 0) + coins_reward
+                player_data['xp'] = player_data.get('xp', 0) + xp_reward
+                player_data['daily_streak'] = streak
+                player_data['last_daily'] = datetime.now().isoformat()
 
-        # Check for level up
-        level_up_msg = level_up_player(player_data)
+                # Check for level up
+                level_up_msg = level_up_player(player_data)
 
-        update_user_rpg_data(user_id, player_data)
+        if not player_data:
+            await ctx.send("❌ Could not retrieve your data.")
+            return
+
+        if cooldown_remaining > 0:
+            embed = create_embed(
+                "⏰ Daily Cooldown",
+                f"You can claim your daily reward in {format_time_remaining(cooldown_remaining)}",
+                COLORS['warning']
+            )
+            await ctx.send(embed=embed)
+            return
 
         embed = create_embed(
             "🎁 Daily Reward Claimed!",
@@ -1392,6 +1540,7 @@ class RPGGamesCog(commands.Cog):
         target = member or ctx.author
         user_id = str(target.id)
 
+        await prefetch_user_rpg_data(user_id)
         if not ensure_user_exists(user_id):
             await ctx.send(f"❌ {target.display_name} hasn't started their adventure yet!")
             return
@@ -1422,7 +1571,7 @@ class RPGGamesCog(commands.Cog):
             await ctx.send(f"❌ Invalid category! Valid options: {', '.join(valid_categories)}")
             return
 
-        leaderboard = get_leaderboard(category, ctx.guild.id, 10)
+        leaderboard = await get_leaderboard(category, ctx.guild.id, 10)
 
         if not leaderboard:
             await ctx.send("❌ No leaderboard data available yet!")
@@ -1433,25 +1582,31 @@ class RPGGamesCog(commands.Cog):
             color=COLORS['warning']
         )
 
-        description = ""
-        for i, entry in enumerate(leaderboard, 1):
-            try:
-                user = self.bot.get_user(int(entry['user_id']))
-                name = user.display_name if user else "Unknown User"
-                value = entry['value']
-
-                if category == "coins":
-                    value = format_number(value)
+        # Resolve every name up front, fetching uncached users concurrently
+        user_ids = [int(entry['user_id']) for entry in leaderboard]
+        users = {user_id: self.bot.get_user(user_id) for user_id in user_ids}
+        missing = [user_id for user_id, user in users.items() if user is None]
+        if missing:
+            fetched = await asyncio.gather(*(self.bot.fetch_user(user_id) for user_id in missing), return_exceptions=True)
+            for user_id, result in zip(missing, fetched):
+                if isinstance(result, Exception):
+                    logger.warning(f"Could not fetch leaderboard user {user_id}: {result}")
+                else:
+                    users[user_id] = result
 
-                description += f"**{i}.** {name} - {value}\n"
-            except:
-                continue
+        format_value = format_number if category == "coins" else str
+        lines = []
+        for i, (user_id, entry) in enumerate(zip(user_ids, leaderboard), 1):
+            user = users[user_id]
+            name = user.display_name if user else "Unknown User"
+            lines.append(f"**{i}.** {name} - {format_value(entry['value'])}")
 
-        embed.description = description or "No data available"
+        embed.description = "\n".join(lines) or "No data available"
 
         await ctx.send(embed=embed)
 
     @commands.command(name='use', help='Use an item')
+    @commands.max_concurrency(1, commands.BucketType.user, wait=False)
     async def use_command(self, ctx, *, item_name: str):
         """Use an item."""
         if not is_module_enabled("rpg", ctx.guild.id):
@@ -1459,42 +1614,37 @@ class RPGGamesCog(commands.Cog):
 
         user_id = str(ctx.author.id)
 
+        await prefetch_user_rpg_data(user_id)
         if not ensure_user_exists(user_id):
             await ctx.send("❌ You need to start your adventure first! Use `$start` command.")
             return
 
-        player_data = get_user_rpg_data(user_id)
-        if not player_data:
-            await ctx.send("❌ Could not retrieve your data.")
-            return
+        with rpg_session(user_id) as player_data:
+            if player_data:
+                inventory = player_data.get('inventory', {})
+                hp = player_data.get('hp', 100)
+                max_hp = player_data.get('max_hp', 100)
 
-        inventory = player_data.get('inventory', [])
-        
-        if item_name not in inventory:
-            await ctx.send(f"❌ You don't have **{item_name}** in your inventory!")
-            return
+            if not player_data:
+                message = "❌ Could not retrieve your data."
+            elif item_name not in inventory:
+                message = f"❌ You don't have **{item_name}** in your inventory!"
+            elif item_name != "Health Potion":
+                message = f"❌ **{item_name}** is not a usable item!"
+            elif hp >= max_hp:
+                message = "❌ You're already at full health!"
+            else:
+                # Use item effects
+                heal_amount = min(50, max_hp - hp)
+                player_data['hp'] = hp + heal_amount
 
-        # Use item effects
-        if item_name == "Health Potion":
-            hp = player_data.get('hp', 100)
-            max_hp = player_data.get('max_hp', 100)
-            
-            if hp >= max_hp:
-                await ctx.send("❌ You're already at full health!")
-                return
-            
-            heal_amount = min(50, max_hp - hp)
-            player_data['hp'] = hp + heal_amount
-            
-            # Remove item from inventory
-            inventory.remove(item_name)
-            player_data['inventory'] = inventory
-            
-            update_user_rpg_data(user_id, player_data)
-            
-            await ctx.send(f"❤️ You used **{item_name}** and restored {heal_amount} HP!")
-        else:
-            await ctx.send(f"❌ **{item_name}** is not a usable item!")
+                # Remove item from inventory
+                remove_inventory_item(inventory, item_name)
+                player_data['inventory'] = inventory
+
+                message = f"❤️ You used **{item_name}** and restored {heal_amount} HP!"
+
+        await ctx.send(message)
 
     @app_commands.command(name="pay", description="Pay coins to another user")
     @app_commands.describe(user="The user to pay", amount="Amount of coins to pay")
@@ -1514,6 +1664,7 @@ class RPGGamesCog(commands.Cog):
 
         sender_id = str(interaction.user.id)
         receiver_id = str(user.id)
+        await prefetch_user_rpg_data(sender_id, receiver_id)
 
         if not ensure_user_exists(sender_id):
             await interaction.response.send_message("❌ You need to start your adventure first!", ephemeral=True)
@@ -1523,24 +1674,14 @@ class RPGGamesCog(commands.Cog):
             await interaction.response.send_message("❌ The target user needs to start their adventure first!", ephemeral=True)
             return
 
-        sender_data = get_user_rpg_data(sender_id)
-        receiver_data = get_user_rpg_data(receiver_id)
-
-        if not sender_data or not receiver_data:
-            await interaction.response.send_message("❌ Could not retrieve user data!", ephemeral=True)
-            return
-
-        sender_coins = sender_data.get('coins', 0)
-        if sender_coins < amount:
-            await interaction.response.send_message(f"❌ You don't have enough coins! You have {format_number(sender_coins)} coins.", ephemeral=True)
-            return
-
         # Transfer coins
-        sender_data['coins'] = sender_coins - amount
-        receiver_data['coins'] = receiver_data.get('coins', 0) + amount
-
-        update_user_rpg_data(sender_id, sender_data)
-        update_user_rpg_data(receiver_id, receiver_data)
+        transferred, sender_coins = transfer_coins(sender_id, receiver_id, amount)
+        if not transferred:
+            if sender_coins is None:
+                await interaction.response.send_message("❌ Could not retrieve user data!", ephemeral=True)
+            else:
+                await interaction.response.send_message(f"❌ You don't have enough coins! You have {format_number(sender_coins)} coins.", ephemeral=True)
+            return
 
         embed = create_embed(
             "💸 Payment Successful!",
@@ -1551,6 +1692,7 @@ class RPGGamesCog(commands.Cog):
         await interaction.response.send_message(embed=embed)
 
     @commands.command(name='pay', help='Pay coins to another user')
+    @commands.max_concurrency(1, commands.BucketType.user, wait=False)
     async def pay_command(self, ctx, user: discord.Member, amount: int):
         """Pay coins to another user."""
         if not is_module_enabled("rpg", ctx.guild.id):
@@ -1566,6 +1708,7 @@ class RPGGamesCog(commands.Cog):
 
         sender_id = str(ctx.author.id)
         receiver_id = str(user.id)
+        await prefetch_user_rpg_data(sender_id, receiver_id)
 
         if not ensure_user_exists(sender_id):
             await ctx.send("❌ You need to start your adventure first!")
@@ -1575,24 +1718,14 @@ class RPGGamesCog(commands.Cog):
             await ctx.send("❌ The target user needs to start their adventure first!")
             return
 
-        sender_data = get_user_rpg_data(sender_id)
-        receiver_data = get_user_rpg_data(receiver_id)
-
-        if not sender_data or not receiver_data:
-            await ctx.send("❌ Could not retrieve user data!")
-            return
-
-        sender_coins = sender_data.get('coins', 0)
-        if sender_coins < amount:
-            await ctx.send(f"❌ You don't have enough coins! You have {format_number(sender_coins)} coins.")
-            return
-
         # Transfer coins
-        sender_data['coins'] = sender_coins - amount
-        receiver_data['coins'] = receiver_data.get('coins', 0) + amount
-
-        update_user_rpg_data(sender_id, sender_data)
-        update_user_rpg_data(receiver_id, receiver_data)
+        transferred, sender_coins = transfer_coins(sender_id, receiver_id, amount)
+        if not transferred:
+            if sender_coins is None:
+                await ctx.send("❌ Could not retrieve user data!")
+            else:
+                await ctx.send(f"❌ You don't have enough coins! You have {format_number(sender_coins)} coins.")
+            return
 
         embed = create_embed(
             "💸 Payment Successful!",
@@ -1601,51 +1734,6 @@ class RPGGamesCog(commands.Cog):
         )
 
         await ctx.send(embed=embed)
-            
-    @commands.command(name='pay', help='Pay coins to another user')
-    async def pay_command(self, ctx, member: discord.Member, amount: int):
-        """Pay coins to another user."""
-        if not is_module_enabled("rpg", ctx.guild.id):
-            return
-
-        user_id = str(ctx.author.id)
-        target_id = str(member.id)
-
-        if not ensure_user_exists(user_id) or not ensure_user_exists(target_id):
-            await ctx.send("❌ Both users need to start their adventure first!")
-            return
-
-        player_data = get_user_rpg_data(user_id)
-        target_data = get_user_rpg_data(target_id)
-
-        if not player_data or not target_data:
-            await ctx.send("❌ Could not retrieve user data.")
-            return
-
-        coins = player_data.get('coins', 0)
-
-        if amount <= 0:
-            await ctx.send("❌ Amount must be positive!")
-            return
-
-        if coins < amount:
-            await ctx.send(f"❌ You don't have enough coins! You have {coins} coins.")
-            return
-
-        # Perform the transaction
-        player_data['coins'] = coins - amount
-        target_data['coins'] = target_data.get('coins', 0) + amount
-
-        update_user_rpg_data(user_id, player_data)
-        update_user_rpg_data(target_id, target_data)
-
-        embed = create_embed(
-            "💰 Payment Sent!",
-            f"You paid {member.mention} {amount} coins!",
-            COLORS['success']
-        )
-
-        await ctx.send(embed=embed)
 
     @commands.command(name='lootbox', help='Open a lootbox for random rewards')
     async def lootbox_command(self, ctx):
@@ -1655,21 +1743,13 @@ class RPGGamesCog(commands.Cog):
 
         user_id = str(ctx.author.id)
 
+        await prefetch_user_rpg_data(user_id)
         if not ensure_user_exists(user_id):
             await ctx.send("❌ You need to start your adventure first!")
             return
 
         view = LootboxView(user_id)
-        embed = discord.Embed(
-            title="🎁 Lootbox System",
-            description="Open lootboxes to get random rewards!\n\n"
-                       "**Possible Rewards:**\n"
-                       "• Coins (100-1000)\n"
-                       "• Random weapons and armor\n"
-                       "• Super rare items (0.1% chance)\n\n"
-                       "Buy lootboxes from the shop for 1000 coins!",
-            color=COLORS['warning']
-        )
+        embed = discord.Embed.from_dict(_LOOTBOX_EMBED_TEMPLATE)
 
         await ctx.send(embed=embed, view=view)
 
@@ -1687,9 +1767,10 @@ class RPGGamesCog(commands.Cog):
             return
 
         if arena not in PVP_ARENAS:
-            await ctx.send(f"❌ Invalid arena! Choose from: {', '.join(PVP_ARENAS.keys())}")
+            await ctx.send(f"❌ Invalid arena! Choose from: {PVP_ARENA_NAMES}")
             return
 
+        await prefetch_user_rpg_data(user_id, target_id)
         if not ensure_user_exists(user_id) or not ensure_user_exists(target_id):
             await ctx.send("❌ Both players need to start their adventure first!")
             return
@@ -1717,7 +1798,7 @@ class RPGGamesCog(commands.Cog):
             description=f"{ctx.author.mention} challenges {member.mention} to battle!\n\n"
                        f"**Arena:** {arena}\n"
                        f"**Entry Fee:** {format_number(entry_fee)} coins\n"
-                       f"**Winner Gets:** {format_number(entry_fee * PVP_ARENAS[arena]['winner_multiplier'])} coins",
+                       f"**Winner Gets:** {format_number(view.winner_reward)} coins",
             color=COLORS['warning']
         )
 
@@ -1736,21 +1817,16 @@ class RPGGamesCog(commands.Cog):
             await ctx.send("❌ You can't trade with yourself!")
             return
 
+        await prefetch_user_rpg_data(user_id, target_id)
         if not ensure_user_exists(user_id) or not ensure_user_exists(target_id):
             await ctx.send("❌ Both players need to start their adventure first!")
             return
 
         view = TradeView(user_id, target_id)
-        embed = discord.Embed(
-            title="🤝 Trade System",
-            description=f"Trade between {ctx.author.mention} and {member.mention}\n\n"
-                       f"**Instructions:**\n"
-                       f"1. Add items and coins you want to trade\n"
-                       f"2. Both players click Ready when satisfied\n"
-                       f"3. Trade will be executed automatically\n\n"
-                       f"**Current Trade:**\nEmpty",
-            color=COLORS['primary']
-        )
+        embed = discord.Embed.from_dict({
+            **_TRADE_EMBED_TEMPLATE,
+            'description': _TRADE_DESCRIPTION_TEMPLATE.format(trader1=ctx.author.mention, trader2=member.mention)
+        })
 
         await ctx.send(embed=embed, view=view)
 
@@ -1761,51 +1837,17 @@ class RPGGamesCog(commands.Cog):
             return
 
         if not item_name:
-            embed = discord.Embed(
-                title="🌟 Rarity System",
-                description="Items have different rarities that affect their power:",
-                color=COLORS['primary']
-            )
-
-            rarity_info = ""
-            for rarity, color in RARITY_COLORS.items():
-                emoji = get_rarity_emoji(rarity)
-                weight = RARITY_WEIGHTS.get(rarity, 0)
-                rarity_info += f"{emoji} **{rarity.title()}** - {weight}% chance\n"
-
-            embed.add_field(name="🎲 Rarity Levels", value=rarity_info, inline=False)
-            embed.add_field(
-                name="✨ Special Items",
-                value="🔥 **World Ender** - Omnipotent weapon that can one-shot anything\n"
-                     "💎 **Reality Stone** - Grants power to have any item (except World Ender)",
-                inline=False
-            )
-
-            await ctx.send(embed=embed)
+            await ctx.send(embed=discord.Embed.from_dict(_RARITY_EMBED_TEMPLATE))
             return
 
         # Check specific item
-        item_found = False
-        item_data = None
-        item_type = None
-
-        if item_name in WEAPONS:
-            item_data = WEAPONS[item_name]
-            item_type = "weapon"
-            item_found = True
-        elif item_name in ARMOR:
-            item_data = ARMOR[item_name]
-            item_type = "armor"
-            item_found = True
-        elif item_name == "Reality Stone":
-            item_data = OMNIPOTENT_ITEM["Reality Stone"]
-            item_type = "accessory"
-            item_found = True
-
-        if not item_found:
+        hit = ITEM_INDEX.get(item_name)
+        if hit is None:
             await ctx.send(f"❌ Item '{item_name}' not found!")
             return
 
+        item_data, item_type = hit
+
         rarity = item_data["rarity"]
         emoji = get_rarity_emoji(rarity)
         color = RARITY_COLORS.get(rarity, COLORS['primary'])
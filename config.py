@@ -1,8 +1,11 @@
 import discord
 from replit import db
+import asyncio
+import json
 import logging
 import os
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, FrozenSet, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -40,45 +43,125 @@ EMOJIS = {
     'luck': '🍀'
 }
 
+# How long a fetched server config is served from memory (in seconds)
+SERVER_CONFIG_TTL = 60
+SERVER_CONFIG_CACHE_SIZE = 1024
+
+# Quiet period before a changed server config is written to the database (in seconds)
+SERVER_CONFIG_WRITE_DELAY = 0.5
+
+# In-memory server config cache, least recently used first: guild_id -> (fetched_at, config)
+_server_config_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+
+# Configs waiting to be written: guild_id -> config
+_pending_writes: Dict[int, Dict[str, Any]] = {}
+
+# Scheduled debounced flush per guild: guild_id -> task
+_flush_tasks: Dict[int, asyncio.Task] = {}
+
+# Bumped on every config update, so off-loop reads can tell they raced a write
+_server_config_generation = [0]
+
+# Disabled module names per guild: guild_id -> frozenset of module names
+# (modules missing from the config default to enabled, so only the disabled ones are kept)
+_disabled_modules_cache: Dict[int, FrozenSet[str]] = {}
+
 def get_server_config(guild_id: int) -> Dict[str, Any]:
-    """Get server configuration from database."""
+    """Get server configuration, served from the in-memory cache when fresh."""
+    pending = _pending_writes.get(guild_id)
+    if pending is not None:
+        return pending
+
+    cached = _server_config_cache.pop(guild_id, None)
+    if cached and time.monotonic() - cached[0] < SERVER_CONFIG_TTL:
+        # Reinsert as most recently used
+        _server_config_cache[guild_id] = cached
+        return cached[1]
+
     try:
-        config_key = f"server_config_{guild_id}"
-        config = db.get(config_key, {})
-        
-        # Ensure default values exist
-        default_config = {
-            'prefix': '$',
-            'currency_name': 'coins',
-            'enabled_modules': {
-                'rpg': True,
-                'economy': True,
-                'moderation': True,
-                'ai_chatbot': True,
-                'admin': True
-            },
-            'ai_channels': [],
-            'mod_log_channel': None,
-            'auto_moderation': {
-                'enabled': True,
-                'spam_detection': True,
-                'inappropriate_content': True,
-                'max_warnings': 3
-            }
-        }
-        
-        # Merge with defaults
-        for key, value in default_config.items():
-            if key not in config:
-                config[key] = value
-                
+        config = _load_server_config(guild_id)
+        _cache_server_config(guild_id, config)
         return config
     except Exception as e:
         logger.error(f"Error getting server config for {guild_id}: {e}")
         return {}
 
-def update_server_config(guild_id: int, config: Dict[str, Any]) -> bool:
-    """Update server configuration in database."""
+def _load_server_config(guild_id: int) -> Dict[str, Any]:
+    """Read a server configuration merged with defaults; touches no shared state, so safe in a thread."""
+    config_key = f"server_config_{guild_id}"
+    # Decode to a plain dict: db.get returns an ObservedDict that writes back on every
+    # in-place change, bypassing the debounced update_server_config
+    try:
+        config = json.loads(db.get_raw(config_key))
+    except KeyError:
+        config = {}
+    
+    # Ensure default values exist
+    default_config = {
+        'prefix': '$',
+        'currency_name': 'coins',
+        'enabled_modules': {
+            'rpg': True,
+            'economy': True,
+            'moderation': True,
+            'ai_chatbot': True,
+            'admin': True
+        },
+        'ai_channels': [],
+        'mod_log_channel': None,
+        'auto_moderation': {
+            'enabled': True,
+            'spam_detection': True,
+            'inappropriate_content': True,
+            'max_warnings': 3
+        }
+    }
+    
+    # Merge with defaults
+    for key, value in default_config.items():
+        if key not in config:
+            config[key] = value
+
+    return config
+
+def _cache_server_config(guild_id: int, config: Dict[str, Any]):
+    """Serve a freshly read server configuration from memory."""
+    _server_config_cache.pop(guild_id, None)
+    if len(_server_config_cache) >= SERVER_CONFIG_CACHE_SIZE:
+        evicted = next(iter(_server_config_cache))
+        del _server_config_cache[evicted]
+        _disabled_modules_cache.pop(evicted, None)
+    _server_config_cache[guild_id] = (time.monotonic(), config)
+    _disabled_modules_cache.pop(guild_id, None)
+
+async def get_server_config_async(guild_id: int) -> Dict[str, Any]:
+    """Get server configuration without blocking the event loop on a cache miss."""
+    pending = _pending_writes.get(guild_id)
+    if pending is not None:
+        return pending
+
+    cached = _server_config_cache.pop(guild_id, None)
+    if cached and time.monotonic() - cached[0] < SERVER_CONFIG_TTL:
+        # Reinsert as most recently used
+        _server_config_cache[guild_id] = cached
+        return cached[1]
+
+    generation = _server_config_generation[0]
+    try:
+        config = await asyncio.to_thread(_load_server_config, guild_id)
+    except Exception as e:
+        logger.error(f"Error getting server config for {guild_id}: {e}")
+        return {}
+
+    # An update landed while the thread was reading, so this result may be older
+    if _server_config_generation[0] != generation:
+        return get_server_config(guild_id)
+
+    _cache_server_config(guild_id, config)
+    return config
+
+def _write_server_config_now(guild_id: int, config: Dict[str, Any]) -> bool:
+    """Write server configuration to the database immediately."""
     try:
         config_key = f"server_config_{guild_id}"
         db[config_key] = config
@@ -87,38 +170,131 @@ def update_server_config(guild_id: int, config: Dict[str, Any]) -> bool:
         logger.error(f"Error updating server config for {guild_id}: {e}")
         return False
 
+def _store_server_config_raw(guild_id: int, value: str) -> bool:
+    """Write an already encoded server configuration; touches no shared state, so safe in a thread."""
+    try:
+        db.set_raw(f"server_config_{guild_id}", value)
+        return True
+    except Exception as e:
+        logger.error(f"Error updating server config for {guild_id}: {e}")
+        return False
+
+async def _write_server_config_in_thread(guild_id: int, config: Dict[str, Any]) -> bool:
+    """Write server configuration from a worker thread, off the event loop."""
+    # Encode here: handlers may mutate the cached config while the thread sends it
+    try:
+        value = db.dumps(config)
+    except Exception as e:
+        logger.error(f"Error encoding server config for {guild_id}: {e}")
+        return False
+    return await asyncio.to_thread(_store_server_config_raw, guild_id, value)
+
+async def _flush_server_config(guild_id: int):
+    """Write a guild's pending config once no further changes arrive."""
+    await asyncio.sleep(SERVER_CONFIG_WRITE_DELAY)
+    _flush_tasks.pop(guild_id, None)
+
+    config = _pending_writes.pop(guild_id, None)
+    if config is not None:
+        await _write_server_config_in_thread(guild_id, config)
+
+def update_server_config(guild_id: int, config: Dict[str, Any]) -> bool:
+    """Update server configuration; the database write is debounced per guild."""
+    _server_config_generation[0] += 1
+    _cache_server_config(guild_id, config)
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No event loop to schedule on, write straight away
+        return _write_server_config_now(guild_id, config)
+
+    _pending_writes[guild_id] = config
+
+    # Restart the quiet period so a burst of changes ends in one write
+    task = _flush_tasks.get(guild_id)
+    if task:
+        task.cancel()
+    _flush_tasks[guild_id] = loop.create_task(_flush_server_config(guild_id))
+    return True
+
+async def flush_all_configs():
+    """Write every pending server config to the database now."""
+    for task in _flush_tasks.values():
+        task.cancel()
+    _flush_tasks.clear()
+
+    while _pending_writes:
+        guild_id, config = _pending_writes.popitem()
+        await _write_server_config_in_thread(guild_id, config)
+
 def is_module_enabled(module_name: str, guild_id: int) -> bool:
     """Check if a module is enabled for a guild."""
+    disabled = _disabled_modules_cache.get(guild_id)
+    if disabled is not None:
+        return module_name not in disabled
+
     try:
         config = get_server_config(guild_id)
-        return config.get('enabled_modules', {}).get(module_name, True)
+        enabled_modules = config.get('enabled_modules', {})
+        if config:
+            disabled = frozenset(name for name, enabled in enabled_modules.items() if not enabled)
+            _disabled_modules_cache[guild_id] = disabled
+        return enabled_modules.get(module_name, True)
     except Exception as e:
         logger.error(f"Error checking module status: {e}")
         return True  # Default to enabled
 
+# How long a member's computed permission levels are reused (in seconds)
+PERMISSION_CACHE_TTL = 10
+PERMISSION_CACHE_SIZE = 4096
+
+# Permission levels per member, least recently used first: (guild_id, user_id) -> (computed_at, levels)
+_perm_cache: Dict[Tuple[int, int], Tuple[float, FrozenSet[str]]] = {}
+
+def _compute_permission_levels(user: discord.Member) -> FrozenSet[str]:
+    """Work out every permission level a member currently has."""
+    # Owner always has all permissions
+    if user.id == user.guild.owner_id:
+        return frozenset(('admin', 'moderator', 'manage_channels', 'manage_roles'))
+        
+    perms = user.guild_permissions
+    levels = set()
+    if perms.administrator:
+        levels.add('admin')
+    if (perms.kick_members or 
+            perms.ban_members or 
+            perms.manage_messages or
+            perms.administrator):
+        levels.add('moderator')
+    if perms.manage_channels:
+        levels.add('manage_channels')
+    if perms.manage_roles:
+        levels.add('manage_roles')
+    return frozenset(levels)
+
 def user_has_permission(user: discord.Member, permission_level: str) -> bool:
     """Check if user has required permission level."""
-    if not user.guild:
+    guild = getattr(user, 'guild', None)
+    if not guild:
         return False
         
-    # Owner always has all permissions
-    if user.id == user.guild.owner_id:
-        return True
-        
-    # Check Discord permissions
-    if permission_level == 'admin':
-        return user.guild_permissions.administrator
-    elif permission_level == 'moderator':
-        return (user.guild_permissions.kick_members or 
-                user.guild_permissions.ban_members or 
-                user.guild_permissions.manage_messages or
-                user.guild_permissions.administrator)
-    elif permission_level == 'manage_channels':
-        return user.guild_permissions.manage_channels
-    elif permission_level == 'manage_roles':
-        return user.guild_permissions.manage_roles
+    key = (guild.id, user.id)
+    cached = _perm_cache.pop(key, None)
+    now = time.monotonic()
+    if cached is None or now - cached[0] >= PERMISSION_CACHE_TTL:
+        cached = (now, _compute_permission_levels(user))
+        # Least recently used entries go first once the cache is full
+        if len(_perm_cache) >= PERMISSION_CACHE_SIZE:
+            del _perm_cache[next(iter(_perm_cache))]
+    # Re-insert to mark it most recently used
+    _perm_cache[key] = cached
         
-    return False
+    return permission_level in cached[1]
+
+def invalidate_user_permissions(guild_id: int, user_id: int):
+    """Drop a member's cached permission levels, e.g. after a role change."""
+    _perm_cache.pop((guild_id, user_id), None)
 
 def get_ai_api_key() -> Optional[str]:
     """Get AI API key from environment."""
@@ -1,7 +1,10 @@
 import discord
 from discord.ext import commands
+import atexit
 import os
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import asyncio
 from datetime import datetime
 import threading
@@ -10,15 +13,23 @@ from config import COLORS, EMOJIS, get_server_config
 from utils.database import initialize_database
 from cogs.help import HelpView
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('bot.log'),
-        logging.StreamHandler()
-    ]
-)
+# Configure logging; records are queued by the caller and written by a listener thread,
+# so coroutines never block on the log file or stderr
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler('bot.log'), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+del _handler
+
+_log_queue = queue.SimpleQueue()
+_log_queue_handler = QueueHandler(_log_queue)
+# Only merge args into the message; the listener's handlers add the timestamp and level
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler])
+_log_listener.start()
+# Write out whatever is still queued on exit
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # Bot configuration
@@ -63,6 +74,28 @@ async def on_ready():
     except Exception as e:
         logger.error(f"Error setting bot presence: {e}")
 
+# Channel names preferred for the welcome message
+_WELCOME_CHANNEL_NAMES = frozenset({'general', 'welcome', 'bot-commands'})
+
+def _find_welcome_channel(guild):
+    """Pick the channel for the welcome message, checking each channel's permissions at most once."""
+    me = guild.me
+    system_channel = guild.system_channel
+    if system_channel and system_channel.permissions_for(me).send_messages:
+        return system_channel
+
+    # Prefer a named channel, else the first channel we can send to
+    fallback = None
+    for ch in guild.text_channels:
+        if ch is system_channel:
+            continue
+        if ch.name.lower() in _WELCOME_CHANNEL_NAMES:
+            if ch.permissions_for(me).send_messages:
+                return ch
+        elif fallback is None and ch.permissions_for(me).send_messages:
+            fallback = ch
+    return fallback
+
 @bot.event
 async def on_guild_join(guild):
     """Called when the bot joins a new guild."""
@@ -71,21 +104,7 @@ async def on_guild_join(guild):
     # Try to send welcome message
     try:
         # Find a suitable channel to send welcome message
-        channel = None
-
-        # Try to find general or welcome channel
-        for ch in guild.text_channels:
-            if ch.name.lower() in ['general', 'welcome', 'bot-commands']:
-                if ch.permissions_for(guild.me).send_messages:
-                    channel = ch
-                    break
-
-        # If no suitable channel found, try the first channel we can send to
-        if not channel:
-            for ch in guild.text_channels:
-                if ch.permissions_for(guild.me).send_messages:
-                    channel = ch
-                    break
+        channel = _find_welcome_channel(guild)
 
         if channel:
             embed = discord.Embed(
@@ -115,61 +134,68 @@ async def on_guild_join(guild):
     except Exception as e:
         logger.error(f"Error sending welcome message to {guild.name}: {e}")
 
+# Replies for expected command errors: error type -> (title, description template, color);
+# None means the error is ignored. Templates are filled with the ctx and error.
+_COMMAND_ERROR_REPLIES = {
+    # Don't respond to unknown commands
+    commands.CommandNotFound: None,
+    commands.MissingPermissions: (
+        "❌ Missing Permissions",
+        "You don't have the required permissions to use this command.",
+        'error'
+    ),
+    commands.BotMissingPermissions: (
+        "❌ Bot Missing Permissions",
+        "I don't have the required permissions to execute this command.",
+        'error'
+    ),
+    commands.CommandOnCooldown: (
+        "⏰ Command on Cooldown",
+        "This command is on cooldown. Try again in {error.retry_after:.1f} seconds.",
+        'warning'
+    ),
+    commands.MaxConcurrencyReached: (
+        "⏳ Already Running",
+        "Please wait for your previous command to finish.",
+        'warning'
+    ),
+    commands.MissingRequiredArgument: (
+        "❌ Missing Required Argument",
+        "Missing required argument: `{error.param.name}`\n\nUse `$help {ctx.command.name}` for more info.",
+        'error'
+    ),
+    commands.BadArgument: (
+        "❌ Invalid Argument",
+        "Invalid argument provided. Use `$help {ctx.command.name}` for correct usage.",
+        'error'
+    )
+}
+
 @bot.event
 async def on_command_error(ctx, error):
     """Global error handler for commands."""
-    if isinstance(error, commands.CommandNotFound):
-        # Don't respond to unknown commands
-        return
-
-    elif isinstance(error, commands.MissingPermissions):
-        embed = discord.Embed(
-            title="❌ Missing Permissions",
-            description="You don't have the required permissions to use this command.",
-            color=COLORS['error']
-        )
-        await ctx.send(embed=embed)
-
-    elif isinstance(error, commands.BotMissingPermissions):
-        embed = discord.Embed(
-            title="❌ Bot Missing Permissions",
-            description="I don't have the required permissions to execute this command.",
-            color=COLORS['error']
-        )
-        await ctx.send(embed=embed)
-
-    elif isinstance(error, commands.CommandOnCooldown):
-        embed = discord.Embed(
-            title="⏰ Command on Cooldown",
-            description=f"This command is on cooldown. Try again in {error.retry_after:.1f} seconds.",
-            color=COLORS['warning']
-        )
-        await ctx.send(embed=embed)
-
-    elif isinstance(error, commands.MissingRequiredArgument):
-        embed = discord.Embed(
-            title="❌ Missing Required Argument",
-            description=f"Missing required argument: `{error.param.name}`\n\nUse `$help {ctx.command.name}` for more info.",
-            color=COLORS['error']
-        )
-        await ctx.send(embed=embed)
+    # Walk the MRO so subclasses (e.g. MemberNotFound) use their base's reply
+    for cls in type(error).__mro__:
+        if cls in _COMMAND_ERROR_REPLIES:
+            reply = _COMMAND_ERROR_REPLIES[cls]
+            if reply is None:
+                return
+            title, description, color = reply
+            embed = discord.Embed(
+                title=title,
+                description=description.format(ctx=ctx, error=error),
+                color=COLORS[color]
+            )
+            await ctx.send(embed=embed)
+            return
 
-    elif isinstance(error, commands.BadArgument):
-        embed = discord.Embed(
-            title="❌ Invalid Argument",
-            description=f"Invalid argument provided. Use `$help {ctx.command.name}` for correct usage.",
-            color=COLORS['error']
-        )
-        await ctx.send(embed=embed)
-
-    else:
-        logger.error(f"Unhandled error in command {ctx.command}: {error}")
-        embed = discord.Embed(
-            title="❌ An Error Occurred",
-            description="An unexpected error occurred. Please try again later.",
-            color=COLORS['error']
-        )
-        await ctx.send(embed=embed)
+    logger.error(f"Unhandled error in command {ctx.command}: {error}")
+    embed = discord.Embed(
+        title="❌ An Error Occurred",
+        description="An unexpected error occurred. Please try again later.",
+        color=COLORS['error']
+    )
+    await ctx.send(embed=embed)
 
 @bot.event
 async def on_error(event, *args, **kwargs):
@@ -186,12 +212,15 @@ async def load_cogs():
         'cogs.help'
     ]
 
-    for cog in cogs:
-        try:
-            await bot.load_extension(cog)
-            logger.info(f"Loaded cog: {cog}")
-        except Exception as e:
-            logger.error(f"Failed to load cog {cog}: {e}")
+    await asyncio.gather(*(_load_cog(cog) for cog in cogs))
+
+async def _load_cog(cog):
+    """Load one cog, logging instead of raising so the others still load."""
+    try:
+        await bot.load_extension(cog)
+        logger.info(f"Loaded cog: {cog}")
+    except Exception as e:
+        logger.error(f"Failed to load cog {cog}: {e}")
 
 async def main():
     """Main function to run the bot."""
@@ -0,0 +1,20 @@
+import pytest
+
+pytest.importorskip("replit")
+
+from utils import database
+from utils.database import remove_inventory_item, rpg_session
+
+
+def test_failed_session_leaves_pending_write_alone(monkeypatch):
+    pending = {"user_id": "1", "coins": 100, "inventory": {"Lootbox": 2}}
+    monkeypatch.setitem(database._pending_rpg_writes, "1", pending)
+
+    with pytest.raises(RuntimeError):
+        with rpg_session("1") as data:
+            remove_inventory_item(data["inventory"], "Lootbox")
+            data["coins"] = 0
+            raise RuntimeError("command failed")
+
+    assert database._pending_rpg_writes["1"] is pending
+    assert pending == {"user_id": "1", "coins": 100, "inventory": {"Lootbox": 2}}
@@ -0,0 +1,47 @@
+import random
+from typing import Any, List, Sequence
+
+class AliasTable:
+    """Weighted sampler using Vose's alias method.
+
+    Building the table is O(n); every draw afterwards is O(1) no matter how
+    many entries the table holds.
+    """
+
+    def __init__(self, values: Sequence[Any], weights: Sequence[float]):
+        if len(values) != len(weights) or not values:
+            raise ValueError("AliasTable needs one weight per value and at least one value")
+
+        n = len(values)
+        total = float(sum(weights))
+        scaled = [w * n / total for w in weights]
+
+        self.values = tuple(values)
+        self._n = n
+        self._prob: List[float] = [0.0] * n
+        self._alias: List[int] = [0] * n
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self._prob[s] = scaled[s]
+            self._alias[s] = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+
+        # Whatever is left is 1.0 up to float rounding
+        for i in large + small:
+            self._prob[i] = 1.0
+
+    def sample_index(self, rng=random) -> int:
+        """Draw an index with a single uniform random number."""
+        u = rng.random() * self._n
+        i = int(u)
+        return i if u - i < self._prob[i] else self._alias[i]
+
+    def sample(self, rng=random) -> Any:
+        """Draw a value according to the table's weights."""
+        return self.values[self.sample_index(rng)]
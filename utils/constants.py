@@ -17,6 +17,7 @@ RPG_CONSTANTS = {
     # Level system
     'base_xp': 100,             # XP needed for level 2
     'xp_multiplier': 1.5,       # XP multiplier per level
+    'max_level': 100,           # Highest reachable level
     
     # Battle system
     'critical_chance': 0.1,     # 10% critical hit chance
@@ -27,17 +28,6 @@ RPG_CONSTANTS = {
     'max_luck': 1000,           # Maximum luck points
 }
 
-# Monsters for battles
-MONSTERS = [
-    {"name": "Goblin", "hp": 30, "attack": 8, "max_hp": 30},
-    {"name": "Orc", "hp": 50, "attack": 12, "max_hp": 50},
-    {"name": "Skeleton", "hp": 40, "attack": 10, "max_hp": 40},
-    {"name": "Troll", "hp": 80, "attack": 15, "max_hp": 80}
-]
-
-# Adventure locations
-ADVENTURE_LOCATIONS = ["Forest", "Mountains", "Dungeon", "Desert"]
-
 # Item Rarity System
 RARITY_COLORS = {
     "common": 0x9E9E9E,      # Gray
@@ -61,15 +51,6 @@ RARITY_WEIGHTS = {
     "omnipotent": 0.01
 }
 
-# Shop items with rarity
-SHOP_ITEMS = {
-    "Iron Sword": {"price": 200, "type": "weapon", "stats": {"attack": 5}, "rarity": "common"},
-    "Leather Armor": {"price": 150, "type": "armor", "stats": {"defense": 3}, "rarity": "common"},
-    "Health Potion": {"price": 25, "type": "consumable", "stats": {"hp": 50}, "rarity": "common"},
-    "Lucky Charm": {"price": 500, "type": "accessory", "stats": {"luck": 10}, "rarity": "uncommon"},
-    "Lootbox": {"price": 1000, "type": "consumable", "stats": {}, "rarity": "special"}
-}
-
 # Weapon database with rarities
 WEAPONS = {
     # Common
@@ -144,6 +125,13 @@ OMNIPOTENT_ITEM = {
     }
 }
 
+# Every inspectable item: name -> (data, item type)
+ITEM_INDEX = {
+    **{name: (data, "weapon") for name, data in WEAPONS.items()},
+    **{name: (data, "armor") for name, data in ARMOR.items()},
+    **{name: (data, data["type"]) for name, data in OMNIPOTENT_ITEM.items()}
+}
+
 # PvP Arenas
 PVP_ARENAS = {
     "Colosseum": {"entry_fee": 100, "winner_multiplier": 2},
@@ -151,6 +139,9 @@ PVP_ARENAS = {
     "Divine Arena": {"entry_fee": 1000, "winner_multiplier": 5}
 }
 
+# Arena names for messages listing the choices
+PVP_ARENA_NAMES = ", ".join(PVP_ARENAS)
+
 # Lootbox contents
 LOOTBOX_CONTENTS = {
     "common": {"coins": (100, 500), "items": ["Health Potion", "Mana Potion"]},
@@ -1,54 +1,480 @@
+import asyncio
+import heapq
 import logging
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, Any, Optional, List, Callable, Iterator, Tuple, Union
 from replit import db
 import json
+import time
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+def _initialize_global_settings():
+    """Create the global settings if they don't exist."""
+    if "global_settings" not in db:
+        db["global_settings"] = {
+            "bot_version": "1.0.0",
+            "maintenance_mode": False,
+            "total_users": 0,
+            "total_guilds": 0
+        }
+
 async def initialize_database():
     """Initialize the database with default settings."""
     try:
-        # Initialize global settings if they don't exist
-        if "global_settings" not in db:
-            db["global_settings"] = {
-                "bot_version": "1.0.0",
-                "maintenance_mode": False,
-                "total_users": 0,
-                "total_guilds": 0
-            }
+        # Initialize global settings if they don't exist, off the event loop
+        await asyncio.to_thread(_initialize_global_settings)
         
         logger.info("Database initialization complete")
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
         raise
 
-def get_user_rpg_data(user_id: str) -> Optional[Dict[str, Any]]:
-    """Get user's RPG data from database."""
+@dataclass(slots=True)
+class PlayerStats:
+    """Numeric profile fields, read once with their defaults for hot paths."""
+    level: int = 1
+    xp: int = 0
+    max_xp: int = 100
+    hp: int = 100
+    max_hp: int = 100
+    attack: int = 10
+    defense: int = 5
+    coins: int = 0
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> "PlayerStats":
+        """Read the stats out of a user's RPG data dict."""
+        get = data.get
+        return cls(
+            get('level', 1), get('xp', 0), get('max_xp', 100),
+            get('hp', 100), get('max_hp', 100),
+            get('attack', 10), get('defense', 5), get('coins', 0)
+        )
+
+# How often coalesced RPG data writes are flushed to the database (in seconds)
+RPG_WRITE_FLUSH_INTERVAL = 0.25
+
+# Most profiles sent in one database request; a bigger backlog goes out over several
+RPG_WRITE_BATCH_SIZE = 256
+
+# RPG data waiting to be written: user_id -> latest data
+_pending_rpg_writes: Dict[str, Dict[str, Any]] = {}
+
+# Flushed RPG data whose database write is still in progress: user_id -> data
+_inflight_rpg_writes: Dict[str, Dict[str, Any]] = {}
+
+# Profiles created but not yet counted in global_settings' total_users
+_unflushed_new_users = [0]
+
+# Background task flushing _pending_rpg_writes, once started
+_rpg_flush_task: Optional[asyncio.Task] = None
+
+# How long a user's stored RPG data is reused between reads (in seconds)
+RPG_READ_CACHE_TTL = 2
+RPG_READ_CACHE_SIZE = 4096
+
+# Recent raw reads, least recently used first: user_id -> (monotonic read time, JSON or None)
+_rpg_read_cache: Dict[str, Tuple[float, Optional[str]]] = {}
+
+# Read cache counters for sizing: [hits, misses]
+_rpg_read_cache_stats = [0, 0]
+
+# Bumped whenever stored RPG data changes, so prefetches can tell they raced a write
+_rpg_write_generation = [0]
+
+def _counted_inventory(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a legacy list inventory to an item -> count dict, in place."""
+    inventory = data.get("inventory")
+    if isinstance(inventory, list):
+        counts: Dict[str, int] = {}
+        for item in inventory:
+            counts[item] = counts.get(item, 0) + 1
+        data["inventory"] = counts
+    return data
+
+def add_inventory_items(inventory: Dict[str, int], *items: str) -> None:
+    """Add one of each given item to a counted inventory."""
+    for item in items:
+        inventory[item] = inventory.get(item, 0) + 1
+
+def remove_inventory_item(inventory: Dict[str, int], item: str) -> bool:
+    """Remove one of an item from a counted inventory; False if there is none."""
+    count = inventory.get(item, 0)
+    if count <= 0:
+        return False
+    if count == 1:
+        del inventory[item]
+    else:
+        inventory[item] = count - 1
+    return True
+
+def _read_user_rpg_raw(user_id: str) -> Optional[str]:
+    """Read user's stored RPG data JSON (None if absent) through a TTL-bounded LRU cache."""
+    now = time.monotonic()
+    cached = _rpg_read_cache.pop(user_id, None)
+    if cached is not None and now - cached[0] < RPG_READ_CACHE_TTL:
+        # Re-insert to mark it most recently used
+        _rpg_read_cache[user_id] = cached
+        _rpg_read_cache_stats[0] += 1
+        return cached[1]
+
+    _rpg_read_cache_stats[1] += 1
+    raw = _fetch_user_rpg_raw(user_id)
+    _cache_user_rpg_raw(user_id, now, raw)
+    return raw
+
+def _fetch_user_rpg_raw(user_id: str) -> Optional[str]:
+    """Read user's stored RPG data JSON straight from the database; safe in a thread."""
     try:
-        key = f"user_rpg_{user_id}"
-        if key in db:
-            return dict(db[key])
+        return db.get_raw(f"user_rpg_{user_id}")
+    except KeyError:
         return None
+
+def _cache_user_rpg_raw(user_id: str, now: float, raw: Optional[str]):
+    """Remember a raw read, evicting the least recently used entry once the cache is full."""
+    if len(_rpg_read_cache) >= RPG_READ_CACHE_SIZE:
+        del _rpg_read_cache[next(iter(_rpg_read_cache))]
+    _rpg_read_cache[user_id] = (now, raw)
+
+def _forget_user_rpg_read(user_id: str):
+    """Drop user's cached read after their stored data changed."""
+    _rpg_read_cache.pop(user_id, None)
+    _rpg_write_generation[0] += 1
+
+async def prefetch_user_rpg_data(*user_ids: str):
+    """Warm the read cache for these users from a worker thread.
+    
+    Commands call this before their synchronous read-modify-write so the
+    database round trip happens off the event loop; the reads that follow
+    are then served from the cache.
+    """
+    now = time.monotonic()
+    missing = []
+    for user_id in user_ids:
+        cached = _rpg_read_cache.get(user_id)
+        if _unwritten_rpg_data(user_id) is None and (cached is None or now - cached[0] >= RPG_READ_CACHE_TTL):
+            missing.append(user_id)
+    if not missing:
+        return
+
+    generation = _rpg_write_generation[0]
+    try:
+        raws = await asyncio.to_thread(lambda: [_fetch_user_rpg_raw(user_id) for user_id in missing])
+    except Exception as e:
+        logger.error(f"Error prefetching RPG data for {missing}: {e}")
+        return
+
+    # A write landed meanwhile, so these reads may be stale
+    if _rpg_write_generation[0] != generation:
+        return
+
+    _rpg_read_cache_stats[1] += len(missing)
+    now = time.monotonic()
+    for user_id, raw in zip(missing, raws):
+        _rpg_read_cache.pop(user_id, None)
+        _cache_user_rpg_raw(user_id, now, raw)
+
+def _unwritten_rpg_data(user_id: str) -> Optional[Dict[str, Any]]:
+    """Get user's RPG data from writes the database doesn't have yet, if any."""
+    pending = _pending_rpg_writes.get(user_id)
+    if pending is None:
+        pending = _inflight_rpg_writes.get(user_id)
+    return pending
+
+def bump_stat(data: Dict[str, Any], key: str, delta: int = 1) -> None:
+    """Add delta to one of the counters under a user's 'stats'."""
+    stats = data.setdefault('stats', {})
+    stats[key] = stats.get(key, 0) + delta
+
+def get_rpg_read_cache_stats() -> Dict[str, int]:
+    """Get hit/miss counts and the current size of the RPG data read cache."""
+    hits, misses = _rpg_read_cache_stats
+    return {"hits": hits, "misses": misses, "size": len(_rpg_read_cache)}
+
+def get_user_rpg_data(user_id: str) -> Optional[Dict[str, Any]]:
+    """Get user's RPG data, including writes that are not flushed yet."""
+    try:
+        pending = _unwritten_rpg_data(user_id)
+        if pending is not None:
+            # Round-trip so callers can't mutate nested data of the queued write
+            return json.loads(db.dumps(pending))
+
+        raw = _read_user_rpg_raw(user_id)
+        return None if raw is None else _counted_inventory(json.loads(raw))
     except Exception as e:
         logger.error(f"Error getting user RPG data for {user_id}: {e}")
         return None
 
-def update_user_rpg_data(user_id: str, data: Dict[str, Any]) -> bool:
-    """Update user's RPG data in database."""
+def load_or_none(user_id: str) -> Optional[Dict[str, Any]]:
+    """Load user's RPG data with a single database read, or None if they have no profile."""
+    return get_user_rpg_data(user_id)
+
+def _write_user_rpg_data_now(user_id: str, data: Dict[str, Any]) -> bool:
+    """Write user's RPG data to the database immediately."""
     try:
         key = f"user_rpg_{user_id}"
+        _forget_user_rpg_read(user_id)
         db[key] = data
+        _note_leaderboard_writes({user_id: data})
         return True
     except Exception as e:
         logger.error(f"Error updating user RPG data for {user_id}: {e}")
         return False
 
+def _write_user_rpg_batch_now(updates: Dict[str, Dict[str, Any]]) -> bool:
+    """Write several users' RPG data to the database in one request."""
+    try:
+        for user_id in updates:
+            _forget_user_rpg_read(user_id)
+        db.set_bulk({f"user_rpg_{user_id}": data for user_id, data in updates.items()})
+        _note_leaderboard_writes(updates)
+        return True
+    except Exception as e:
+        logger.error(f"Error batch updating RPG data for {list(updates)}: {e}")
+        return False
+
+def _store_user_rpg_batch_raw(values: Dict[str, str]) -> bool:
+    """Write already-encoded RPG data in one request; touches no shared state, so safe in a thread."""
+    try:
+        db.set_bulk_raw(values)
+        return True
+    except Exception as e:
+        logger.error(f"Error batch updating RPG data for {list(values)}: {e}")
+        return False
+
+def update_user_rpg_data(user_id: str, data: Dict[str, Any]) -> bool:
+    """Update user's RPG data; coalesced into the next flush when the flusher runs."""
+    if _rpg_flush_task is None or _rpg_flush_task.done():
+        return _write_user_rpg_data_now(user_id, data)
+
+    _pending_rpg_writes[user_id] = data
+    return True
+
+def update_user_rpg_data_batch(updates: Dict[str, Dict[str, Any]]) -> bool:
+    """Update several users' RPG data together, e.g. both sides of a PvP battle."""
+    if _rpg_flush_task is None or _rpg_flush_task.done():
+        return _write_user_rpg_batch_now(updates)
+
+    _pending_rpg_writes.update(updates)
+    return True
+
+def flush_rpg_writes():
+    """Write every pending RPG data update to the database now."""
+    batch = _pending_rpg_writes.copy()
+    _pending_rpg_writes.clear()
+
+    if not _write_user_rpg_batch_now(batch):
+        # Keep them for the next flush unless newer updates replaced them
+        for user_id, data in batch.items():
+            _pending_rpg_writes.setdefault(user_id, data)
+
+async def _flush_rpg_writes_in_thread() -> bool:
+    """Write up to RPG_WRITE_BATCH_SIZE pending RPG data updates from a worker thread, off the event loop."""
+    # Oldest updates first, so a long backlog can't starve anyone
+    batch = dict(islice(_pending_rpg_writes.items(), RPG_WRITE_BATCH_SIZE))
+    for user_id in batch:
+        del _pending_rpg_writes[user_id]
+
+    # Encode here: commands may mutate nested data while the thread sends it
+    try:
+        values = {f"user_rpg_{user_id}": db.dumps(data) for user_id, data in batch.items()}
+    except Exception as e:
+        logger.error(f"Error encoding RPG data for {list(batch)}: {e}")
+        for user_id, data in batch.items():
+            _pending_rpg_writes.setdefault(user_id, data)
+        return False
+
+    # Readers keep seeing the batch until the database has it
+    _inflight_rpg_writes.update(batch)
+    try:
+        written = await asyncio.to_thread(_store_user_rpg_batch_raw, values)
+    except asyncio.CancelledError:
+        # The thread may not finish, so leave the batch for the shutdown flush unless newer updates replaced it
+        for user_id, data in batch.items():
+            _pending_rpg_writes.setdefault(user_id, data)
+        raise
+    finally:
+        for user_id, data in batch.items():
+            _forget_user_rpg_read(user_id)
+            if _inflight_rpg_writes.get(user_id) is data:
+                del _inflight_rpg_writes[user_id]
+
+    if written:
+        _note_leaderboard_writes(batch)
+    else:
+        # Keep them for the next flush unless newer updates replaced them
+        for user_id, data in batch.items():
+            _pending_rpg_writes.setdefault(user_id, data)
+    return written
+
+def _add_to_total_users(count: int) -> bool:
+    """Add to global_settings' total_users with one read and one write; touches no shared state, so safe in a thread."""
+    try:
+        try:
+            global_settings = json.loads(db.get_raw("global_settings"))
+        except KeyError:
+            global_settings = {}
+        global_settings["total_users"] = global_settings.get("total_users", 0) + count
+        db["global_settings"] = global_settings
+        return True
+    except Exception as e:
+        logger.error(f"Error updating total user count: {e}")
+        return False
+
+def _flush_new_user_count():
+    """Write the profiles created since the last flush to total_users now."""
+    count = _unflushed_new_users[0]
+    if count:
+        _unflushed_new_users[0] = 0
+        if not _add_to_total_users(count):
+            _unflushed_new_users[0] += count
+
+async def _rpg_flush_loop():
+    """Flush coalesced RPG data writes every RPG_WRITE_FLUSH_INTERVAL."""
+    while True:
+        await asyncio.sleep(RPG_WRITE_FLUSH_INTERVAL)
+        # Drain the backlog batch by batch; a failed batch waits for the next tick
+        while _pending_rpg_writes and await _flush_rpg_writes_in_thread():
+            pass
+
+        count = _unflushed_new_users[0]
+        if count:
+            _unflushed_new_users[0] = 0
+            if not await asyncio.to_thread(_add_to_total_users, count):
+                _unflushed_new_users[0] += count
+
+def start_rpg_write_flusher():
+    """Start coalescing RPG data writes, if not already running."""
+    global _rpg_flush_task
+
+    if _rpg_flush_task is None or _rpg_flush_task.done():
+        _rpg_flush_task = asyncio.get_running_loop().create_task(_rpg_flush_loop())
+
+def stop_rpg_write_flusher():
+    """Stop coalescing RPG data writes and write out what is pending."""
+    global _rpg_flush_task
+
+    if _rpg_flush_task is not None:
+        _rpg_flush_task.cancel()
+        _rpg_flush_task = None
+    flush_rpg_writes()
+    _flush_new_user_count()
+
+def apply_rpg_delta(user_id: str, delta: Union[Dict[str, int], Callable[[Dict[str, Any]], Dict[str, int]]]) -> Optional[Tuple[Dict[str, Any], Dict[str, int]]]:
+    """Add numeric deltas to a user's RPG data with one read and one write.
+    
+    ``delta`` maps field names to increments, or is a callable that receives
+    the current data and returns that mapping. Returns ``(data, delta)`` with
+    the updated data and the applied increments, or None if the user has no
+    profile or the update failed.
+    """
+    try:
+        data = load_or_none(user_id)
+        if data is None:
+            return None
+            
+        if callable(delta):
+            delta = delta(data)
+        for field, amount in delta.items():
+            # New profiles are seeded with every counter, so += is the common path;
+            # only rows created before a field existed need the fallback
+            try:
+                data[field] += amount
+            except KeyError:
+                data[field] = amount
+            
+        if not update_user_rpg_data(user_id, data):
+            return None
+        return data, delta
+    except Exception as e:
+        logger.error(f"Error applying RPG delta for {user_id}: {e}")
+        return None
+
+def transfer_coins(sender_id: str, receiver_id: str, amount: int) -> Tuple[bool, Optional[int]]:
+    """Move coins between two users with one read each and one batched write.
+    
+    Returns ``(True, sender_balance)`` once the transfer is made,
+    ``(False, sender_balance)`` if the sender can't afford it, and
+    ``(False, None)`` if either profile is missing or the write failed.
+    """
+    try:
+        if sender_id == receiver_id:
+            return False, None
+
+        sender_data = load_or_none(sender_id)
+        receiver_data = load_or_none(receiver_id)
+        if sender_data is None or receiver_data is None:
+            return False, None
+
+        sender_coins = sender_data.get('coins', 0)
+        if sender_coins < amount:
+            return False, sender_coins
+
+        sender_data['coins'] = sender_coins - amount
+        receiver_data['coins'] = receiver_data.get('coins', 0) + amount
+
+        # Debit and credit land in the same request, or neither does
+        if not update_user_rpg_data_batch({sender_id: sender_data, receiver_id: receiver_data}):
+            return False, None
+        return True, sender_data['coins']
+    except Exception as e:
+        logger.error(f"Error transferring {amount} coins from {sender_id} to {receiver_id}: {e}")
+        return False, None
+
+class _SessionRPGData(dict):
+    """RPG data that remembers whether any top-level field was assigned."""
+    __slots__ = ('dirty',)
+
+    def __init__(self, data: Dict[str, Any]):
+        super().__init__(data)
+        self.dirty = False
+
+    def __setitem__(self, key: str, value: Any):
+        self.dirty = True
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str):
+        self.dirty = True
+        super().__delitem__(key)
+
+    def update(self, *args, **kwargs):
+        self.dirty = True
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        # Callers use this to reach nested data they are about to change
+        self.dirty = True
+        return super().setdefault(key, default)
+
+@contextmanager
+def rpg_session(user_id: str) -> Iterator[Optional[Dict[str, Any]]]:
+    """Read user's RPG data once and write it back once, only if a field was assigned.
+    
+    Yields None if the user has no profile. Nested containers such as
+    ``stats`` must be assigned back to their key, or reached through
+    setdefault (as bump_stat does), to count as a change; an exception
+    inside the block discards the changes.
+    """
+    data = load_or_none(user_id)
+    if data is None:
+        yield None
+        return
+
+    # load_or_none hands back a deep copy, so in-place edits never reach a queued write
+    session = _SessionRPGData(data)
+    yield session
+    if session.dirty:
+        update_user_rpg_data(user_id, dict(session))
+
 def ensure_user_exists(user_id: str) -> bool:
     """Ensure user exists in database, create if not."""
     try:
-        key = f"user_rpg_{user_id}"
-        if key not in db:
+        if _unwritten_rpg_data(user_id) is None and _read_user_rpg_raw(user_id) is None:
             return create_user_profile(user_id)
         return True
     except Exception as e:
@@ -68,7 +494,7 @@ def create_user_profile(user_id: str) -> bool:
             "attack": 10,
             "defense": 5,
             "coins": 100,
-            "inventory": [],
+            "inventory": {},
             "equipped": {
                 "weapon": None,
                 "armor": None,
@@ -87,16 +513,18 @@ def create_user_profile(user_id: str) -> bool:
             "last_work": None,
             "last_adventure": None,
             "luck_points": 0,
-            "created_at": str(db.get("timestamp", ""))
+            "created_at": datetime.now().isoformat()
         }
         
         key = f"user_rpg_{user_id}"
+        _forget_user_rpg_read(user_id)
         db[key] = default_profile
+        _note_leaderboard_writes({user_id: default_profile})
         
-        # Update global user count
-        global_settings = db.get("global_settings", {})
-        global_settings["total_users"] = global_settings.get("total_users", 0) + 1
-        db["global_settings"] = global_settings
+        # Update global user count; the flusher adds a burst of sign-ups in one write
+        _unflushed_new_users[0] += 1
+        if _rpg_flush_task is None or _rpg_flush_task.done():
+            _flush_new_user_count()
         
         logger.info(f"Created new user profile for {user_id}")
         return True
@@ -104,35 +532,101 @@ def create_user_profile(user_id: str) -> bool:
         logger.error(f"Error creating user profile for {user_id}: {e}")
         return False
 
-def get_leaderboard(category: str, guild_id: int, limit: int = 10) -> List[Dict[str, Any]]:
+# How long one scan of every profile is shared between leaderboard requests (in seconds);
+# every write through this module is folded into the snapshot, so the rescan is only a safety net
+LEADERBOARD_SNAPSHOT_TTL = 600
+
+# Last profile scan: (monotonic scan time, user_id -> RPG data)
+_leaderboard_snapshot: Optional[Tuple[float, Dict[str, Dict[str, Any]]]] = None
+
+# Concurrent profile reads during a leaderboard scan; stays under requests' default pool of 10
+LEADERBOARD_FETCH_WORKERS = 8
+
+# Rescan in progress, shared by concurrent leaderboard requests
+_leaderboard_scan: Optional[asyncio.Task] = None
+
+# Profiles written while a rescan runs; laid over its result so the rescan can't lose them
+_leaderboard_scan_writes: Optional[Dict[str, Dict[str, Any]]] = None
+
+def _note_leaderboard_writes(updates: Dict[str, Dict[str, Any]]):
+    """Keep the leaderboard snapshot current with RPG data the database now has."""
+    if _leaderboard_snapshot is not None:
+        _leaderboard_snapshot[1].update(updates)
+    if _leaderboard_scan_writes is not None:
+        _leaderboard_scan_writes.update(updates)
+
+def _fetch_leaderboard_profile(key: str) -> Optional[Dict[str, Any]]:
+    """Read one stored profile for a leaderboard scan; touches no shared state, so safe in a thread."""
+    try:
+        return json.loads(db.get_raw(key))
+    except Exception as e:
+        logger.warning(f"Error processing user data for leaderboard: {e}")
+        return None
+
+def _scan_leaderboard_profiles() -> Dict[str, Dict[str, Any]]:
+    """Read every user's stored RPG data; touches no shared state, so safe in a thread."""
+    # One request per profile, so overlap them instead of paying each round trip in turn
+    with ThreadPoolExecutor(max_workers=LEADERBOARD_FETCH_WORKERS) as pool:
+        fetched = pool.map(_fetch_leaderboard_profile, db.prefix("user_rpg_"))
+
+    profiles = {}
+    for user_data in fetched:
+        if user_data is not None:
+            user_id = user_data.get("user_id")
+            if user_id:
+                profiles[user_id] = user_data
+    return profiles
+
+async def _rescan_leaderboard_profiles() -> Dict[str, Dict[str, Any]]:
+    """Rebuild the leaderboard snapshot from a worker thread, off the event loop."""
+    global _leaderboard_snapshot, _leaderboard_scan_writes
+
+    started = time.monotonic()
+    _leaderboard_scan_writes = {}
+    try:
+        profiles = await asyncio.to_thread(_scan_leaderboard_profiles)
+        # Writes that landed during the scan may be newer than what it read
+        profiles.update(_leaderboard_scan_writes)
+    finally:
+        _leaderboard_scan_writes = None
+
+    _leaderboard_snapshot = (started, profiles)
+    return profiles
+
+async def _get_leaderboard_profiles() -> Dict[str, Dict[str, Any]]:
+    """Get every user's RPG data, rescanning the database at most once per LEADERBOARD_SNAPSHOT_TTL."""
+    global _leaderboard_scan
+
+    if _leaderboard_snapshot is not None and time.monotonic() - _leaderboard_snapshot[0] < LEADERBOARD_SNAPSHOT_TTL:
+        return _leaderboard_snapshot[1]
+
+    if _leaderboard_scan is None or _leaderboard_scan.done():
+        _leaderboard_scan = asyncio.get_running_loop().create_task(_rescan_leaderboard_profiles())
+    # Shielded so one cancelled request doesn't abort the scan others are waiting on
+    return await asyncio.shield(_leaderboard_scan)
+
+async def warm_leaderboard_snapshot():
+    """Build the leaderboard snapshot ahead of the first leaderboard request."""
+    try:
+        await _get_leaderboard_profiles()
+    except Exception as e:
+        logger.error(f"Error warming leaderboard snapshot: {e}")
+
+async def get_leaderboard(category: str, guild_id: int, limit: int = 10) -> List[Dict[str, Any]]:
     """Get leaderboard data for a specific category."""
     try:
-        users = []
-        
-        # Get all user keys
-        user_keys = [key for key in db.keys() if key.startswith("user_rpg_")]
-        
-        for key in user_keys:
-            try:
-                user_data = dict(db[key])
-                user_id = user_data.get("user_id")
-                
-                if not user_id:
-                    continue
-                    
-                value = user_data.get(category, 0)
-                users.append({
-                    "user_id": user_id,
-                    "value": value
-                })
-            except Exception as e:
-                logger.warning(f"Error processing user data for leaderboard: {e}")
-                continue
-        
-        # Sort by value (descending)
-        users.sort(key=lambda x: x["value"], reverse=True)
+        profiles = await _get_leaderboard_profiles()
+        if _pending_rpg_writes or _inflight_rpg_writes:
+            # Unwritten updates are newer than the snapshot
+            profiles = {**profiles, **_inflight_rpg_writes, **_pending_rpg_writes}
+
+        users = [
+            {"user_id": user_id, "value": user_data.get(category, 0)}
+            for user_id, user_data in profiles.items()
+        ]
         
-        return users[:limit]
+        # Highest values first
+        return heapq.nlargest(limit, users, key=lambda x: x["value"])
     except Exception as e:
         logger.error(f"Error getting leaderboard for {category}: {e}")
         return []
@@ -196,7 +690,7 @@ def add_user_warning(user_id: int, guild_id: int, reason: str, moderator_id: int
         warning = {
             "reason": reason,
             "moderator_id": moderator_id,
-            "timestamp": str(db.get("timestamp", ""))
+            "timestamp": datetime.now().isoformat()
         }
         
         warnings.append(warning)
@@ -1,7 +1,8 @@
 import discord
 import random
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import logging
 
 from config import COLORS, EMOJIS
@@ -14,92 +15,110 @@ def create_embed(title: str, description: str, color: int = COLORS['primary']) -
         title=title,
         description=description,
         color=color,
-        timestamp=datetime.now()
+        # Aware UTC time; discord.py would otherwise convert a naive local time with astimezone()
+        timestamp=datetime.now(timezone.utc)
     )
     return embed
 
 def format_number(num: int) -> str:
     """Format large numbers with commas."""
+    # Below four digits there is nothing to group; most rewards land here
+    if -1000 < num < 1000:
+        return str(num)
     return f"{num:,}"
 
+# Bars only depend on their arguments, and profiles keep asking for the same ones
+@lru_cache(maxsize=1024)
 def create_progress_bar(percentage: float, length: int = 10) -> str:
     """Create a visual progress bar."""
     filled = int(percentage / 100 * length)
     empty = length - filled
     return f"{'█' * filled}{'░' * empty} {percentage:.1f}%"
 
+# Work jobs and their reward ranges
+_WORK_JOBS = (
+    {
+        "name": "Delivery Driver",
+        "min_coins": 50,
+        "max_coins": 100,
+        "min_xp": 10,
+        "max_xp": 25
+    },
+    {
+        "name": "Data Entry",
+        "min_coins": 30,
+        "max_coins": 80,
+        "min_xp": 5,
+        "max_xp": 20
+    },
+    {
+        "name": "Freelance Writer",
+        "min_coins": 70,
+        "max_coins": 150,
+        "min_xp": 15,
+        "max_xp": 35
+    },
+    {
+        "name": "Pet Sitter",
+        "min_coins": 40,
+        "max_coins": 90,
+        "min_xp": 8,
+        "max_xp": 22
+    },
+    {
+        "name": "Tutor",
+        "min_coins": 80,
+        "max_coins": 160,
+        "min_xp": 20,
+        "max_xp": 40
+    }
+)
+
+# Precompute each job's inclusive reward span once, so a draw is min + int(random() * span)
+for _job in _WORK_JOBS:
+    _job['_coins_span'] = _job['max_coins'] - _job['min_coins'] + 1
+    _job['_xp_span'] = _job['max_xp'] - _job['min_xp'] + 1
+del _job
+
+# Bound once so the per-call draw skips the module attribute lookup
+_choice = random.choice
+_random = random.random
+
 def get_random_work_job() -> Dict[str, Any]:
     """Get a random work job with rewards."""
-    jobs = [
-        {
-            "name": "Delivery Driver",
-            "min_coins": 50,
-            "max_coins": 100,
-            "min_xp": 10,
-            "max_xp": 25
-        },
-        {
-            "name": "Data Entry",
-            "min_coins": 30,
-            "max_coins": 80,
-            "min_xp": 5,
-            "max_xp": 20
-        },
-        {
-            "name": "Freelance Writer",
-            "min_coins": 70,
-            "max_coins": 150,
-            "min_xp": 15,
-            "max_xp": 35
-        },
-        {
-            "name": "Pet Sitter",
-            "min_coins": 40,
-            "max_coins": 90,
-            "min_xp": 8,
-            "max_xp": 22
-        },
-        {
-            "name": "Tutor",
-            "min_coins": 80,
-            "max_coins": 160,
-            "min_xp": 20,
-            "max_xp": 40
-        }
-    ]
-    
-    return random.choice(jobs)
+    return _choice(_WORK_JOBS)
+
+# Possible adventure outcomes, built once
+_ADVENTURE_OUTCOMES = (
+    {
+        "description": "You discovered a hidden treasure chest!",
+        "coins": (100, 300),
+        "xp": (50, 100),
+        "items": ["Health Potion", "Mana Potion", "Ancient Coin"]
+    },
+    {
+        "description": "You helped a lost traveler and received a reward!",
+        "coins": (80, 200),
+        "xp": (30, 70),
+        "items": ["Traveler's Map", "Lucky Charm", "Bread"]
+    },
+    {
+        "description": "You found rare materials while exploring!",
+        "coins": (60, 150),
+        "xp": (40, 80),
+        "items": ["Iron Ore", "Mystic Crystal", "Healing Herbs"]
+    },
+    {
+        "description": "You completed a mysterious quest!",
+        "coins": (120, 250),
+        "xp": (60, 120),
+        "items": ["Quest Scroll", "Magic Ring", "Gold Coin"]
+    }
+)
 
 def get_random_adventure_outcome() -> Dict[str, Any]:
     """Get a random adventure outcome."""
-    outcomes = [
-        {
-            "description": "You discovered a hidden treasure chest!",
-            "coins": (100, 300),
-            "xp": (50, 100),
-            "items": ["Health Potion", "Mana Potion", "Ancient Coin"]
-        },
-        {
-            "description": "You helped a lost traveler and received a reward!",
-            "coins": (80, 200),
-            "xp": (30, 70),
-            "items": ["Traveler's Map", "Lucky Charm", "Bread"]
-        },
-        {
-            "description": "You found rare materials while exploring!",
-            "coins": (60, 150),
-            "xp": (40, 80),
-            "items": ["Iron Ore", "Mystic Crystal", "Healing Herbs"]
-        },
-        {
-            "description": "You completed a mysterious quest!",
-            "coins": (120, 250),
-            "xp": (60, 120),
-            "items": ["Quest Scroll", "Magic Ring", "Gold Coin"]
-        }
-    ]
-    
-    return random.choice(outcomes)
+    return _choice(_ADVENTURE_OUTCOMES)
 
 def level_up_player(player_data: Dict[str, Any]) -> Optional[str]:
     """Check if player levels up and apply bonuses."""
@@ -120,18 +139,20 @@ def level_up_player(player_data: Dict[str, Any]) -> Optional[str]:
         defense_bonus = random.randint(2, 5)
         coin_bonus = new_level * 50
         
-        player_data['level'] = new_level
-        player_data['xp'] = current_xp - max_xp  # Carry over excess XP
-        player_data['max_xp'] = new_max_xp
-        player_data['max_hp'] = player_data.get('max_hp', 100) + hp_bonus
-        player_data['hp'] = player_data['max_hp']  # Full heal on level up
-        player_data['attack'] = player_data.get('attack', 10) + attack_bonus
-        player_data['defense'] = player_data.get('defense', 5) + defense_bonus
-        player_data['coins'] = player_data.get('coins', 0) + coin_bonus
+        get = player_data.get
+        new_max_hp = get('max_hp', 100) + hp_bonus
+        player_data.update(
+            level=new_level,
+            xp=current_xp - max_xp,  # Carry over excess XP
+            max_xp=new_max_xp,
+            max_hp=new_max_hp,
+            hp=new_max_hp,  # Full heal on level up
+            attack=get('attack', 10) + attack_bonus,
+            defense=get('defense', 5) + defense_bonus,
+            coins=get('coins', 0) + coin_bonus
+        )
         
-        return (f"Level {new_level}! "
-                f"HP +{hp_bonus}, ATK +{attack_bonus}, DEF +{defense_bonus}, "
-                f"Coins +{coin_bonus}")
+        return f"Level {new_level}! HP +{hp_bonus}, ATK +{attack_bonus}, DEF +{defense_bonus}, Coins +{coin_bonus}"
     
     return None
 
@@ -144,17 +165,17 @@ def calculate_battle_damage(attacker_stats: Dict[str, Any], defender_stats: Dict
     base_damage = max(1, attack - defense)
     
     # Add some randomness (80% - 120% of base damage)
-    damage_multiplier = random.uniform(0.8, 1.2)
-    final_damage = int(base_damage * damage_multiplier)
+    final_damage = int(base_damage * (0.8 + 0.4 * _random()))
     
-    return max(1, final_damage)
+    return final_damage if final_damage > 1 else 1
 
 def generate_random_stats() -> Dict[str, int]:
     """Generate random stats for monsters/items."""
+    # min + int(random() * span) is randint(min, max) without its argument checks
     return {
-        'hp': random.randint(50, 150),
-        'attack': random.randint(8, 20),
-        'defense': random.randint(3, 12)
+        'hp': 50 + int(_random() * 101),
+        'attack': 8 + int(_random() * 13),
+        'defense': 3 + int(_random() * 10)
     }
 
 def format_time_remaining(seconds: int) -> str:
@@ -162,9 +183,8 @@ def format_time_remaining(seconds: int) -> str:
     if seconds <= 0:
         return "Ready now!"
     
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    seconds = seconds % 60
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
     
     if hours > 0:
         return f"{hours}h {minutes}m {seconds}s"
@@ -173,6 +193,15 @@ def format_time_remaining(seconds: int) -> str:
     else:
         return f"{seconds}s"
 
+def parse_last_daily(value: Optional[str]) -> Optional[datetime]:
+    """Parse the stored last_daily ISO timestamp, ignoring missing or bad values."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
 def get_time_until_next_use(last_use: Optional[datetime], cooldown_seconds: int) -> int:
     """Get seconds until next use of a cooldown-based command."""
     if not last_use:
@@ -186,29 +215,31 @@ def get_time_until_next_use(last_use: Optional[datetime], cooldown_seconds: int)
     
     return int((next_use - now).total_seconds())
 
+# Helper rarity styles, keyed by lowercase rarity name
+_RARITY_COLORS = {
+    'common': 0x95A5A6,      # Gray
+    'uncommon': 0x2ECC71,    # Green
+    'rare': 0x3498DB,        # Blue
+    'epic': 0x9B59B6,        # Purple
+    'legendary': 0xF39C12,   # Orange
+    'mythical': 0xE74C3C     # Red
+}
+_RARITY_EMOJIS = {
+    'common': '⚪',
+    'uncommon': '🟢',
+    'rare': '🔵',
+    'epic': '🟣',
+    'legendary': '🟠',
+    'mythical': '🔴'
+}
+
 def get_rarity_color(rarity: str) -> int:
     """Get color for item rarity."""
-    rarity_colors = {
-        'common': 0x95A5A6,      # Gray
-        'uncommon': 0x2ECC71,    # Green
-        'rare': 0x3498DB,        # Blue
-        'epic': 0x9B59B6,        # Purple
-        'legendary': 0xF39C12,   # Orange
-        'mythical': 0xE74C3C     # Red
-    }
-    return rarity_colors.get(rarity.lower(), 0x95A5A6)
+    return _RARITY_COLORS.get(rarity.lower(), 0x95A5A6)
 
 def get_rarity_emoji(rarity: str) -> str:
     """Get emoji for item rarity."""
-    rarity_emojis = {
-        'common': '⚪',
-        'uncommon': '🟢',
-        'rare': '🔵',
-        'epic': '🟣',
-        'legendary': '🟠',
-        'mythical': '🔴'
-    }
-    return rarity_emojis.get(rarity.lower(), '⚪')
+    return _RARITY_EMOJIS.get(rarity.lower(), '⚪')
 
 def truncate_text(text: str, max_length: int = 1000) -> str:
     """Truncate text to fit within Discord limits."""
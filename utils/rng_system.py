@@ -35,17 +35,17 @@ def add_luck_points(user_id: str, points: int) -> bool:
         logger.error(f"Error adding luck points for {user_id}: {e}")
         return False
 
+def _luck_level_for(luck_points: int) -> str:
+    """Get the LUCK_LEVELS key whose range holds luck_points, or 'normal' if none does."""
+    for level, data in LUCK_LEVELS.items():
+        if data['min'] <= luck_points <= data['max']:
+            return level
+    return 'normal'
+
 def get_luck_status(user_id: str) -> Dict[str, Any]:
     """Get user's luck status with level and bonus."""
     luck_points = get_user_luck_points(user_id)
-    
-    # Determine luck level
-    luck_level = 'normal'
-    for level, data in LUCK_LEVELS.items():
-        if data['min'] <= luck_points <= data['max']:
-            luck_level = level
-            break
-    
+    luck_level = _luck_level_for(luck_points)
     luck_data = LUCK_LEVELS[luck_level]
     
     return {
@@ -55,6 +55,23 @@ def get_luck_status(user_id: str) -> Dict[str, Any]:
         'bonus_percent': luck_data['bonus_percent']
     }
 
+def get_luck_multiplier(user_id: str, player_data: Optional[Dict[str, Any]] = None) -> float:
+    """Get the chance multiplier from a user's luck level (read only).
+
+    Pass already-loaded player_data to skip the extra lookup.
+    """
+    try:
+        if player_data is None:
+            luck_points = get_user_luck_points(user_id)
+        else:
+            luck_points = player_data.get('luck_points', 0)
+
+        bonus_percent = LUCK_LEVELS[_luck_level_for(luck_points)]['bonus_percent']
+        return 1 + bonus_percent / 100
+    except Exception as e:
+        logger.error(f"Error getting luck multiplier for {user_id}: {e}")
+        return 1.0
+
 def roll_with_luck(user_id: str, base_chance: float) -> bool:
     """Roll with luck bonus applied."""
     try:
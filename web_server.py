@@ -1,9 +1,12 @@
-from flask import Flask, jsonify
+from flask import Flask, Response, jsonify
+from werkzeug.serving import WSGIRequestHandler
 import asyncio
 import logging
 from threading import Thread
 import psutil
 import os
+import json
+import time
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -19,6 +22,67 @@ bot_status = {
     'latency': 0
 }
 
+def _encode_status():
+    """Encode the /status body from bot_status."""
+    return json.dumps({
+        'online': bot_status['is_online'],
+        'guilds': bot_status['guilds'],
+        'users': bot_status['users']
+    }).encode()
+
+# /status body, re-encoded only when bot_status changes
+_status_body = _encode_status()
+
+# How long one psutil sample is reused between /health requests (in seconds)
+HEALTH_SAMPLE_TTL = 1.0
+
+# Last system sample: (monotonic sample time, stats)
+_health_sample = None
+
+# Disk usage barely moves, so it is sampled far less often (in seconds)
+HEALTH_DISK_SAMPLE_TTL = 60
+
+# Last disk sample: (monotonic sample time, percent used)
+_disk_sample = None
+
+# cpu_percent() measures since the previous call; prime it so the first sample isn't 0.0
+psutil.cpu_percent(interval=None)
+
+def _disk_percent(now):
+    """Get disk usage, calling statvfs at most once per HEALTH_DISK_SAMPLE_TTL."""
+    global _disk_sample
+
+    sample = _disk_sample
+    if sample is not None and now - sample[0] < HEALTH_DISK_SAMPLE_TTL:
+        return sample[1]
+
+    percent = psutil.disk_usage('/').percent
+    _disk_sample = (now, percent)
+    return percent
+
+def _system_stats():
+    """Get CPU, memory and disk usage, sampling psutil at most once per HEALTH_SAMPLE_TTL."""
+    global _health_sample
+
+    now = time.monotonic()
+    sample = _health_sample
+    if sample is not None and now - sample[0] < HEALTH_SAMPLE_TTL:
+        return sample[1]
+
+    stats = {
+        'cpu_percent': psutil.cpu_percent(interval=None),
+        'memory_percent': psutil.virtual_memory().percent,
+        'disk_percent': _disk_percent(now),
+        'python_version': os.sys.version.split()[0]
+    }
+    _health_sample = (now, stats)
+    return stats
+
+def _refresh_status_body():
+    """Re-encode the /status body after bot_status changed."""
+    global _status_body
+    _status_body = _encode_status()
+
 def update_bot_status(bot=None):
     """Update bot status for web server."""
     global bot_status
@@ -30,6 +94,7 @@ def update_bot_status(bot=None):
         bot_status['latency'] = round(bot.latency * 1000, 2)
     else:
         bot_status['is_online'] = False
+    _refresh_status_body()
 
 @app.route('/')
 def home():
@@ -44,11 +109,6 @@ def home():
 def health():
     """Detailed health check."""
     try:
-        # System stats
-        cpu_percent = psutil.cpu_percent()
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        
         # Calculate uptime
         uptime = None
         if bot_status['start_time']:
@@ -63,12 +123,7 @@ def health():
                 'latency': f"{bot_status['latency']}ms",
                 'uptime': uptime
             },
-            'system': {
-                'cpu_percent': cpu_percent,
-                'memory_percent': memory.percent,
-                'disk_percent': disk.percent,
-                'python_version': os.sys.version.split()[0]
-            },
+            'system': _system_stats(),
             'timestamp': datetime.now().isoformat()
         })
     except Exception as e:
@@ -82,11 +137,7 @@ def health():
 @app.route('/status')
 def status():
     """Simple status endpoint."""
-    return jsonify({
-        'online': bot_status['is_online'],
-        'guilds': bot_status['guilds'],
-        'users': bot_status['users']
-    })
+    return Response(_status_body, mimetype='application/json')
 
 def run_flask_app():
     """Run Flask app in a separate thread."""
@@ -123,6 +174,11 @@ def set_bot_offline():
     bot_status['guilds'] = 0
     bot_status['users'] = 0
     bot_status['latency'] = 0
+    _refresh_status_body()
+
+class _KeepAliveRequestHandler(WSGIRequestHandler):
+    """Answer over HTTP/1.1 so health probes can keep one connection open."""
+    protocol_version = "HTTP/1.1"
 
 def run_web_server():
     """Run the web server - wrapper function for compatibility."""
@@ -142,7 +198,8 @@ def run_web_server():
             port=port,
             debug=False,
             threaded=True,
-            use_reloader=False
+            use_reloader=False,
+            request_handler=_KeepAliveRequestHandler
         )
         
     except Exception as e: